@@ -17,6 +17,12 @@ class Config:
     WTF_CSRF_SECRET_KEY = os.getenv('WTF_CSRF_SECRET_KEY', 'dev-csrf-key')
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
 
+    # Autenticación HTTP Basic (src/credential_cache.py)
+    AUTH_CACHE_TTL_SECONDS = float(os.getenv('AUTH_CACHE_TTL_SECONDS', 300))  # 0 = verificar el hash en cada request
+    AUTH_CACHE_MAX_ENTRIES = int(os.getenv('AUTH_CACHE_MAX_ENTRIES', 256))
+    AUTH_SESSION_ENABLED = os.getenv('AUTH_SESSION_ENABLED', 'False').lower() == 'true'  # Cookie de sesión firmada tras el primer login
+    AUTH_SESSION_MAX_AGE_SECONDS = int(os.getenv('AUTH_SESSION_MAX_AGE_SECONDS', 3600))
+
     # Server
     HOST = os.getenv('HOST', '0.0.0.0')
     PORT = int(os.getenv('PORT', 8000))
@@ -35,11 +41,47 @@ class Config:
 
     # Anthropic API (para traducción con Claude)
     ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY', '')
+    TRANSLATION_MAX_WORKERS = int(os.getenv('TRANSLATION_MAX_WORKERS', 4))  # Traducciones en paralelo (1 = secuencial)
+    TRANSLATION_CACHE_ENABLED = os.getenv('TRANSLATION_CACHE_ENABLED', 'True').lower() == 'true'  # Cache de traducciones por contenido
+    TRANSLATION_CACHE_TTL_DAYS = int(os.getenv('TRANSLATION_CACHE_TTL_DAYS', 30))  # 0 = sin vencimiento
+    TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv('TRANSLATION_CACHE_MAX_ENTRIES', 10000))  # 0 = sin límite
+
+    # Cola de jobs de procesamiento (src/job_queue.py + src/worker.py)
+    JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', 3))  # Intentos antes de dead-letter
+    JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', 300))  # Lease renovado con heartbeats
+    JOB_RETRY_BASE_SECONDS = int(os.getenv('JOB_RETRY_BASE_SECONDS', 30))  # Backoff exponencial entre reintentos
+    WORKER_POLL_INTERVAL = float(os.getenv('WORKER_POLL_INTERVAL', 2))  # Segundos entre consultas con la cola vacía
+
+    # Lease de POST /api/news/claim (src/publication_lease.py)
+    PUBLICATION_LEASE_SECONDS = int(os.getenv('PUBLICATION_LEASE_SECONDS', 1800))  # Máximo; cada mark-published lo renueva
+
+    # Long-poll /api/news/wait-for-work (despierta a SocialPublisher)
+    LONGPOLL_MAX_TIMEOUT_SECONDS = float(os.getenv('LONGPOLL_MAX_TIMEOUT_SECONDS', 30))  # Menor que el timeout del servidor WSGI
+    LONGPOLL_CHECK_INTERVAL_SECONDS = float(os.getenv('LONGPOLL_CHECK_INTERVAL_SECONDS', 2))  # Re-consulta a la BD mientras espera
+    # Publicar automáticamente (en todas las plataformas del publisher) lo que se termina de
+    # procesar sin selección del usuario; por defecto solo se publica lo elegido en /apublicar
+    AUTO_PUBLISH_PROCESSED = os.getenv('AUTO_PUBLISH_PROCESSED', 'False').lower() == 'true'
+
+    # Paginación por cursor de /apublicar y /api/apublicar
+    PAGE_SIZE_DEFAULT = int(os.getenv('PAGE_SIZE_DEFAULT', 50))
+    PAGE_SIZE_MAX = int(os.getenv('PAGE_SIZE_MAX', 200))
 
     # Scraping Configuration
     NEWS_SOURCES = os.getenv('NEWS_SOURCES', 'techcrunch,wired,the-verge').split(',')
     MAX_NEWS_COUNT = int(os.getenv('MAX_NEWS_COUNT', 100))  # Aumentado de 30 a 100 para más variedad
+    MAX_NEWS_AGE_DAYS = int(os.getenv('MAX_NEWS_AGE_DAYS', 0))  # 0 = sin límite por antigüedad
+    NEWS_ARCHIVE_ENABLED = os.getenv('NEWS_ARCHIVE_ENABLED', 'False').lower() == 'true'  # Mover podadas a noticias_archivo
     SCRAPE_INTERVAL_HOURS = int(os.getenv('SCRAPE_INTERVAL_HOURS', 24))
+    SCRAPE_ON_START = os.getenv('SCRAPE_ON_START', 'True').lower() == 'true'  # Scraping inicial al arrancar src/scheduler.py
+
+    # Descarga de feeds RSS técnicos (en paralelo)
+    FEED_MAX_WORKERS = int(os.getenv('FEED_MAX_WORKERS', 8))  # 1 = modo secuencial
+    FEED_PER_HOST_LIMIT = int(os.getenv('FEED_PER_HOST_LIMIT', 2))
+    FEED_TIMEOUT_SECONDS = float(os.getenv('FEED_TIMEOUT_SECONDS', 15))
+    FEED_TOTAL_DEADLINE_SECONDS = float(os.getenv('FEED_TOTAL_DEADLINE_SECONDS', 60))
+
+    # Taxonomía de temas (src/topic_tagger.py)
+    TOPICS_FILE = os.getenv('TOPICS_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'topics.json'))
 
     # News Keywords
     NEWS_KEYWORDS = os.getenv(
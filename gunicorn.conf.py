@@ -0,0 +1,42 @@
+"""
+Configuración de gunicorn para la app web (src/wsgi.py)
+
+    gunicorn -c gunicorn.conf.py src.wsgi:app
+
+Workers gthread: cada proceso atiende WEB_THREADS requests a la vez, así un
+long-poll de /api/news/wait-for-work no bloquea al resto del worker
+"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+
+workers = int(os.getenv('WEB_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('WEB_THREADS', 4))
+
+# Mayor que LONGPOLL_MAX_TIMEOUT_SECONDS y que un /scrape/manual
+timeout = int(os.getenv('WEB_TIMEOUT_SECONDS', 120))
+graceful_timeout = 30
+keepalive = 5
+
+# Reciclar workers de a poco para acotar el crecimiento de memoria
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+
+# init_db (create_all + usuario admin) corre una sola vez en el master,
+# no en paralelo en cada worker
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'INFO').lower()
+
+
+def post_fork(server, worker):
+    """Cada worker abre sus propias conexiones: no reutilizar el pool heredado del master"""
+    from src.app import app
+    from src.models import db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -0,0 +1,21 @@
+-- Migration: Create feed_states table for conditional GET of RSS feeds
+-- Date: 2026-10-18
+-- Description: Store ETag / Last-Modified / content hash per technical RSS source
+--              so unchanged feeds are answered with 304 and skipped
+-- Author: WebIAScrap Team
+
+CREATE TABLE IF NOT EXISTS feed_states (
+    source_id VARCHAR(100) PRIMARY KEY,
+    etag VARCHAR(500),
+    last_modified VARCHAR(100),
+    content_hash VARCHAR(64),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Add comments
+COMMENT ON TABLE feed_states IS 'Validadores HTTP por fuente RSS técnica (GET condicional)';
+COMMENT ON COLUMN feed_states.source_id IS 'ID de la fuente en TechnicalSourcesScraper.TECHNICAL_SOURCES';
+COMMENT ON COLUMN feed_states.content_hash IS 'SHA-256 del último cuerpo descargado';
+
+-- Verify the table was created
+-- Run after migration: SELECT * FROM feed_states;
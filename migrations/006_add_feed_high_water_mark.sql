@@ -0,0 +1,16 @@
+-- Migration: Add per-source high-water mark to feed_states
+-- Date: 2026-10-18
+-- Description: Remember the newest entry already emitted by each technical RSS
+--              source so later scrapes only return newer entries
+-- Author: WebIAScrap Team
+
+ALTER TABLE feed_states
+ADD COLUMN IF NOT EXISTS last_entry_at TIMESTAMP,
+ADD COLUMN IF NOT EXISTS last_entry_guid VARCHAR(1000);
+
+-- Add comments
+COMMENT ON COLUMN feed_states.last_entry_at IS 'Fecha de la entrada más nueva ya emitida (high-water mark)';
+COMMENT ON COLUMN feed_states.last_entry_guid IS 'guid/link de la entrada más nueva ya emitida';
+
+-- Verify the change
+-- Run after migration: \d feed_states
@@ -0,0 +1,42 @@
+-- Migration: Create noticias_archivo table for retention archive mode
+-- Date: 2026-10-18
+-- Description: Archive table filled in bulk (INSERT ... SELECT) by src/retention.py
+--              when NEWS_ARCHIVE_ENABLED=True
+-- Author: WebIAScrap Team
+
+CREATE TABLE IF NOT EXISTS noticias_archivo (
+    id SERIAL PRIMARY KEY,
+    noticia_id INTEGER NOT NULL,
+    titulo VARCHAR(500) NOT NULL,
+    texto TEXT NOT NULL,
+    url VARCHAR(1000) NOT NULL,
+    fecha_hora TIMESTAMP NOT NULL,
+    temas TEXT[],
+    created_at TIMESTAMP,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- El texto completo es lo que más ocupa: comprimirlo con LZ4 si el servidor lo
+-- soporta (PostgreSQL 14+ compilado con lz4); si no, queda el pglz por defecto
+DO $$
+BEGIN
+    IF current_setting('server_version_num')::int >= 140000 THEN
+        ALTER TABLE noticias_archivo ALTER COLUMN texto SET COMPRESSION lz4;
+    ELSE
+        RAISE NOTICE 'PostgreSQL < 14: noticias_archivo.texto usa la compresión por defecto';
+    END IF;
+EXCEPTION
+    WHEN feature_not_supported OR invalid_parameter_value THEN
+        RAISE NOTICE 'lz4 no disponible: noticias_archivo.texto usa la compresión por defecto';
+END
+$$;
+
+-- Búsquedas por URL en el archivo
+CREATE INDEX IF NOT EXISTS idx_noticias_archivo_url ON noticias_archivo(url);
+
+-- Add comments
+COMMENT ON TABLE noticias_archivo IS 'Noticias podadas por la política de retención (modo archivo)';
+COMMENT ON COLUMN noticias_archivo.noticia_id IS 'ID que tenía la fila en la tabla noticias';
+
+-- Verify the table was created
+-- Run after migration: \d+ noticias_archivo
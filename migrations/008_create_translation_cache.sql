@@ -0,0 +1,26 @@
+-- Migration: Create translation_cache table
+-- Date: 2026-10-18
+-- Description: Content-addressed cache of translate_and_optimize results
+--              (src/translation_cache.py). Key = SHA-256 of model, prompt
+--              version and normalized title+text
+-- Author: WebIAScrap Team
+
+CREATE TABLE IF NOT EXISTS translation_cache (
+    key VARCHAR(64) PRIMARY KEY,
+    model VARCHAR(100) NOT NULL,
+    result JSON NOT NULL,
+    hits INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_hit_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Desalojo por TTL (created_at) y por tamaño en orden LRU (last_hit_at)
+CREATE INDEX IF NOT EXISTS ix_translation_cache_created_at ON translation_cache(created_at);
+CREATE INDEX IF NOT EXISTS ix_translation_cache_last_hit_at ON translation_cache(last_hit_at);
+
+-- Add comments
+COMMENT ON TABLE translation_cache IS 'Traducciones cacheadas por hash de contenido';
+COMMENT ON COLUMN translation_cache.last_hit_at IS 'Último uso, para desalojo LRU';
+
+-- Verify the table was created
+-- Run after migration: \d translation_cache
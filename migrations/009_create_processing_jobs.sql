@@ -0,0 +1,40 @@
+-- Migration: Create processing_jobs table
+-- Date: 2026-10-18
+-- Description: Durable job queue for Claude processing (src/job_queue.py).
+--              Endpoints enqueue; src/worker.py claims with a lease
+--              (FOR UPDATE SKIP LOCKED), heartbeats, retries and dead-letters
+-- Author: WebIAScrap Team
+
+CREATE TABLE IF NOT EXISTS processing_jobs (
+    id SERIAL PRIMARY KEY,
+    tipo VARCHAR(50) NOT NULL,
+    payload JSON,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INTEGER DEFAULT 0,
+    max_attempts INTEGER DEFAULT 3,
+    run_after TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    locked_by VARCHAR(200),
+    lease_expires_at TIMESTAMP,
+    heartbeat_at TIMESTAMP,
+    last_error TEXT,
+    result JSON,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- El claim solo mira jobs activos: índice parcial chico aunque la tabla crezca
+CREATE INDEX IF NOT EXISTS idx_processing_jobs_claim
+    ON processing_jobs(run_after, id)
+    WHERE status IN ('pending', 'running');
+
+CREATE INDEX IF NOT EXISTS ix_processing_jobs_status ON processing_jobs(status);
+CREATE INDEX IF NOT EXISTS ix_processing_jobs_run_after ON processing_jobs(run_after);
+
+-- Add comments
+COMMENT ON TABLE processing_jobs IS 'Cola de jobs de procesamiento con Claude';
+COMMENT ON COLUMN processing_jobs.status IS 'pending, running, done, dead (dead-letter)';
+COMMENT ON COLUMN processing_jobs.lease_expires_at IS 'Si vence sin heartbeat, otro worker reclama el job';
+
+-- Verify the table was created
+-- Run after migration: \d processing_jobs
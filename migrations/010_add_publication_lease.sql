@@ -0,0 +1,23 @@
+-- Migration: Add publication lease columns to apublicar
+-- Date: 2026-10-18
+-- Description: POST /api/news/claim moves rows from fase 'procesado' to
+--              'publicando' with a lease (UPDATE ... WHERE id IN (SELECT ...
+--              FOR UPDATE SKIP LOCKED) RETURNING), so several publishers never
+--              take the same news. Expired leases are claimed again
+-- Author: WebIAScrap Team
+
+ALTER TABLE apublicar
+ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(200),
+ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP;
+
+-- El claim solo mira noticias listas o con lease: índice parcial chico
+CREATE INDEX IF NOT EXISTS idx_apublicar_claim
+    ON apublicar(fase, selected_at, id)
+    WHERE fase IN ('procesado', 'publicando');
+
+-- Add comments
+COMMENT ON COLUMN apublicar.claimed_by IS 'Publisher que reclamó la noticia para publicarla';
+COMMENT ON COLUMN apublicar.lease_expires_at IS 'Si vence sin confirmar la publicación, otro publisher la reclama';
+
+-- Verify the columns were added
+-- Run after migration: \d apublicar
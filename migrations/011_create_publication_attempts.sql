@@ -0,0 +1,62 @@
+-- Migration: Create publication_attempts table
+-- Date: 2026-10-18
+-- Description: One row per publication attempt (noticia, platform) replacing
+--              the apublicar.plataformas_publicadas JSON blob. Results become
+--              single-row INSERTs and fase is derived with one aggregate query.
+--              Backfills the existing JSON; the old column is kept (unused by
+--              the app) until the backfill is verified
+-- Author: WebIAScrap Team
+
+CREATE TABLE IF NOT EXISTS publication_attempts (
+    id SERIAL PRIMARY KEY,
+    noticia_id INTEGER NOT NULL REFERENCES apublicar(id) ON DELETE CASCADE,
+    platform VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    post_id VARCHAR(500),
+    url VARCHAR(1000),
+    attempted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    error TEXT
+);
+
+-- "Todos los posts fallidos de Bluesky" y similares
+CREATE INDEX IF NOT EXISTS ix_publication_attempts_platform_status
+    ON publication_attempts(platform, status);
+
+-- Estado por noticia (plataformas_publicadas y cálculo de fase)
+CREATE INDEX IF NOT EXISTS ix_publication_attempts_noticia_platform
+    ON publication_attempts(noticia_id, platform);
+
+-- Backfill: una fila por plataforma del JSON (idempotente)
+INSERT INTO publication_attempts (noticia_id, platform, status, post_id, url, attempted_at, error)
+SELECT
+    a.id,
+    p.key,
+    COALESCE(p.value->>'status', 'pending'),
+    p.value->>'post_id',
+    p.value->>'post_url',
+    COALESCE(
+        (p.value->>'published_at')::timestamp,
+        (p.value->>'attempted_at')::timestamp,
+        a.ultimo_intento,
+        a.selected_at,
+        CURRENT_TIMESTAMP
+    ),
+    p.value->>'error'
+FROM apublicar a
+CROSS JOIN LATERAL jsonb_each(a.plataformas_publicadas::jsonb) AS p
+WHERE a.plataformas_publicadas IS NOT NULL
+  AND jsonb_typeof(a.plataformas_publicadas::jsonb) = 'object'
+  AND jsonb_typeof(p.value) = 'object'
+  AND NOT EXISTS (
+      SELECT 1 FROM publication_attempts pa
+      WHERE pa.noticia_id = a.id AND pa.platform = p.key
+  );
+
+-- Add comments
+COMMENT ON TABLE publication_attempts IS 'Intentos de publicación por noticia y plataforma';
+COMMENT ON COLUMN publication_attempts.status IS 'pending, success, failed';
+COMMENT ON COLUMN apublicar.plataformas_publicadas IS 'DEPRECATED: migrado a publication_attempts (011)';
+
+-- Verify the backfill
+-- Run after migration:
+-- SELECT platform, status, COUNT(*) FROM publication_attempts GROUP BY platform, status;
@@ -0,0 +1,32 @@
+-- Migration: Composite and partial indexes for hot APublicar/Noticia queries
+-- Date: 2026-10-18
+-- Description: Indexes for the queries that ran as sequential scans + sort.
+--              Check plans before/after with scripts/benchmark_queries.py.
+--              On large live tables run each CREATE INDEX with CONCURRENTLY
+--              (outside a transaction) to avoid blocking writes
+-- Author: WebIAScrap Team
+
+-- Página principal (ORDER BY fecha_hora DESC LIMIT 30) y retención
+-- (top N por fecha_hora DESC, id DESC; fecha_hora < cutoff)
+CREATE INDEX IF NOT EXISTS idx_noticias_fecha_hora_id
+    ON noticias(fecha_hora DESC, id DESC);
+
+-- /api/news/to-publish y long-poll: WHERE fase = 'procesado' ORDER BY selected_at.
+-- Lo cubre idx_apublicar_claim (010): (fase, selected_at, id) WHERE fase IN ('procesado', 'publicando')
+
+-- /api/apublicar: WHERE processed_at IS NOT NULL ORDER BY processed_at DESC, id DESC
+CREATE INDEX IF NOT EXISTS idx_apublicar_processed_at_id
+    ON apublicar(processed_at DESC, id DESC)
+    WHERE processed_at IS NOT NULL;
+
+-- Traducciones fallidas (titulo_es = titulo): índice parcial que solo contiene esas filas
+CREATE INDEX IF NOT EXISTS idx_apublicar_traduccion_fallida
+    ON apublicar(id)
+    WHERE procesado = TRUE AND titulo_es = titulo;
+
+-- Actualizar estadísticas para que el planner use los índices nuevos
+ANALYZE noticias;
+ANALYZE apublicar;
+
+-- Verify the indexes were created
+-- Run after migration: \di+ idx_noticias_* / \di+ idx_apublicar_*
@@ -0,0 +1,12 @@
+-- Migration: Index for keyset pagination of /apublicar
+-- Date: 2026-10-18
+-- Description: /apublicar pages with (selected_at, id) < cursor ORDER BY
+--              selected_at DESC, id DESC (src/pagination.py). /api/apublicar
+--              uses idx_apublicar_processed_at_id from migration 012
+-- Author: WebIAScrap Team
+
+CREATE INDEX IF NOT EXISTS idx_apublicar_selected_at_id
+    ON apublicar(selected_at DESC, id DESC);
+
+-- Verify the index was created
+-- Run after migration: \di+ idx_apublicar_selected_at_id
@@ -0,0 +1,16 @@
+-- Migration: Release news stuck in fase 'publicando' without a lease
+-- Date: 2026-10-18
+-- Description: /publicar-seleccionadas used to set fase 'publicando' with
+--              claimed_by NULL, which POST /api/news/claim never takes. It now
+--              leaves the row in 'procesado' so a publisher claims it; this
+--              moves the rows already stuck back to 'procesado'
+-- Author: WebIAScrap Team
+
+UPDATE apublicar
+SET fase = 'procesado'
+WHERE fase = 'publicando'
+  AND claimed_by IS NULL
+  AND procesado = TRUE;
+
+-- Verify no row is left behind
+-- Run after migration: SELECT COUNT(*) FROM apublicar WHERE fase = 'publicando' AND claimed_by IS NULL;
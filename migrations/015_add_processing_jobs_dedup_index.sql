@@ -0,0 +1,20 @@
+-- Migration: Enforce one active job per (tipo, payload) in processing_jobs
+-- Date: 2026-10-18
+-- Description: job_queue.enqueue checked for an active job with a SELECT and
+--              then inserted, so two concurrent requests could both enqueue
+--              the same job. It now stores the canonical payload in dedup_key
+--              and inserts with ON CONFLICT DO NOTHING against a partial
+--              unique index over the active jobs
+-- Author: WebIAScrap Team
+
+ALTER TABLE processing_jobs ADD COLUMN IF NOT EXISTS dedup_key TEXT;
+
+-- Jobs already queued keep dedup_key NULL (NULLs never conflict) and drain normally
+CREATE UNIQUE INDEX IF NOT EXISTS uq_processing_jobs_active_dedup
+    ON processing_jobs(tipo, dedup_key)
+    WHERE status IN ('pending', 'running');
+
+COMMENT ON COLUMN processing_jobs.dedup_key IS 'Payload en JSON canónico; NULL = encolado sin dedup';
+
+-- Verify the index was created
+-- Run after migration: \d processing_jobs
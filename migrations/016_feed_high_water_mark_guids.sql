@@ -0,0 +1,23 @@
+-- Migration: Keep every guid seen at the feed high-water mark timestamp
+-- Date: 2026-10-18
+-- Description: feed_states kept only one guid for last_entry_at, so entries
+--              sharing the newest timestamp were emitted again on the next
+--              scrape. last_entry_guids stores all guids already emitted with
+--              that timestamp and replaces last_entry_guid
+-- Author: WebIAScrap Team
+
+ALTER TABLE feed_states ADD COLUMN IF NOT EXISTS last_entry_guids JSON;
+
+-- Conservar el guid que ya estaba registrado
+UPDATE feed_states
+SET last_entry_guids = json_build_array(last_entry_guid)
+WHERE last_entry_guid IS NOT NULL
+  AND last_entry_guids IS NULL;
+
+ALTER TABLE feed_states DROP COLUMN IF EXISTS last_entry_guid;
+
+-- Add comments
+COMMENT ON COLUMN feed_states.last_entry_guids IS 'guids/links ya emitidos con la fecha last_entry_at';
+
+-- Verify the change
+-- Run after migration: \d feed_states
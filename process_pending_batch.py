@@ -0,0 +1,71 @@
+"""
+Script para procesar el backlog de noticias pendientes con la Message Batches API
+Envía todas las pendientes como un único batch, espera a que termine y aplica
+los resultados en bloque. Si se pasa un batch ID, retoma ese batch.
+
+Uso:
+    python process_pending_batch.py [--limit N] [--batch-id msgbatch_...] [--no-wait]
+"""
+import argparse
+import logging
+import os
+from flask import Flask
+from dotenv import load_dotenv
+from src.models import init_db
+from src.social_media_processor import SocialMediaProcessor
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """
+    Función principal
+    """
+    parser = argparse.ArgumentParser(description='Traducción offline por lotes')
+    parser.add_argument('--limit', type=int, default=None, help='Máximo de noticias a enviar')
+    parser.add_argument('--batch-id', default=None, help='Retomar un batch ya enviado')
+    parser.add_argument('--no-wait', action='store_true', help='Solo enviar/consultar, sin esperar')
+    parser.add_argument('--poll-interval', type=float, default=60, help='Segundos entre consultas')
+    args = parser.parse_args()
+
+    # Cargar variables de entorno
+    load_dotenv()
+
+    # Verificar API key
+    if not os.getenv('ANTHROPIC_API_KEY'):
+        logger.error("✗ ANTHROPIC_API_KEY no configurada en .env")
+        return
+
+    # Crear app Flask para contexto de DB
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    init_db(app)
+
+    with app.app_context():
+        processor = SocialMediaProcessor()
+
+        batch_id = args.batch_id or processor.submit_pending_batch(limit=args.limit)
+        if not batch_id:
+            logger.info("✓ No hay noticias pendientes")
+            return
+
+        logger.info(f"Batch ID: {batch_id} (usar --batch-id para retomarlo)")
+
+        stats = processor.apply_batch_results(
+            batch_id,
+            wait=not args.no_wait,
+            poll_interval=args.poll_interval
+        )
+        logger.info(f"Resultado: {stats}")
+
+
+if __name__ == '__main__':
+    main()
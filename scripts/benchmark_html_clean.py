@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de la limpieza de HTML de los resúmenes de feeds
+Compara la implementación anterior (BeautifulSoup html.parser + regex + corte
+a 1000 palabras) con src/html_text.html_to_text sobre resúmenes sintéticos
+con mucho contenido (estilo Towards Data Science) o sobre un feed guardado.
+
+Uso:
+    python scripts/benchmark_html_clean.py [--docs 200] [--paragraphs 60] [--repeat 5]
+    python scripts/benchmark_html_clean.py --feed-file feed.xml
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.html_text import html_to_text  # noqa: E402
+
+MAX_WORDS = 1000
+
+WORDS = (
+    'model training data transformer attention gradient loss python pandas feature '
+    'embedding vector inference latency pipeline dataset benchmark accuracy tensor'
+).split()
+
+
+def legacy_clean(html_text: str) -> str:
+    """_clean_html + corte a 1000 palabras tal como estaban antes (BeautifulSoup)"""
+    from bs4 import BeautifulSoup
+
+    try:
+        soup = BeautifulSoup(html_text, 'html.parser')
+        text = soup.get_text(separator=' ', strip=True)
+        text = re.sub(r'\s+', ' ', text).strip()
+    except Exception:
+        text = re.sub(r'<[^>]+>', '', html_text)
+        text = re.sub(r'\s+', ' ', text).strip()
+
+    palabras = text.split()
+    if len(palabras) > MAX_WORDS:
+        text = ' '.join(palabras[:MAX_WORDS]) + '...'
+    return text
+
+
+def streaming_clean(html_text: str) -> str:
+    """Camino nuevo (una pasada, corta al llegar a 1000 palabras)"""
+    text, truncated = html_to_text(html_text, max_words=MAX_WORDS)
+    return text + '...' if truncated else text
+
+
+def synthetic_summary(rng: random.Random, paragraphs: int) -> str:
+    """Resumen HTML con párrafos, código, figuras, entidades, script y style"""
+    parts = ['<style>.post{font-family:serif}</style><div class="post">']
+    for i in range(paragraphs):
+        words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+        parts.append(f'<p>{words} &amp; <a href="https://e.com/{i}">link&nbsp;{i}</a> <em>{rng.choice(WORDS)}</em></p>')
+        if i % 5 == 0:
+            parts.append('<pre><code>import torch\nx = torch.randn(3, 4) &lt; 0</code></pre>')
+        if i % 7 == 0:
+            parts.append(f'<figure><img src="/img/{i}.png" alt="fig"><figcaption>Figure {i}</figcaption></figure>')
+    parts.append('<script>window.analytics && analytics.track("view")</script></div>')
+    return ''.join(parts)
+
+
+def load_feed_summaries(path: str) -> List[str]:
+    """Resúmenes/contenidos de un feed RSS/Atom guardado en disco"""
+    import feedparser
+
+    feed = feedparser.parse(path)
+    summaries = []
+    for entry in feed.entries:
+        if entry.get('content'):
+            summaries.append(entry.content[0].get('value', ''))
+        elif entry.get('summary'):
+            summaries.append(entry.summary)
+    return summaries
+
+
+def best_time(clean: Callable[[str], str], docs: List[str], repeat: int) -> float:
+    """Mejor tiempo total (segundos) de limpiar todos los documentos"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for doc in docs:
+            clean(doc)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    """
+    Función principal
+    """
+    parser = argparse.ArgumentParser(description='BeautifulSoup vs extractor en streaming')
+    parser.add_argument('--docs', type=int, default=200, help='Resúmenes sintéticos')
+    parser.add_argument('--paragraphs', type=int, default=60, help='Párrafos por resumen sintético')
+    parser.add_argument('--repeat', type=int, default=5, help='Repeticiones (se toma la mejor)')
+    parser.add_argument('--feed-file', help='Feed RSS/Atom guardado a usar en lugar de datos sintéticos')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if args.feed_file:
+        docs = load_feed_summaries(args.feed_file)
+        origen = args.feed_file
+    else:
+        rng = random.Random(args.seed)
+        docs = [synthetic_summary(rng, args.paragraphs) for _ in range(args.docs)]
+        origen = f'{args.docs} resúmenes sintéticos de {args.paragraphs} párrafos'
+
+    if not docs:
+        print("✗ No hay documentos para medir")
+        return 1
+
+    total_kb = sum(len(doc) for doc in docs) / 1024
+    distintos = sum(1 for doc in docs if legacy_clean(doc) != streaming_clean(doc))
+
+    legacy = best_time(legacy_clean, docs, args.repeat)
+    streaming = best_time(streaming_clean, docs, args.repeat)
+
+    print("=" * 80)
+    print(f"LIMPIEZA DE HTML: {origen} ({total_kb:,.0f} KB)")
+    print("=" * 80)
+    print(f"BeautifulSoup + regex:  {legacy * 1000:9.1f} ms  ({legacy / len(docs) * 1e6:8.0f} µs/doc)")
+    print(f"html_to_text:           {streaming * 1000:9.1f} ms  ({streaming / len(docs) * 1e6:8.0f} µs/doc)")
+    print(f"Speedup:                x{legacy / streaming:.1f}")
+    print(f"Salidas distintas:      {distintos}/{len(docs)}"
+          + (" (p.ej. contenido de <noscript>/<template>, que ahora se descarta)" if distintos else ""))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Benchmark de las consultas calientes de noticias/apublicar con EXPLAIN ANALYZE
+Siembra un schema aparte (por defecto 'benchmark', nunca 'public') con N filas
+por tabla, corre cada consulta sin los índices de las migraciones 010/012/013 y
+con ellos, y muestra el tipo de scan y el tiempo de ejecución de cada plan.
+
+Requiere PostgreSQL (EXPLAIN en formato JSON, índices parciales).
+
+Uso:
+    python scripts/benchmark_queries.py [--rows 1000000] [--schema benchmark] [--reseed] [--drop]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models import db, Noticia, APublicar  # noqa: E402
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+# Migraciones cuyos CREATE INDEX se comparan (antes = sin ellos, después = con ellos)
+INDEX_MIGRATIONS = [
+    '010_add_publication_lease.sql',
+    '012_add_hot_query_indexes.sql',
+    '013_add_apublicar_pagination_index.sql',
+]
+
+# Consultas tal como las emite la app
+HOT_QUERIES: List[Tuple[str, str]] = [
+    ('index: últimas noticias',
+     "SELECT * FROM noticias ORDER BY fecha_hora DESC LIMIT 30"),
+    ('retención: top N a conservar',
+     "SELECT id FROM noticias ORDER BY fecha_hora DESC, id DESC LIMIT 100"),
+    ('retención: por antigüedad',
+     "SELECT count(*) FROM noticias WHERE fecha_hora < now() - interval '300 days'"),
+    ('to-publish / claim',
+     "SELECT * FROM apublicar WHERE fase = 'procesado' AND procesado = true "
+     "ORDER BY selected_at ASC LIMIT 10"),
+    ('/apublicar: página por cursor',
+     "SELECT * FROM apublicar WHERE (selected_at, id) < (now() - interval '1 day', 500000) "
+     "ORDER BY selected_at DESC, id DESC LIMIT 51"),
+    ('/api/apublicar',
+     "SELECT * FROM apublicar WHERE processed_at IS NOT NULL "
+     "ORDER BY processed_at DESC, id DESC LIMIT 31"),
+    ('traducciones fallidas',
+     "SELECT id FROM apublicar WHERE procesado = true AND titulo_es = titulo"),
+]
+
+SEED_NOTICIAS = """
+INSERT INTO noticias (titulo, texto, url, fecha_hora, temas, created_at)
+SELECT
+    'Noticia ' || g,
+    'Texto de la noticia ' || g,
+    'https://example.com/noticia/' || g,
+    now() - random() * interval '365 days',
+    ARRAY['ia', 'ml'],
+    now()
+FROM generate_series(1, :rows) AS g
+"""
+
+# 70% publicadas, 10% procesadas sin publicar, 20% pendientes; 0.5% con traducción fallida
+SEED_APUBLICAR = """
+INSERT INTO apublicar (titulo, texto, url, fecha_hora, titulo_es, procesado, publicado,
+                       fase, selected_at, processed_at, intentos_publicacion)
+SELECT
+    'Noticia ' || g,
+    'Texto de la noticia ' || g,
+    'https://example.com/noticia/' || g,
+    now() - random() * interval '365 days',
+    CASE WHEN g % 200 = 0 THEN 'Noticia ' || g WHEN g % 10 < 8 THEN 'Traducida ' || g END,
+    g % 10 < 8,
+    g % 10 < 7,
+    CASE WHEN g % 10 < 7 THEN 'publicado_completo' WHEN g % 10 = 7 THEN 'procesado' ELSE 'pendiente' END,
+    now() - (g || ' seconds')::interval,
+    CASE WHEN g % 10 < 8 THEN now() - (g || ' seconds')::interval + interval '5 minutes' END,
+    0
+FROM generate_series(1, :rows) AS g
+"""
+
+
+def load_index_statements() -> List[Tuple[str, str]]:
+    """
+    Lee los CREATE INDEX de las migraciones comparadas
+
+    Returns:
+        Lista de (nombre del índice, sentencia)
+    """
+    statements = []
+    for filename in INDEX_MIGRATIONS:
+        with open(os.path.join(MIGRATIONS_DIR, filename), encoding='utf-8') as f:
+            sql = '\n'.join(line for line in f if not line.strip().startswith('--'))
+
+        for statement in sql.split(';'):
+            statement = ' '.join(statement.split())
+            match = re.match(r'CREATE INDEX IF NOT EXISTS (\w+)', statement, re.IGNORECASE)
+            if match:
+                statements.append((match.group(1), statement))
+    return statements
+
+
+def scan_nodes(plan: Dict) -> List[str]:
+    """Tipos de scan del plan (p.ej. 'Index Only Scan using idx_... on noticias')"""
+    nodes = []
+    if 'Scan' in plan['Node Type']:
+        description = plan['Node Type']
+        if plan.get('Index Name'):
+            description += f" using {plan['Index Name']}"
+        nodes.append(f"{description} on {plan.get('Relation Name', '?')}")
+    for child in plan.get('Plans', []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+
+def explain(conn, sql: str) -> Dict:
+    """EXPLAIN (ANALYZE, BUFFERS) de una consulta"""
+    raw = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar()
+    result = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    return {
+        'scans': scan_nodes(result['Plan']),
+        'ms': result['Execution Time']
+    }
+
+
+def seed(conn, schema: str, rows: int):
+    """Crea las tablas en el schema de benchmark y las llena con generate_series"""
+    print(f"🌱 Sembrando {rows:,} filas por tabla en '{schema}'...")
+    started = time.perf_counter()
+
+    db.metadata.create_all(
+        conn.execution_options(schema_translate_map={None: schema}),
+        tables=[Noticia.__table__, APublicar.__table__]
+    )
+    conn.execute(text(SEED_NOTICIAS), {'rows': rows})
+    conn.execute(text(SEED_APUBLICAR), {'rows': rows})
+    conn.execute(text("ANALYZE noticias"))
+    conn.execute(text("ANALYZE apublicar"))
+
+    print(f"   listo en {time.perf_counter() - started:.1f}s")
+
+
+def run_queries(conn) -> Dict[str, Dict]:
+    results = {}
+    for name, sql in HOT_QUERIES:
+        explain(conn, sql)  # Calentar cache: comparar planes, no lecturas de disco
+        results[name] = explain(conn, sql)
+    return results
+
+
+def print_report(before: Dict[str, Dict], after: Dict[str, Dict]):
+    print("\n" + "=" * 100)
+    print("PLANES DE LAS CONSULTAS CALIENTES (sin índices → con índices)")
+    print("=" * 100)
+    for name, _ in HOT_QUERIES:
+        antes, despues = before[name], after[name]
+        speedup = antes['ms'] / despues['ms'] if despues['ms'] else float('inf')
+        print(f"\n▶ {name}  ({antes['ms']:.2f} ms → {despues['ms']:.2f} ms, x{speedup:.1f})")
+        print(f"   antes:   {'; '.join(antes['scans']) or '-'}")
+        print(f"   después: {'; '.join(despues['scans']) or '-'}")
+
+
+def main():
+    """
+    Función principal
+    """
+    parser = argparse.ArgumentParser(description='EXPLAIN ANALYZE de las consultas calientes')
+    parser.add_argument('--database-url', default=os.getenv('DATABASE_URL'), help='URL de PostgreSQL')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Filas por tabla')
+    parser.add_argument('--schema', default='benchmark', help='Schema donde sembrar (no public)')
+    parser.add_argument('--reseed', action='store_true', help='Borrar y volver a sembrar el schema')
+    parser.add_argument('--drop', action='store_true', help='Borrar el schema al terminar')
+    args = parser.parse_args()
+
+    if not args.database_url or not args.database_url.startswith('postgresql'):
+        print("✗ Se necesita una DATABASE_URL de PostgreSQL")
+        return 1
+    if args.schema == 'public':
+        print("✗ El benchmark no corre sobre el schema public")
+        return 1
+
+    engine = create_engine(args.database_url)
+    indexes = load_index_statements()
+
+    with engine.begin() as conn:
+        if args.reseed:
+            conn.execute(text(f'DROP SCHEMA IF EXISTS "{args.schema}" CASCADE'))
+        exists = conn.execute(
+            text("SELECT 1 FROM information_schema.tables WHERE table_schema = :s AND table_name = 'apublicar'"),
+            {'s': args.schema}
+        ).scalar()
+        conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{args.schema}"'))
+        conn.execute(text(f'SET search_path TO "{args.schema}"'))
+        if not exists:
+            seed(conn, args.schema, args.rows)
+
+    with engine.begin() as conn:
+        conn.execute(text(f'SET search_path TO "{args.schema}"'))
+
+        for name, _ in indexes:
+            conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+        before = run_queries(conn)
+
+        print(f"🔧 Creando {len(indexes)} índices: {', '.join(name for name, _ in indexes)}")
+        for _, statement in indexes:
+            conn.execute(text(statement))
+        conn.execute(text("ANALYZE noticias"))
+        conn.execute(text("ANALYZE apublicar"))
+        after = run_queries(conn)
+
+        if args.drop:
+            conn.execute(text(f'DROP SCHEMA "{args.schema}" CASCADE'))
+
+    print_report(before, after)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque en frío (python -X importtime)
+Importa cada punto de entrada en un proceso nuevo, mide el tiempo de import
+(init_db incluido) y muestra los módulos con más tiempo propio. Falla si se
+supera el presupuesto o si algún módulo que debería cargarse diferido
+(anthropic, nltk, feedparser, bs4, newsapi) entra en el arranque.
+
+Uso:
+    python scripts/benchmark_startup.py [--runs 3] [--budget 1.0] [--top 10] [--env testing]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Puntos de entrada de cada proceso
+TARGETS: List[Tuple[str, str]] = [
+    ('web (gunicorn)', 'src.wsgi'),
+    ('worker', 'src.worker'),
+    ('publisher', 'social_publisher.publisher_service'),
+]
+
+# Solo los necesitan el scraping o la traducción: no deben cargarse al arrancar
+LAZY_MODULES = ('anthropic', 'nltk', 'feedparser', 'bs4', 'newsapi')
+
+IMPORT_SNIPPET = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    "import {module}\n"
+    "print(time.perf_counter() - started)\n"
+)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """
+    Parsea la salida de -X importtime
+
+    Returns:
+        Lista de (módulo, microsegundos propios, sin contar sus imports)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        own, _, name = line[len('import time:'):].split('|')
+        entries.append((name.strip(), int(own)))
+    return entries
+
+
+def measure(module: str, env: Dict[str, str]) -> Dict:
+    """Importa `module` en un proceso nuevo y devuelve tiempos y módulos cargados"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_SNIPPET.format(module=module)],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'error desconocido')
+
+    entries = parse_importtime(proc.stderr)
+    loaded = {name.split('.')[0] for name, _ in entries}
+    return {
+        'seconds': float(proc.stdout.strip().splitlines()[-1]),
+        'top': sorted(entries, key=lambda item: item[1], reverse=True),
+        'leaked': sorted(loaded.intersection(LAZY_MODULES))
+    }
+
+
+def main():
+    """
+    Función principal
+    """
+    parser = argparse.ArgumentParser(description='Tiempo de arranque en frío de cada proceso')
+    parser.add_argument('--runs', type=int, default=3, help='Corridas por proceso (se toma la mejor)')
+    parser.add_argument('--budget', type=float, default=1.0, help='Segundos máximos de import por proceso')
+    parser.add_argument('--top', type=int, default=10, help='Módulos más caros (tiempo propio) a mostrar')
+    parser.add_argument('--env', default='testing', help='FLASK_ENV (testing = SQLite en memoria, sin PostgreSQL)')
+    args = parser.parse_args()
+
+    env = dict(os.environ, FLASK_ENV=args.env, PYTHONDONTWRITEBYTECODE='1')
+    ok = True
+
+    print("=" * 80)
+    print(f"ARRANQUE EN FRÍO (mejor de {args.runs}, presupuesto {args.budget:.2f}s)")
+    print("=" * 80)
+
+    for label, module in TARGETS:
+        try:
+            runs = [measure(module, env) for _ in range(max(1, args.runs))]
+        except RuntimeError as e:
+            print(f"\n✗ {label} ({module}): no se pudo importar - {e}")
+            ok = False
+            continue
+
+        best = min(runs, key=lambda run: run['seconds'])
+        within_budget = best['seconds'] <= args.budget
+        ok = ok and within_budget and not best['leaked']
+
+        status = '✓' if within_budget and not best['leaked'] else '✗'
+        print(f"\n{status} {label} ({module}): {best['seconds'] * 1000:.0f} ms")
+        for name, us in best['top'][:args.top]:
+            print(f"   {us / 1000:8.1f} ms  {name}")
+        if best['leaked']:
+            print(f"   ⚠️ Cargados al arrancar (deberían ser diferidos): {', '.join(best['leaked'])}")
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,7 @@
 """
 Adaptadores para diferentes plataformas de redes sociales
 """
-from .base import SocialMediaAdapter, PostContent, PostResult
+from .base import SocialMediaAdapter, PostContent, PostResult, configure_http_session, get_http_session
 from .linkedin import LinkedInAdapter
 from .twitter import TwitterAdapter
 from .bluesky import BlueskyAdapter
@@ -11,6 +11,8 @@ __all__ = [
     'SocialMediaAdapter',
     'PostContent',
     'PostResult',
+    'configure_http_session',
+    'get_http_session',
     'LinkedInAdapter',
     'TwitterAdapter',
     'BlueskyAdapter',
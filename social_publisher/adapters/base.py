@@ -1,10 +1,124 @@
 """
 Clase base y tipos para adaptadores de redes sociales
 """
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Optional, List
-from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, List, Tuple, Union
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# ============================================================================
+# SESIÓN HTTP COMPARTIDA
+# ============================================================================
+# Todas las llamadas HTTP del publisher (adaptadores y cliente de WebIAScraper)
+# pasan por una única sesión con pool de conexiones keep-alive, así en régimen
+# estable se reutilizan conexiones TCP+TLS ya abiertas en lugar de abrir una
+# nueva por request.
+
+_http_settings = {
+    'pool_connections': 10,  # Hosts distintos con pool propio
+    'pool_maxsize': 10,  # Conexiones keep-alive por host
+    'connect_retries': 3,  # Reintentos solo de conexión (el request no llegó a enviarse)
+    'timeout': (5, 30)  # (connect, read) por defecto
+}
+_http_session: Optional[requests.Session] = None
+_http_lock = threading.Lock()
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session con timeout por defecto
+
+    Los timeouts explícitos de cada llamada siguen teniendo prioridad.
+    """
+
+    def __init__(self, timeout: Union[float, Tuple[float, float]] = (5, 30)):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def mount_pooled_adapters(session: requests.Session) -> requests.Session:
+    """
+    Montar en la sesión el adaptador HTTP con pool y reintentos de conexión
+
+    Sirve también para sesiones especiales como OAuth1Session.
+
+    Args:
+        session: Sesión de requests
+
+    Returns:
+        La misma sesión
+    """
+    retries = Retry(
+        total=_http_settings['connect_retries'],
+        connect=_http_settings['connect_retries'],
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=0.5,
+        allowed_methods=None,  # Fallas de conexión: seguro reintentar también POST
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_http_settings['pool_connections'],
+        pool_maxsize=_http_settings['pool_maxsize'],
+        max_retries=retries
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def configure_http_session(pool_connections: int = 10, pool_maxsize: int = 10,
+                           connect_retries: int = 3, connect_timeout: float = 5,
+                           read_timeout: float = 30) -> None:
+    """
+    Configurar la sesión compartida (descarta la actual si ya existía)
+
+    Args:
+        pool_connections: Hosts distintos con pool propio
+        pool_maxsize: Conexiones keep-alive por host
+        connect_retries: Reintentos ante fallas de conexión
+        connect_timeout: Timeout de conexión por defecto (segundos)
+        read_timeout: Timeout de lectura por defecto (segundos)
+    """
+    global _http_session
+
+    with _http_lock:
+        _http_settings.update(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            connect_retries=connect_retries,
+            timeout=(connect_timeout, read_timeout)
+        )
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+
+def get_http_session() -> requests.Session:
+    """
+    Obtener la sesión HTTP compartida (se crea en el primer uso)
+
+    Returns:
+        Sesión con pool de conexiones keep-alive
+    """
+    global _http_session
+
+    with _http_lock:
+        if _http_session is None:
+            _http_session = mount_pooled_adapters(PooledSession(timeout=_http_settings['timeout']))
+        return _http_session
 
 
 @dataclass
@@ -39,6 +153,10 @@ class PostResult:
     error: Optional[str] = None
     post_url: Optional[str] = None
     timestamp: Optional[datetime] = None
+    rate_limit_remaining: Optional[int] = None  # Header x-rate-limit-remaining (o equivalente)
+    rate_limit_reset: Optional[datetime] = None  # Cuándo se recupera el cupo (UTC)
+    retry_after: Optional[float] = None  # Segundos pedidos por la plataforma (retry-after)
+    deferred: bool = False  # No se intentó: diferido por el rate limiter local
 
     def __post_init__(self):
         """Inicializar timestamp si no se proporciona"""
@@ -67,6 +185,11 @@ class SocialMediaAdapter(ABC):
         self.platform_name = self.__class__.__name__.replace('Adapter', '').lower()
         self._authenticated = False
 
+    @property
+    def http(self) -> requests.Session:
+        """Sesión HTTP compartida con pool de conexiones"""
+        return get_http_session()
+
     @abstractmethod
     def authenticate(self) -> bool:
         """
@@ -140,6 +263,50 @@ class SocialMediaAdapter(ABC):
         """
         return self._authenticated
 
+    def _rate_limit_fields(self, response) -> Dict:
+        """
+        Extraer información de rate limit de los headers de una respuesta
+
+        Soporta x-rate-limit-* (Twitter), ratelimit-* (Bluesky) y retry-after.
+
+        Args:
+            response: Respuesta HTTP
+
+        Returns:
+            Diccionario con rate_limit_remaining, rate_limit_reset y retry_after
+            (solo las keys presentes), listo para PostResult(**...)
+        """
+        headers = getattr(response, 'headers', None) or {}
+        fields = {}
+
+        remaining = headers.get('x-rate-limit-remaining') or headers.get('ratelimit-remaining')
+        if remaining is not None:
+            try:
+                fields['rate_limit_remaining'] = int(remaining)
+            except ValueError:
+                pass
+
+        reset = headers.get('x-rate-limit-reset') or headers.get('ratelimit-reset')
+        if reset is not None:
+            try:
+                fields['rate_limit_reset'] = datetime.utcfromtimestamp(int(reset))
+            except (ValueError, OverflowError, OSError):
+                pass
+
+        retry_after = headers.get('retry-after')
+        if retry_after is not None:
+            try:
+                fields['retry_after'] = max(0.0, float(retry_after))
+            except ValueError:
+                # Formato HTTP-date
+                try:
+                    when = parsedate_to_datetime(retry_after)
+                    fields['retry_after'] = max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+                except (TypeError, ValueError):
+                    pass
+
+        return fields
+
     def _truncate_text(self, text: str, max_length: int, suffix: str = "...") -> str:
         """
         Truncar texto a una longitud máxima
@@ -1,7 +1,6 @@
 """
 Adaptador para Bluesky
 """
-import requests
 import logging
 from typing import Dict, Optional
 from datetime import datetime, timedelta, timezone
@@ -50,7 +49,7 @@ class BlueskyAdapter(SocialMediaAdapter):
                 "password": self.app_password
             }
 
-            response = requests.post(
+            response = self.http.post(
                 f"{self.API_BASE_URL}/com.atproto.server.createSession",
                 json=auth_data,
                 timeout=10
@@ -171,7 +170,7 @@ class BlueskyAdapter(SocialMediaAdapter):
             }
 
             # Publicar usando createRecord
-            response = requests.post(
+            response = self.http.post(
                 f"{self.API_BASE_URL}/com.atproto.repo.createRecord",
                 json=post_data,
                 headers=headers,
@@ -196,7 +195,8 @@ class BlueskyAdapter(SocialMediaAdapter):
                     success=True,
                     platform='bluesky',
                     post_id=post_uri,
-                    post_url=post_url
+                    post_url=post_url,
+                    **self._rate_limit_fields(response)
                 )
             else:
                 # Error
@@ -206,7 +206,8 @@ class BlueskyAdapter(SocialMediaAdapter):
                 return PostResult(
                     success=False,
                     platform='bluesky',
-                    error=f"HTTP {response.status_code}: {error_msg}"
+                    error=f"HTTP {response.status_code}: {error_msg}",
+                    **self._rate_limit_fields(response)
                 )
 
         except Exception as e:
@@ -44,7 +44,6 @@ DOCUMENTACIÓN:
 Última actualización: 2025-11-21
 ==================================================
 """
-import requests
 import logging
 from typing import Dict, Optional
 from datetime import datetime, timedelta
@@ -205,7 +204,7 @@ class LinkedInAdapter(SocialMediaAdapter):
             }
 
             # Publicar (API Legacy /v2/ugcPosts)
-            response = requests.post(
+            response = self.http.post(
                 f"{self.API_BASE_URL}/ugcPosts",
                 json=post_data,
                 headers=headers,
@@ -228,7 +227,8 @@ class LinkedInAdapter(SocialMediaAdapter):
                     success=True,
                     platform='linkedin',
                     post_id=post_id,
-                    post_url=post_url
+                    post_url=post_url,
+                    **self._rate_limit_fields(response)
                 )
             else:
                 # Error
@@ -238,7 +238,8 @@ class LinkedInAdapter(SocialMediaAdapter):
                 return PostResult(
                     success=False,
                     platform='linkedin',
-                    error=f"HTTP {response.status_code}: {error_msg}"
+                    error=f"HTTP {response.status_code}: {error_msg}",
+                    **self._rate_limit_fields(response)
                 )
 
         except Exception as e:
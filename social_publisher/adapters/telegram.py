@@ -1,7 +1,6 @@
 """
 Adaptador para Telegram
 """
-import requests
 import logging
 from typing import Dict, Optional
 from datetime import datetime, timedelta
@@ -42,7 +41,7 @@ class TelegramAdapter(SocialMediaAdapter):
                 return False
 
             # Verificar token
-            response = requests.get(
+            response = self.http.get(
                 f"{self.API_BASE_URL}/bot{self.bot_token}/getMe",
                 timeout=10
             )
@@ -203,7 +202,7 @@ class TelegramAdapter(SocialMediaAdapter):
             message_data = self.format_content(content)
 
             # Publicar
-            response = requests.post(
+            response = self.http.post(
                 f"{self.API_BASE_URL}/bot{self.bot_token}/sendMessage",
                 json=message_data,
                 timeout=30
@@ -232,7 +231,8 @@ class TelegramAdapter(SocialMediaAdapter):
                         success=True,
                         platform='telegram',
                         post_id=str(message_id),
-                        post_url=post_url
+                        post_url=post_url,
+                        **self._rate_limit_fields(response)
                     )
                 else:
                     error_msg = response_data.get('description', 'Unknown error')
@@ -247,10 +247,22 @@ class TelegramAdapter(SocialMediaAdapter):
                 error_msg = response.text
                 logger.error(f"Telegram: Error al publicar - {response.status_code}: {error_msg}")
 
+                rate_limit = self._rate_limit_fields(response)
+
+                # Flood control: Telegram informa la espera en el body (parameters.retry_after)
+                if response.status_code == 429 and 'retry_after' not in rate_limit:
+                    try:
+                        retry_after = response.json().get('parameters', {}).get('retry_after')
+                        if retry_after is not None:
+                            rate_limit['retry_after'] = float(retry_after)
+                    except ValueError:
+                        pass
+
                 return PostResult(
                     success=False,
                     platform='telegram',
-                    error=f"HTTP {response.status_code}: {error_msg}"
+                    error=f"HTTP {response.status_code}: {error_msg}",
+                    **rate_limit
                 )
 
         except Exception as e:
@@ -1,13 +1,12 @@
 """
 Adaptador para Twitter/X
 """
-import requests
 import logging
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 from requests_oauthlib import OAuth1Session
 
-from .base import SocialMediaAdapter, PostContent, PostResult
+from .base import SocialMediaAdapter, PostContent, PostResult, mount_pooled_adapters
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +36,24 @@ class TwitterAdapter(SocialMediaAdapter):
             'remaining': 1500,
             'reset_at': datetime.utcnow() + timedelta(days=30)
         }
+        self._oauth = None
+
+    def _oauth_session(self) -> OAuth1Session:
+        """
+        Sesión OAuth 1.0a (se crea una sola vez y reutiliza conexiones)
+
+        Los tokens OAuth 1.0a no expiran, así que la misma sesión firmada
+        sirve para todos los requests del proceso.
+        """
+        if self._oauth is None:
+            oauth = OAuth1Session(
+                self.api_key,
+                client_secret=self.api_secret,
+                resource_owner_key=self.access_token,
+                resource_owner_secret=self.access_token_secret
+            )
+            self._oauth = mount_pooled_adapters(oauth)
+        return self._oauth
 
     def authenticate(self) -> bool:
         """
@@ -50,16 +67,8 @@ class TwitterAdapter(SocialMediaAdapter):
                 logger.error("Twitter: Credenciales OAuth 1.0a incompletas")
                 return False
 
-            # Crear sesión OAuth 1.0a
-            oauth = OAuth1Session(
-                self.api_key,
-                client_secret=self.api_secret,
-                resource_owner_key=self.access_token,
-                resource_owner_secret=self.access_token_secret
-            )
-
             # Verificar autenticación obteniendo información del usuario
-            response = oauth.get(
+            response = self._oauth_session().get(
                 f"{self.API_BASE_URL}/users/me",
                 timeout=10
             )
@@ -153,16 +162,8 @@ class TwitterAdapter(SocialMediaAdapter):
             # Formatear contenido
             tweet_data = self.format_content(content)
 
-            # Crear sesión OAuth 1.0a
-            oauth = OAuth1Session(
-                self.api_key,
-                client_secret=self.api_secret,
-                resource_owner_key=self.access_token,
-                resource_owner_secret=self.access_token_secret
-            )
-
-            # Publicar usando OAuth 1.0a
-            response = oauth.post(
+            # Publicar usando OAuth 1.0a (sesión reutilizada)
+            response = self._oauth_session().post(
                 f"{self.API_BASE_URL}/tweets",
                 json=tweet_data,
                 timeout=30
@@ -185,7 +186,8 @@ class TwitterAdapter(SocialMediaAdapter):
                     success=True,
                     platform='twitter',
                     post_id=tweet_id,
-                    post_url=post_url
+                    post_url=post_url,
+                    **self._rate_limit_fields(response)
                 )
             else:
                 # Error
@@ -195,7 +197,8 @@ class TwitterAdapter(SocialMediaAdapter):
                 return PostResult(
                     success=False,
                     platform='twitter',
-                    error=f"HTTP {response.status_code}: {error_msg}"
+                    error=f"HTTP {response.status_code}: {error_msg}",
+                    **self._rate_limit_fields(response)
                 )
 
         except Exception as e:
@@ -13,6 +13,7 @@ class SocialPublisherConfig:
     # WebIAScraper API
     WEBIASCRAPER_API_URL = os.getenv('WEBIASCRAPER_API_URL', 'http://app:8000')
     WEBIASCRAPER_API_KEY = os.getenv('WEBIASCRAPER_API_KEY', '')
+    PUBLISHER_ID = os.getenv('PUBLISHER_ID', '')  # Vacío = host:pid (único por réplica)
 
     # Plataformas habilitadas
     ENABLED_PLATFORMS = os.getenv(
@@ -23,9 +24,50 @@ class SocialPublisherConfig:
     # Intervalo de polling (segundos)
     POLL_INTERVAL_SECONDS = int(os.getenv('POLL_INTERVAL_SECONDS', '300'))  # 5 minutos
 
+    # Long-poll a /api/news/wait-for-work: despierta apenas hay noticias procesadas
+    # (si falla, se vuelve al polling cada POLL_INTERVAL_SECONDS)
+    LONGPOLL_ENABLED = os.getenv('LONGPOLL_ENABLED', 'true').lower() == 'true'
+    LONGPOLL_TIMEOUT_SECONDS = float(os.getenv('LONGPOLL_TIMEOUT_SECONDS', '25'))  # Menor que LONGPOLL_MAX_TIMEOUT_SECONDS del servidor
+
+    # Autenticar todos los adaptadores al arrancar (excluye los que fallan) o en su primer publish
+    ADAPTER_AUTH_ON_START = os.getenv('ADAPTER_AUTH_ON_START', 'false').lower() == 'true'
+    # Backoff del login diferido tras un fallo (se duplica en cada fallo seguido)
+    ADAPTER_AUTH_RETRY_SECONDS = float(os.getenv('ADAPTER_AUTH_RETRY_SECONDS', '300'))
+    ADAPTER_AUTH_RETRY_MAX_SECONDS = float(os.getenv('ADAPTER_AUTH_RETRY_MAX_SECONDS', '3600'))
+
     # Número máximo de noticias a procesar por ciclo
     MAX_NEWS_PER_CYCLE = int(os.getenv('MAX_NEWS_PER_CYCLE', '5'))
 
+    # Publicación en paralelo a todas las plataformas de una noticia
+    PUBLISH_FANOUT = os.getenv('PUBLISH_FANOUT', 'true').lower() == 'true'
+
+    # Pacing: segundos mínimos entre posts a una misma plataforma
+    PUBLISH_MIN_INTERVAL_SECONDS = float(os.getenv('PUBLISH_MIN_INTERVAL_SECONDS', '2'))
+    PUBLISH_MIN_INTERVAL_OVERRIDES = os.getenv('PUBLISH_MIN_INTERVAL_OVERRIDES', '')  # twitter:5,linkedin:10
+
+    # Token bucket por plataforma (cupos de get_rate_limit()), persistido entre reinicios
+    RATE_LIMIT_STATE_FILE = os.getenv('RATE_LIMIT_STATE_FILE', '/app/data/rate_limit_state.json')
+    RATE_LIMIT_BURST = int(os.getenv('RATE_LIMIT_BURST', '5'))  # Posts seguidos antes de depender de la recarga
+
+    # Queue persistente de publicación (SQLite)
+    QUEUE_DB_PATH = os.getenv('QUEUE_DB_PATH', '/app/data/publication_queue.db')
+    QUEUE_VISIBILITY_TIMEOUT_SECONDS = int(os.getenv('QUEUE_VISIBILITY_TIMEOUT_SECONDS', '300'))  # Sin ack en este tiempo, se reentrega
+    QUEUE_BATCH_SIZE = int(os.getenv('QUEUE_BATCH_SIZE', '10'))  # Mensajes tomados por dequeue
+    QUEUE_POLL_SECONDS = float(os.getenv('QUEUE_POLL_SECONDS', '5'))  # Espera con la queue vacía
+    QUEUE_DONE_RETENTION_DAYS = int(os.getenv('QUEUE_DONE_RETENTION_DAYS', '7'))  # Dedup de ya publicadas
+    PUBLISH_WORKERS = int(os.getenv('PUBLISH_WORKERS', '2'))  # Worker threads consumiendo la queue
+
+    # Resultados de publicación enviados en lote (POST /api/news/mark-published-batch)
+    MARK_PUBLISHED_FLUSH_SECONDS = float(os.getenv('MARK_PUBLISHED_FLUSH_SECONDS', '2'))  # Espera máxima en el buffer
+    MARK_PUBLISHED_BATCH_SIZE = int(os.getenv('MARK_PUBLISHED_BATCH_SIZE', '50'))  # Resultados por request
+
+    # Sesión HTTP compartida (pool de conexiones keep-alive)
+    HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '10'))  # Hosts con pool propio
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '10'))  # Conexiones por host (>= workers en paralelo)
+    HTTP_CONNECT_RETRIES = int(os.getenv('HTTP_CONNECT_RETRIES', '3'))  # Solo fallas de conexión
+    HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv('HTTP_CONNECT_TIMEOUT_SECONDS', '5'))
+    HTTP_READ_TIMEOUT_SECONDS = float(os.getenv('HTTP_READ_TIMEOUT_SECONDS', '30'))
+
     # Retry configuration
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
     RETRY_DELAY_SECONDS = int(os.getenv('RETRY_DELAY_SECONDS', '60'))
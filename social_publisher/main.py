@@ -85,9 +85,8 @@ class SocialPublisher:
                 stats = self.service.get_stats()
                 logger.info(f"📊 Queue: {stats['queue_size']} items pendientes")
 
-                # Esperar hasta el próximo ciclo
-                logger.info(f"💤 Esperando {self.config.POLL_INTERVAL_SECONDS} segundos hasta el próximo ciclo...")
-                time.sleep(self.config.POLL_INTERVAL_SECONDS)
+                # Esperar hasta el próximo ciclo (o hasta que haya noticias procesadas)
+                self._wait_next_cycle()
 
             except Exception as e:
                 logger.error(f"❌ Error en loop principal: {e}", exc_info=True)
@@ -96,6 +95,38 @@ class SocialPublisher:
         # Shutdown
         self.shutdown()
 
+    def _wait_next_cycle(self):
+        """
+        Esperar al próximo ciclo
+
+        Con long-poll, el ciclo arranca apenas WebIAScraper avisa que hay noticias
+        procesadas, y como máximo a los POLL_INTERVAL_SECONDS. Si el long-poll falla
+        se duerme el resto del intervalo (polling clásico) y se reintenta en el
+        próximo ciclo.
+        """
+        interval = self.config.POLL_INTERVAL_SECONDS
+        if not self.config.LONGPOLL_ENABLED:
+            logger.info(f"💤 Esperando {interval} segundos hasta el próximo ciclo...")
+            time.sleep(interval)
+            return
+
+        logger.info(f"👂 Esperando noticias procesadas (máximo {interval} segundos)...")
+        deadline = time.monotonic() + interval
+
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            try:
+                if self.service.wait_for_work(min(self.config.LONGPOLL_TIMEOUT_SECONDS, remaining)):
+                    logger.info("🔔 Hay noticias procesadas nuevas, adelantando el ciclo")
+                    return
+            except Exception as e:
+                logger.warning(f"⚠️ Long-poll no disponible ({e}), polling en {remaining:.0f} segundos")
+                time.sleep(remaining)
+                return
+
     def shutdown(self):
         """Shutdown graceful del servicio"""
         logger.info("\n" + "=" * 80)
@@ -105,9 +136,13 @@ class SocialPublisher:
         # Detener worker
         self.service.stop_worker()
 
-        # Esperar a que la queue se vacíe (máximo 30 segundos)
-        logger.info("⏳ Esperando a que se procesen los items pendientes...")
-        self.service.publication_queue.join()
+        # La queue es persistente: lo pendiente se retoma en el próximo arranque
+        pendientes = self.service.publication_queue.qsize()
+        if pendientes:
+            logger.info(f"💾 {pendientes} publicaciones pendientes quedan en la queue persistente")
+        resultados = self.service.result_buffer.qsize()
+        if resultados:
+            logger.info(f"💾 {resultados} resultados sin confirmar en WebIAScraper se envían al reiniciar")
 
         logger.info("✅ Shutdown completado")
         logger.info("=" * 80)
@@ -2,22 +2,29 @@
 Servicio principal de publicación en redes sociales
 """
 import logging
-import requests
+import os
+import socket
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from datetime import datetime
-from queue import Queue, Empty
-from threading import Thread, Event
+from threading import Thread, Event, Lock
 
 from .adapters import (
     PostContent,
     PostResult,
+    configure_http_session,
+    get_http_session,
     LinkedInAdapter,
     TwitterAdapter,
     BlueskyAdapter,
     TelegramAdapter
 )
 from .config.settings import SocialPublisherConfig
+from .utils.pacing import PlatformPacer
+from .utils.rate_limiter import RateLimitScheduler
+from .utils.persistent_queue import PersistentQueue, QueueMessage
+from .utils.result_buffer import ResultBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +34,11 @@ class PublisherService:
     Servicio que coordina la publicación de noticias en múltiples plataformas
 
     Features:
-    - Queue interno para manejar publicaciones
+    - Queue persistente (SQLite) con dedup por (noticia, plataforma) y varios workers
     - Retry logic con backoff exponencial
-    - Rate limiting por plataforma
+    - Publicación en paralelo a todas las plataformas (fan-out)
+    - Pacing por plataforma (intervalo mínimo entre posts)
+    - Token bucket por plataforma: difiere posts sin cupo en lugar de provocar 429
     - Comunicación con WebIAScraper API
     """
 
@@ -42,9 +51,41 @@ class PublisherService:
         """
         self.config = config or SocialPublisherConfig()
         self.adapters = {}
-        self.publication_queue = Queue()
+
+        # Sesión HTTP compartida (pool keep-alive) para adaptadores y WebIAScraper API
+        configure_http_session(
+            pool_connections=self.config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.config.HTTP_POOL_MAXSIZE,
+            connect_retries=self.config.HTTP_CONNECT_RETRIES,
+            connect_timeout=self.config.HTTP_CONNECT_TIMEOUT_SECONDS,
+            read_timeout=self.config.HTTP_READ_TIMEOUT_SECONDS
+        )
+        self.http = get_http_session()
+        self.publication_queue = PersistentQueue(
+            self.config.QUEUE_DB_PATH,
+            visibility_timeout=self.config.QUEUE_VISIBILITY_TIMEOUT_SECONDS
+        )
         self.stop_event = Event()
-        self.worker_thread = None
+        self.worker_threads: List[Thread] = []
+        self.pacer = PlatformPacer(
+            default_interval=self.config.PUBLISH_MIN_INTERVAL_SECONDS,
+            intervals=PlatformPacer.parse_intervals(self.config.PUBLISH_MIN_INTERVAL_OVERRIDES)
+        )
+        self.rate_limiter = RateLimitScheduler(
+            state_file=self.config.RATE_LIMIT_STATE_FILE,
+            burst=self.config.RATE_LIMIT_BURST
+        )
+        self.result_buffer = ResultBuffer(
+            sender=self.send_published_batch,
+            flush_interval=self.config.MARK_PUBLISHED_FLUSH_SECONDS,
+            max_batch=self.config.MARK_PUBLISHED_BATCH_SIZE,
+            path=self.config.QUEUE_DB_PATH
+        )
+        self.work_cursor: Optional[str] = None  # Cursor del long-poll (/api/news/wait-for-work)
+        self._auth_lock = Lock()  # Una sola autenticación diferida a la vez por adaptador
+        self._auth_backoff: Dict[str, tuple] = {}  # plataforma -> (fallos seguidos, próximo intento)
+        # Identidad con la que se reclaman noticias (única por réplica)
+        self.publisher_id = self.config.PUBLISHER_ID or f"{socket.gethostname()}:{os.getpid()}"
 
         # Inicializar adaptadores
         self._init_adapters()
@@ -73,12 +114,15 @@ class PublisherService:
                 adapter_class = adapter_classes[platform]
                 adapter = adapter_class(credentials=credentials)
 
-                # Autenticar
-                if adapter.authenticate():
-                    self.adapters[platform] = adapter
-                    logger.info(f"✅ {platform.capitalize()}: Adaptador inicializado")
-                else:
+                # Autenticar al arrancar solo si se pide: por defecto cada adaptador
+                # se autentica en su primer publish (ver _ensure_authenticated)
+                if self.config.ADAPTER_AUTH_ON_START and not adapter.authenticate():
                     logger.error(f"❌ {platform.capitalize()}: Error de autenticación")
+                    continue
+
+                self.adapters[platform] = adapter
+                self.rate_limiter.configure(platform, adapter.get_rate_limit())
+                logger.info(f"✅ {platform.capitalize()}: Adaptador inicializado")
 
             except Exception as e:
                 logger.error(f"❌ {platform.capitalize()}: Error al inicializar - {e}")
@@ -88,7 +132,11 @@ class PublisherService:
 
     def fetch_news_to_publish(self, limit: int = 10) -> List[Dict]:
         """
-        Obtener noticias pendientes de publicar desde WebIAScraper API
+        Reclamar noticias pendientes de publicar desde WebIAScraper API
+
+        Usa POST /api/news/claim: las noticias devueltas quedan en fase
+        'publicando' con un lease a nombre de este publisher, así otra réplica
+        (o un ciclo que se solapa) no las vuelve a publicar.
 
         Args:
             limit: Máximo de noticias a obtener
@@ -97,27 +145,93 @@ class PublisherService:
             Lista de noticias
         """
         try:
-            url = f"{self.config.WEBIASCRAPER_API_URL}/api/news/to-publish"
-            params = {
-                'procesados': 'true',
-                'limit': limit
+            url = f"{self.config.WEBIASCRAPER_API_URL}/api/news/claim"
+            payload = {
+                'publisher_id': self.publisher_id,
+                'limit': limit,
+                'platforms': list(self.adapters)
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.post(url, json=payload, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
                 noticias = data.get('noticias', [])
-                logger.info(f"📥 Obtenidas {len(noticias)} noticias para publicar")
+                logger.info(f"📥 Reclamadas {len(noticias)} noticias para publicar")
                 return noticias
             else:
-                logger.error(f"Error al obtener noticias: {response.status_code}")
+                logger.error(f"Error al reclamar noticias: {response.status_code}")
                 return []
 
         except Exception as e:
             logger.error(f"Error al conectar con WebIAScraper: {e}")
             return []
 
+    def heartbeat_leases(self) -> int:
+        """
+        Extender el lease de las noticias que siguen en la queue persistente
+
+        Las plataformas diferidas por el token bucket o en backoff pueden quedar
+        en la queue más que PUBLICATION_LEASE_SECONDS; sin heartbeat otra réplica
+        las reclamaría y publicaría de nuevo. Las que ya tiene otro publisher se
+        descartan de la queue.
+
+        Returns:
+            Cantidad de noticias con el lease renovado
+        """
+        noticia_ids = self.publication_queue.pending_noticias()
+        if not noticia_ids:
+            return 0
+
+        try:
+            url = f"{self.config.WEBIASCRAPER_API_URL}/api/news/lease-heartbeat"
+            payload = {'publisher_id': self.publisher_id, 'noticia_ids': noticia_ids}
+            response = self.http.post(url, json=payload, timeout=10)
+
+            if response.status_code != 200:
+                logger.error(f"Error al renovar leases: {response.status_code}")
+                return 0
+
+            data = response.json()
+            lost = data.get('lost', [])
+            if lost:
+                dropped = self.publication_queue.drop_noticias(lost)
+                logger.warning(f"⚠️ Noticias {lost} reclamadas por otro publisher: {dropped} publicaciones descartadas")
+            return len(data.get('renewed', []))
+
+        except Exception as e:
+            logger.error(f"Error al renovar leases: {e}")
+            return 0
+
+    def wait_for_work(self, timeout: float) -> bool:
+        """
+        Long-poll a WebIAScraper hasta que haya noticias nuevas en fase 'procesado'
+
+        A diferencia de fetch_news_to_publish, los errores se propagan para que
+        el llamador vuelva al polling por intervalo.
+
+        Args:
+            timeout: Segundos máximos que el servidor retiene la respuesta
+
+        Returns:
+            True si hay trabajo nuevo, False si venció el timeout
+        """
+        url = f"{self.config.WEBIASCRAPER_API_URL}/api/news/wait-for-work"
+        params = {'timeout': timeout}
+        if self.work_cursor:
+            params['since'] = self.work_cursor
+
+        # Margen sobre el timeout del servidor para no cortar una respuesta en camino
+        response = self.http.get(
+            url, params=params,
+            timeout=(self.config.HTTP_CONNECT_TIMEOUT_SECONDS, timeout + 10)
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        self.work_cursor = data.get('cursor') or self.work_cursor
+        return bool(data.get('ready'))
+
     def mark_as_published(self, noticia_id: int, platform: str,
                          post_id: Optional[str] = None,
                          post_url: Optional[str] = None,
@@ -125,6 +239,9 @@ class PublisherService:
         """
         Marcar noticia como publicada en WebIAScraper
 
+        El resultado se guarda en el buffer persistente (antes del ack del
+        mensaje) y se envía en lote con el próximo flush (ver send_published_batch).
+
         Args:
             noticia_id: ID de la noticia
             platform: Plataforma
@@ -133,29 +250,44 @@ class PublisherService:
             error: Mensaje de error (si falló)
 
         Returns:
-            True si se marcó exitosamente
+            True si el resultado quedó en el buffer
         """
-        try:
-            url = f"{self.config.WEBIASCRAPER_API_URL}/api/news/{noticia_id}/mark-published"
+        self.result_buffer.add({
+            'noticia_id': noticia_id,
+            'platform': platform,
+            'post_id': post_id,
+            'post_url': post_url,
+            'error': error
+        })
+        return True
 
-            payload = {
-                'platform': platform,
-                'post_id': post_id,
-                'post_url': post_url,
-                'error': error
-            }
+    def send_published_batch(self, results: List[Dict]) -> bool:
+        """
+        Enviar un lote de resultados a WebIAScraper (una transacción en el servidor)
 
-            response = requests.post(url, json=payload, timeout=10)
+        Args:
+            results: Resultados acumulados por mark_as_published
 
-            if response.status_code == 200:
-                logger.info(f"✅ Noticia {noticia_id} marcada como publicada en {platform}")
-                return True
-            else:
-                logger.error(f"Error al marcar noticia: {response.status_code}")
+        Returns:
+            True si el lote se aplicó; False para reintentarlo en el próximo flush
+        """
+        try:
+            url = f"{self.config.WEBIASCRAPER_API_URL}/api/news/mark-published-batch"
+            response = self.http.post(url, json={'results': results}, timeout=10)
+
+            if response.status_code != 200:
+                logger.error(f"Error al marcar lote de {len(results)} resultados: {response.status_code}")
                 return False
 
+            for applied in response.json().get('results', []):
+                if applied.get('status') == 'error':
+                    logger.error(f"Noticia {applied.get('noticia_id')}: {applied.get('error')}")
+                else:
+                    logger.info(f"✅ Noticia {applied['noticia_id']} marcada en {applied['platform']} ({applied['status']})")
+            return True
+
         except Exception as e:
-            logger.error(f"Error al marcar noticia como publicada: {e}")
+            logger.error(f"Error al marcar noticias como publicadas: {e}")
             return False
 
     def publish_to_platform(self, noticia: Dict, platform: str) -> PostResult:
@@ -179,6 +311,17 @@ class PublisherService:
         try:
             adapter = self.adapters[platform]
 
+            if not self._ensure_authenticated(platform, adapter):
+                result = PostResult(
+                    success=False,
+                    platform=platform,
+                    error="Error de autenticación: reintento del login más tarde",
+                    retry_after=self._auth_retry_in(platform)
+                )
+                # Se informa el intento fallido; el mensaje se reintenta tras el backoff
+                self.mark_as_published(noticia_id=noticia['id'], platform=platform, error=result.error)
+                return result
+
             # Crear PostContent
             content = PostContent(
                 titulo=noticia.get('titulo_es') or noticia.get('titulo', ''),
@@ -192,6 +335,9 @@ class PublisherService:
             # Publicar
             result = adapter.publish(content)
 
+            # Ajustar el cupo con los headers de rate limit de la respuesta
+            self.rate_limiter.update_from_result(platform, result)
+
             # Marcar en WebIAScraper
             self.mark_as_published(
                 noticia_id=noticia['id'],
@@ -211,10 +357,55 @@ class PublisherService:
                 error=str(e)
             )
 
+    def _ensure_authenticated(self, platform: str, adapter) -> bool:
+        """
+        Autenticación diferida: la primera vez que se publica en la plataforma
+
+        Si falla, no se repite el login hasta que pase el backoff
+        (ADAPTER_AUTH_RETRY_SECONDS, duplicándose en cada fallo hasta
+        ADAPTER_AUTH_RETRY_MAX_SECONDS): createSession de Bluesky tiene rate
+        limit. Mientras tanto las publicaciones fallan y se reintentan.
+
+        Returns:
+            True si el adaptador está autenticado
+        """
+        if adapter.is_authenticated():
+            return True
+
+        with self._auth_lock:
+            if adapter.is_authenticated():
+                return True
+            if self._auth_retry_in(platform) > 0:
+                return False
+
+            if adapter.authenticate():
+                self._auth_backoff.pop(platform, None)
+                logger.info(f"✅ {platform.capitalize()}: Autenticado")
+                return True
+
+            failures = self._auth_backoff.get(platform, (0, 0))[0] + 1
+            delay = min(
+                self.config.ADAPTER_AUTH_RETRY_SECONDS * 2 ** (failures - 1),
+                self.config.ADAPTER_AUTH_RETRY_MAX_SECONDS
+            )
+            self._auth_backoff[platform] = (failures, time.monotonic() + delay)
+            logger.error(f"❌ {platform.capitalize()}: Error de autenticación, reintento del login en {delay:.0f}s")
+            return False
+
+    def _auth_retry_in(self, platform: str) -> float:
+        """Segundos que faltan para reintentar el login de la plataforma (0 = ya se puede)"""
+        _, retry_at = self._auth_backoff.get(platform, (0, 0))
+        return max(0.0, retry_at - time.monotonic())
+
     def publish_news(self, noticia: Dict, platforms: Optional[List[str]] = None) -> Dict[str, PostResult]:
         """
         Publicar una noticia en múltiples plataformas
 
+        Con PUBLISH_FANOUT publica en todas las plataformas a la vez; el
+        pacer solo espacia posts consecutivos a una misma plataforma.
+        Las plataformas sin cupo en su token bucket no se intentan: su
+        resultado vuelve con deferred=True y retry_after.
+
         Args:
             noticia: Datos de la noticia
             platforms: Lista de plataformas (None = todas las disponibles)
@@ -225,102 +416,213 @@ class PublisherService:
         if platforms is None:
             platforms = list(self.adapters.keys())
 
-        results = {}
-
+        targets = []
         for platform in platforms:
             if platform not in self.adapters:
                 logger.warning(f"Saltando plataforma no disponible: {platform}")
                 continue
+            targets.append(platform)
 
-            logger.info(f"📤 Publicando noticia {noticia['id']} en {platform}...")
+        # Reservar cupo; las plataformas sin tokens se difieren
+        results = {}
+        ready = []
+        for platform in targets:
+            wait = self.rate_limiter.acquire(platform)
+            if wait > 0:
+                logger.info(f"⏳ {platform}: sin cupo, noticia {noticia['id']} diferida {wait:.0f}s")
+                results[platform] = PostResult(
+                    success=False,
+                    platform=platform,
+                    error=f"Rate limit local: reintento en {wait:.0f}s",
+                    retry_after=wait,
+                    deferred=True
+                )
+            else:
+                results[platform] = None
+                ready.append(platform)
+
+        if self.config.PUBLISH_FANOUT and len(ready) > 1:
+            with ThreadPoolExecutor(max_workers=len(ready), thread_name_prefix='publish') as executor:
+                futures = {
+                    platform: executor.submit(self._paced_publish, noticia, platform)
+                    for platform in ready
+                }
+                for platform, future in futures.items():
+                    results[platform] = future.result()
+        else:
+            for platform in ready:
+                results[platform] = self._paced_publish(noticia, platform)
 
-            result = self.publish_to_platform(noticia, platform)
-            results[platform] = result
+        return results
 
-            if result.success:
-                logger.info(f"✅ {platform}: Publicación exitosa")
-            else:
-                logger.error(f"❌ {platform}: {result.error}")
+    def _paced_publish(self, noticia: Dict, platform: str) -> PostResult:
+        """
+        Publicar en una plataforma respetando su pacing
+
+        Args:
+            noticia: Datos de la noticia
+            platform: Nombre de la plataforma
+
+        Returns:
+            Resultado de la publicación
+        """
+        # Espaciar posts a la misma plataforma para evitar flood
+        self.pacer.wait(platform)
 
-            # Delay entre plataformas para evitar flood
-            time.sleep(2)
+        logger.info(f"📤 Publicando noticia {noticia['id']} en {platform}...")
 
-        return results
+        result = self.publish_to_platform(noticia, platform)
+
+        if result.success:
+            logger.info(f"✅ {platform}: Publicación exitosa")
+        else:
+            logger.error(f"❌ {platform}: {result.error}")
+
+        return result
 
     def process_queue(self):
         """
         Worker thread que procesa la queue de publicaciones
+
+        Toma mensajes en bloque, los agrupa por noticia para publicar en
+        paralelo y confirma cada (noticia, plataforma) según su resultado.
+        Si el proceso muere antes del ack, el mensaje reaparece al vencer
+        el visibility timeout (at-least-once).
         """
         logger.info("🚀 Worker de publicación iniciado")
 
         while not self.stop_event.is_set():
             try:
-                # Obtener item de la queue (timeout 5 segundos)
-                item = self.publication_queue.get(timeout=5)
+                messages = self.publication_queue.dequeue(max_items=self.config.QUEUE_BATCH_SIZE)
 
-                noticia = item['noticia']
-                platforms = item.get('platforms')
+                if not messages:
+                    # No hay items visibles en la queue, esperar
+                    self.stop_event.wait(self.config.QUEUE_POLL_SECONDS)
+                    continue
 
-                logger.info(f"📋 Procesando noticia {noticia['id']} de la queue")
+                # Agrupar por noticia: un fan-out por noticia
+                por_noticia: Dict[int, List[QueueMessage]] = {}
+                for message in messages:
+                    por_noticia.setdefault(message.noticia_id, []).append(message)
 
-                # Publicar
-                results = self.publish_news(noticia, platforms)
+                for noticia_messages in por_noticia.values():
+                    noticia = noticia_messages[0].noticia
+                    logger.info(f"📋 Procesando noticia {noticia['id']} de la queue")
 
-                # Marcar como procesado
-                self.publication_queue.task_done()
+                    results = self.publish_news(noticia, [m.platform for m in noticia_messages])
+                    self._settle_messages(noticia_messages, results)
 
-            except Empty:
-                # No hay items en la queue, continuar esperando
-                continue
             except Exception as e:
                 logger.error(f"Error procesando queue: {e}")
+                self.stop_event.wait(self.config.QUEUE_POLL_SECONDS)
 
         logger.info("🛑 Worker de publicación detenido")
 
+    def _settle_messages(self, messages: List[QueueMessage], results: Dict[str, PostResult]):
+        """
+        Confirmar, postergar o reintentar cada mensaje según el resultado de su plataforma
+
+        Args:
+            messages: Mensajes de una misma noticia
+            results: Resultados de publish_news por plataforma
+        """
+        done = []
+
+        for message in messages:
+            result = results.get(message.platform)
+
+            if result is None:
+                # Plataforma ya no disponible: no tiene sentido reintentar
+                logger.warning(f"Descartando {message.platform} para noticia {message.noticia_id}: adaptador no disponible")
+                self.publication_queue.drop([message.id])
+            elif result.success:
+                done.append(message.id)
+            elif result.deferred:
+                self.publication_queue.defer(message.id, result.retry_after or self.config.RETRY_DELAY_SECONDS)
+            elif message.attempts >= self.config.MAX_RETRIES:
+                # Se libera la clave de dedup: WebIAScraper decide si vuelve a ofrecerla
+                logger.error(f"❌ {message.platform}: noticia {message.noticia_id} descartada tras {message.attempts} intentos")
+                self.publication_queue.drop([message.id])
+            else:
+                delay = result.retry_after or (
+                    self.config.RETRY_DELAY_SECONDS
+                    * self.config.RETRY_BACKOFF_MULTIPLIER ** (message.attempts - 1)
+                )
+                logger.info(f"🔁 {message.platform}: reintento de noticia {message.noticia_id} en {delay:.0f}s")
+                self.publication_queue.nack(message.id, delay, result.error)
+
+        self.publication_queue.ack(done)
+
     def start_worker(self):
-        """Iniciar worker thread para procesar queue"""
-        if self.worker_thread and self.worker_thread.is_alive():
+        """Iniciar worker threads (PUBLISH_WORKERS) para procesar la queue"""
+        if any(thread.is_alive() for thread in self.worker_threads):
             logger.warning("Worker ya está en ejecución")
             return
 
         self.stop_event.clear()
-        self.worker_thread = Thread(target=self.process_queue, daemon=True)
-        self.worker_thread.start()
-        logger.info("✅ Worker thread iniciado")
+        self.worker_threads = [
+            Thread(target=self.process_queue, name=f'publisher-worker-{i}', daemon=True)
+            for i in range(max(1, self.config.PUBLISH_WORKERS))
+        ]
+        for thread in self.worker_threads:
+            thread.start()
+        self.result_buffer.start()
+        logger.info(f"✅ {len(self.worker_threads)} worker threads iniciados")
 
     def stop_worker(self):
-        """Detener worker thread"""
+        """Detener worker threads"""
         logger.info("🛑 Deteniendo worker...")
         self.stop_event.set()
 
-        if self.worker_thread:
-            self.worker_thread.join(timeout=10)
-            logger.info("✅ Worker detenido")
+        for thread in self.worker_threads:
+            thread.join(timeout=10)
+
+        # Enviar los resultados que quedaron en el buffer
+        self.result_buffer.stop()
+        logger.info("✅ Worker detenido")
 
-    def enqueue_news(self, noticia: Dict, platforms: Optional[List[str]] = None):
+    def enqueue_news(self, noticia: Dict, platforms: Optional[List[str]] = None,
+                     not_before: Optional[float] = None) -> int:
         """
         Añadir noticia a la queue de publicación
 
+        Las combinaciones (noticia, plataforma) ya encoladas o publicadas se ignoran.
+
         Args:
             noticia: Datos de la noticia
-            platforms: Lista de plataformas (None = todas)
+            platforms: Lista de plataformas (None = todas las disponibles)
+            not_before: Timestamp (epoch) antes del cual no publicar
+
+        Returns:
+            Cantidad de publicaciones nuevas en la queue
         """
-        self.publication_queue.put({
-            'noticia': noticia,
-            'platforms': platforms
-        })
-        logger.info(f"📥 Noticia {noticia['id']} añadida a la queue")
+        if platforms is None:
+            platforms = list(self.adapters.keys())
+
+        added = self.publication_queue.enqueue(noticia, platforms, not_before=not_before)
+        if added:
+            logger.info(f"📥 Noticia {noticia['id']} añadida a la queue ({added} plataformas)")
+        else:
+            logger.info(f"ℹ️ Noticia {noticia['id']} ya estaba en la queue")
+        return added
 
     def run_cycle(self):
         """
         Ejecutar un ciclo de polling y publicación
 
         Este método se puede llamar periódicamente para:
-        1. Obtener noticias pendientes
-        2. Añadirlas a la queue
+        1. Renovar el lease de lo que sigue en la queue
+        2. Obtener noticias pendientes
+        3. Añadirlas a la queue (sin las plataformas ya publicadas)
         """
         logger.info("🔄 Iniciando ciclo de publicación...")
 
+        # Limpiar confirmaciones viejas (solo se guardan para deduplicar)
+        self.publication_queue.purge_done(self.config.QUEUE_DONE_RETENTION_DAYS * 86400)
+
+        # Mantener el lease de lo que sigue en la queue (diferido o en backoff)
+        self.heartbeat_leases()
+
         # Obtener noticias pendientes
         noticias = self.fetch_news_to_publish(limit=self.config.MAX_NEWS_PER_CYCLE)
 
@@ -332,16 +634,28 @@ class PublisherService:
         for noticia in noticias:
             # Obtener plataformas seleccionadas por el usuario
             # Si no hay selección, usar todas las disponibles
-            platforms = noticia.get('plataformas_seleccionadas')
-            if platforms:
-                # Filtrar solo las que están disponibles en los adaptadores
-                platforms = [p for p in platforms if p in self.adapters]
-                logger.info(f"📋 Noticia {noticia['id']}: publicar en {platforms}")
-            else:
-                # Si no hay selección, usar todas las disponibles
-                platforms = None
-                logger.info(f"📋 Noticia {noticia['id']}: publicar en todas las plataformas disponibles")
+            platforms = noticia.get('plataformas_seleccionadas') or list(self.adapters)
+
+            # Una noticia con el lease vencido puede venir con plataformas ya publicadas
+            publicadas = [
+                platform for platform, info in (noticia.get('plataformas_publicadas') or {}).items()
+                if info.get('status') == 'success'
+            ]
+            if publicadas:
+                platforms = [p for p in platforms if p not in publicadas]
+                logger.info(f"↪️ Noticia {noticia['id']}: ya publicada en {publicadas}, se omiten")
+
+            # Sin adaptador no hay intento posible: se informa el fallo para que la
+            # noticia llegue a una fase final en lugar de reclamarse una y otra vez
+            for platform in [p for p in platforms if p not in self.adapters]:
+                logger.warning(f"⚠️ Noticia {noticia['id']}: {platform} no disponible en este publisher")
+                self.mark_as_published(noticia_id=noticia['id'], platform=platform,
+                                       error='Plataforma no disponible')
+            platforms = [p for p in platforms if p in self.adapters]
+            if not platforms:
+                continue
 
+            logger.info(f"📋 Noticia {noticia['id']}: publicar en {platforms}")
             self.enqueue_news(noticia, platforms=platforms)
 
         logger.info(f"✅ Ciclo completado - {len(noticias)} noticias en queue")
@@ -357,5 +671,8 @@ class PublisherService:
             'adapters_available': len(self.adapters),
             'platforms': list(self.adapters.keys()),
             'queue_size': self.publication_queue.qsize(),
-            'worker_running': self.worker_thread.is_alive() if self.worker_thread else False
+            'queue': self.publication_queue.get_stats(),
+            'worker_running': any(thread.is_alive() for thread in self.worker_threads),
+            'results_pending': self.result_buffer.qsize(),
+            'rate_limits': self.rate_limiter.get_stats()
         }
@@ -0,0 +1,81 @@
+"""
+Pacing por plataforma: intervalo mínimo entre publicaciones a la misma red
+Reemplaza el time.sleep(2) global entre plataformas
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class PlatformPacer:
+    """
+    Espacia las publicaciones de cada plataforma sin frenar a las demás
+
+    Thread-safe: cada llamada a wait() reserva el próximo turno de la
+    plataforma, así varios threads publicando en paralelo respetan el
+    intervalo entre ellos.
+    """
+
+    def __init__(
+        self,
+        default_interval: float = 2.0,
+        intervals: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            default_interval: Segundos mínimos entre posts a una misma plataforma
+            intervals: Intervalos específicos por plataforma ({'twitter': 5})
+            clock: Reloj monotónico (inyectable para tests)
+            sleep: Función de espera (inyectable para tests)
+        """
+        self.default_interval = default_interval
+        self.intervals = intervals or {}
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def interval_for(self, platform: str) -> float:
+        """Intervalo configurado para la plataforma"""
+        return self.intervals.get(platform, self.default_interval)
+
+    def wait(self, platform: str) -> float:
+        """
+        Bloquea hasta que la plataforma acepte otra publicación
+
+        Args:
+            platform: Nombre de la plataforma
+
+        Returns:
+            Segundos que se esperó
+        """
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot.get(platform, now))
+            self._next_slot[platform] = slot + self.interval_for(platform)
+
+        delay = slot - now
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    @staticmethod
+    def parse_intervals(value: str) -> Dict[str, float]:
+        """
+        Parsea overrides con formato 'twitter:5,linkedin:10'
+
+        Args:
+            value: String de configuración
+
+        Returns:
+            Diccionario {plataforma: segundos}
+        """
+        intervals = {}
+        for part in (value or '').split(','):
+            if ':' not in part:
+                continue
+            platform, seconds = part.split(':', 1)
+            intervals[platform.strip()] = float(seconds)
+        return intervals
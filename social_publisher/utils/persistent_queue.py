@@ -0,0 +1,295 @@
+"""
+Queue de publicación persistente sobre SQLite
+Un mensaje por (noticia, plataforma), con entrega at-least-once: un mensaje
+tomado por un worker queda invisible durante el visibility timeout y, si no se
+confirma (ack) antes, vuelve a estar disponible. Sobrevive reinicios y permite
+varios workers en paralelo
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATUS_READY = 'ready'
+STATUS_DONE = 'done'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS publication_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dedup_key TEXT NOT NULL UNIQUE,
+    noticia_id INTEGER NOT NULL,
+    platform TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'ready',
+    visible_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_publication_queue_ready
+    ON publication_queue(status, visible_at);
+"""
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK: serializa a los workers que escriben"""
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
+
+
+@dataclass
+class QueueMessage:
+    """
+    Mensaje tomado de la queue: publicar una noticia en una plataforma
+    """
+    id: int
+    noticia_id: int
+    platform: str
+    noticia: Dict
+    attempts: int
+
+
+class PersistentQueue:
+    """
+    Queue durable con visibility timeout y dedup por (noticia_id, platform)
+    """
+
+    def __init__(self, path: str, visibility_timeout: float = 300,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path: Archivo SQLite (':memory:' no sirve con varios threads)
+            visibility_timeout: Segundos que un mensaje tomado queda invisible
+            clock: Reloj en segundos epoch (inyectable para tests)
+        """
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self._clock = clock
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(SCHEMA)
+
+    @staticmethod
+    def dedup_key(noticia_id: int, platform: str) -> str:
+        """Clave de dedup: una publicación por noticia y plataforma"""
+        return f"{noticia_id}:{platform}"
+
+    def enqueue(self, noticia: Dict, platforms: Iterable[str], not_before: Optional[float] = None) -> int:
+        """
+        Encola la noticia para cada plataforma (ignora las ya encoladas o publicadas)
+
+        Args:
+            noticia: Datos de la noticia
+            platforms: Plataformas destino
+            not_before: Timestamp (epoch) antes del cual no entregar
+
+        Returns:
+            Cantidad de mensajes nuevos
+        """
+        now = self._clock()
+        payload = json.dumps(noticia, default=str)
+        rows = [
+            (self.dedup_key(noticia['id'], platform), noticia['id'], platform, payload,
+             STATUS_READY, not_before or now, now, now)
+            for platform in platforms
+        ]
+
+        conn = self._conn()
+        with _transaction(conn):
+            before = conn.total_changes
+            conn.executemany(
+                """INSERT OR IGNORE INTO publication_queue
+                   (dedup_key, noticia_id, platform, payload, status, visible_at, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows
+            )
+            return conn.total_changes - before
+
+    def dequeue(self, max_items: int = 10, visibility_timeout: Optional[float] = None) -> List[QueueMessage]:
+        """
+        Toma hasta max_items mensajes visibles y los oculta durante el visibility timeout
+
+        Args:
+            max_items: Máximo de mensajes a tomar
+            visibility_timeout: Override del timeout configurado
+
+        Returns:
+            Lista de mensajes (vacía si no hay)
+        """
+        now = self._clock()
+        invisible_until = now + (visibility_timeout or self.visibility_timeout)
+
+        conn = self._conn()
+        with _transaction(conn):
+            rows = conn.execute(
+                """SELECT id, noticia_id, platform, payload, attempts FROM publication_queue
+                   WHERE status = ? AND visible_at <= ?
+                   ORDER BY visible_at, id LIMIT ?""",
+                (STATUS_READY, now, max_items)
+            ).fetchall()
+
+            if not rows:
+                return []
+
+            ids = [row[0] for row in rows]
+            conn.execute(
+                f"""UPDATE publication_queue
+                    SET visible_at = ?, attempts = attempts + 1, updated_at = ?
+                    WHERE id IN ({','.join('?' * len(ids))})""",
+                [invisible_until, now, *ids]
+            )
+
+        return [
+            QueueMessage(id=row[0], noticia_id=row[1], platform=row[2],
+                         noticia=json.loads(row[3]), attempts=row[4] + 1)
+            for row in rows
+        ]
+
+    def ack(self, ids: Iterable[int]) -> None:
+        """
+        Confirma mensajes entregados; quedan como 'done' para seguir deduplicando
+
+        Args:
+            ids: IDs de los mensajes
+        """
+        self._update_many(ids, "status = ?, payload = '{}', last_error = NULL", [STATUS_DONE])
+
+    def nack(self, message_id: int, delay: float, error: Optional[str] = None) -> None:
+        """
+        Devuelve un mensaje fallido a la queue para reintentarlo más tarde
+
+        Args:
+            message_id: ID del mensaje
+            delay: Segundos hasta que vuelva a ser visible
+            error: Último error
+        """
+        self._update_many([message_id], "visible_at = ?, last_error = ?", [self._clock() + delay, error])
+
+    def defer(self, message_id: int, delay: float) -> None:
+        """
+        Posterga un mensaje que no se intentó (p.ej. sin cupo de rate limit) sin contar el intento
+
+        Args:
+            message_id: ID del mensaje
+            delay: Segundos hasta que vuelva a ser visible
+        """
+        self._update_many([message_id], "visible_at = ?, attempts = MAX(attempts - 1, 0)",
+                          [self._clock() + delay])
+
+    def drop(self, ids: Iterable[int]) -> None:
+        """
+        Elimina mensajes (p.ej. al agotar reintentos) para que puedan volver a encolarse
+
+        Args:
+            ids: IDs de los mensajes
+        """
+        ids = list(ids)
+        if not ids:
+            return
+        conn = self._conn()
+        with _transaction(conn):
+            conn.execute(f"DELETE FROM publication_queue WHERE id IN ({','.join('?' * len(ids))})", ids)
+
+    def pending_noticias(self) -> List[int]:
+        """IDs de noticias con mensajes pendientes (visibles, en vuelo o diferidos)"""
+        return [row[0] for row in self._conn().execute(
+            "SELECT DISTINCT noticia_id FROM publication_queue WHERE status = ? ORDER BY noticia_id",
+            (STATUS_READY,)
+        )]
+
+    def drop_noticias(self, noticia_ids: Iterable[int]) -> int:
+        """
+        Elimina los mensajes pendientes de esas noticias (p.ej. las reclamó otro publisher)
+
+        Returns:
+            Cantidad de mensajes eliminados
+        """
+        noticia_ids = list(noticia_ids)
+        if not noticia_ids:
+            return 0
+        conn = self._conn()
+        with _transaction(conn):
+            return conn.execute(
+                f"""DELETE FROM publication_queue
+                    WHERE status = ? AND noticia_id IN ({','.join('?' * len(noticia_ids))})""",
+                [STATUS_READY, *noticia_ids]
+            ).rowcount
+
+    def purge_done(self, max_age_seconds: float) -> int:
+        """
+        Elimina mensajes confirmados hace más de max_age_seconds
+
+        Returns:
+            Cantidad de mensajes eliminados
+        """
+        conn = self._conn()
+        with _transaction(conn):
+            cursor = conn.execute(
+                "DELETE FROM publication_queue WHERE status = ? AND updated_at < ?",
+                (STATUS_DONE, self._clock() - max_age_seconds)
+            )
+            return cursor.rowcount
+
+    def qsize(self) -> int:
+        """Mensajes pendientes (visibles o en vuelo)"""
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM publication_queue WHERE status = ?", (STATUS_READY,)
+        ).fetchone()[0]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Conteos por estado
+
+        Returns:
+            {'ready': visibles, 'in_flight': tomados o diferidos, 'done': confirmados}
+        """
+        now = self._clock()
+        ready, in_flight, done = self._conn().execute(
+            """SELECT
+                   COALESCE(SUM(status = ? AND visible_at <= ?), 0),
+                   COALESCE(SUM(status = ? AND visible_at > ?), 0),
+                   COALESCE(SUM(status = ?), 0)
+               FROM publication_queue""",
+            (STATUS_READY, now, STATUS_READY, now, STATUS_DONE)
+        ).fetchone()
+        return {'ready': ready, 'in_flight': in_flight, 'done': done}
+
+    def _update_many(self, ids: Iterable[int], assignments: str, params: List) -> None:
+        ids = list(ids)
+        if not ids:
+            return
+        conn = self._conn()
+        with _transaction(conn):
+            conn.execute(
+                f"""UPDATE publication_queue SET {assignments}, updated_at = ?
+                    WHERE id IN ({','.join('?' * len(ids))})""",
+                [*params, self._clock(), *ids]
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        """Una conexión por thread (sqlite3 no comparte conexiones entre threads)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
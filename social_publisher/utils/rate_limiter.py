@@ -0,0 +1,231 @@
+"""
+Rate limiting por plataforma con token buckets
+Configurado con get_rate_limit() de cada adaptador y ajustado con los headers
+de las respuestas (x-rate-limit-remaining, retry-after). El estado se persiste
+en un archivo JSON para que un reinicio no resetee los presupuestos
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Bucket de tokens: capacidad máxima (ráfaga) y recarga continua
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, tokens: Optional[float] = None,
+                 updated_at: float = 0.0, blocked_until: float = 0.0):
+        """
+        Args:
+            capacity: Tokens máximos acumulables
+            refill_rate: Tokens por segundo
+            tokens: Tokens actuales (None = bucket lleno)
+            updated_at: Timestamp (epoch) de la última recarga
+            blocked_until: Timestamp (epoch) hasta el que la plataforma pidió no publicar
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity if tokens is None else min(tokens, capacity)
+        self.updated_at = updated_at
+        self.blocked_until = blocked_until
+
+    def refill(self, now: float) -> None:
+        """Suma los tokens generados desde la última recarga"""
+        if self.updated_at:
+            elapsed = max(0.0, now - self.updated_at)
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """Segundos hasta que haya un token disponible (0 = ya hay)"""
+        self.refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1 - 1e-9:  # Tolerancia a errores de punto flotante en la recarga
+            return 0.0
+        if self.refill_rate <= 0:
+            return float('inf')
+        return (1 - self.tokens) / self.refill_rate
+
+    def to_dict(self) -> Dict:
+        return {
+            'capacity': self.capacity,
+            'refill_rate': self.refill_rate,
+            'tokens': self.tokens,
+            'updated_at': self.updated_at,
+            'blocked_until': self.blocked_until
+        }
+
+
+class RateLimitScheduler:
+    """
+    Un token bucket por plataforma, con estado persistente
+
+    acquire() no bloquea: devuelve cuánto falta para poder publicar, así el
+    llamador puede diferir ese post y seguir con otros.
+    """
+
+    def __init__(self, state_file: Optional[str] = None, burst: int = 5,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            state_file: Archivo JSON donde persistir el estado (None = solo memoria)
+            burst: Posts máximos seguidos por plataforma antes de depender de la recarga
+            clock: Reloj en segundos epoch (inyectable para tests)
+        """
+        self.state_file = state_file
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._saved_state = self._load()
+
+    def configure(self, platform: str, rate_limit: Dict) -> TokenBucket:
+        """
+        Crea el bucket de una plataforma a partir de get_rate_limit()
+
+        La recarga reparte 'limit' en la ventana hasta 'reset_at' (p.ej.
+        1500/mes en Twitter). Si había estado guardado, se conservan los
+        tokens restantes y el bloqueo pendiente.
+
+        Args:
+            platform: Nombre de la plataforma
+            rate_limit: {'limit': int, 'remaining': int, 'reset_at': datetime}
+
+        Returns:
+            El bucket configurado
+        """
+        now = self._clock()
+        limit = max(1, int(rate_limit.get('limit') or 1))
+        reset_at = rate_limit.get('reset_at')
+        window = (reset_at - datetime.utcnow()).total_seconds() if isinstance(reset_at, datetime) else 86400
+        window = max(window, 60)
+
+        capacity = float(min(limit, self.burst))
+        refill_rate = limit / window
+
+        saved = self._saved_state.get(platform, {})
+        remaining = rate_limit.get('remaining')
+        tokens = saved.get('tokens', capacity)
+        if remaining is not None:
+            tokens = min(tokens, float(remaining))
+
+        bucket = TokenBucket(
+            capacity=capacity,
+            refill_rate=refill_rate,
+            tokens=tokens,
+            updated_at=saved.get('updated_at', now),
+            blocked_until=saved.get('blocked_until', 0.0)
+        )
+
+        with self._lock:
+            self.buckets[platform] = bucket
+            self._save()
+
+        logger.info(f"🪣 {platform}: {limit} posts cada {window / 3600:.0f}h "
+                   f"(ráfaga {capacity:.0f}, {bucket.tokens:.1f} tokens disponibles)")
+        return bucket
+
+    def acquire(self, platform: str) -> float:
+        """
+        Intenta consumir un token de la plataforma
+
+        Args:
+            platform: Nombre de la plataforma
+
+        Returns:
+            0 si se consumió el token; si no, segundos a esperar antes de reintentar
+        """
+        with self._lock:
+            bucket = self.buckets.get(platform)
+            if bucket is None:
+                return 0.0
+
+            wait = bucket.wait_time(self._clock())
+            if wait == 0:
+                bucket.tokens = max(0.0, bucket.tokens - 1)
+            self._save()
+            return wait
+
+    def update_from_result(self, platform: str, result) -> None:
+        """
+        Ajusta el bucket con la información de rate limit de la respuesta
+
+        Args:
+            platform: Nombre de la plataforma
+            result: PostResult con rate_limit_remaining / rate_limit_reset / retry_after
+        """
+        remaining = getattr(result, 'rate_limit_remaining', None)
+        reset = getattr(result, 'rate_limit_reset', None)
+        retry_after = getattr(result, 'retry_after', None)
+
+        if remaining is None and retry_after is None:
+            return
+
+        with self._lock:
+            bucket = self.buckets.get(platform)
+            if bucket is None:
+                return
+
+            now = self._clock()
+            bucket.refill(now)
+
+            if remaining is not None:
+                bucket.tokens = min(bucket.tokens, float(remaining))
+                if remaining <= 0 and isinstance(reset, datetime):
+                    bucket.blocked_until = max(bucket.blocked_until, now + (reset - datetime.utcnow()).total_seconds())
+
+            if retry_after is not None:
+                bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+                logger.warning(f"⏳ {platform}: la plataforma pidió esperar {retry_after:.0f}s")
+
+            self._save()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Estado actual de los buckets
+
+        Returns:
+            {plataforma: {'tokens': float, 'wait_seconds': float}}
+        """
+        with self._lock:
+            now = self._clock()
+            return {
+                platform: {'tokens': round(bucket.tokens, 2), 'wait_seconds': round(bucket.wait_time(now), 1)}
+                for platform, bucket in self.buckets.items()
+            }
+
+    def _load(self) -> Dict[str, Dict]:
+        """Lee el estado guardado (vacío si no existe o está corrupto)"""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ No se pudo leer el estado de rate limits ({self.state_file}): {e}")
+            return {}
+
+    def _save(self) -> None:
+        """Escribe el estado de forma atómica (llamar con el lock tomado)"""
+        if not self.state_file:
+            return
+
+        state = {platform: bucket.to_dict() for platform, bucket in self.buckets.items()}
+        try:
+            directory = os.path.dirname(self.state_file) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.rate_limits')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            logger.warning(f"⚠️ No se pudo guardar el estado de rate limits: {e}")
@@ -0,0 +1,143 @@
+"""
+Buffer de resultados de publicación hacia WebIAScraper
+Junta los mark-published de todas las plataformas y los envía en lote
+(POST /api/news/mark-published-batch) cada pocos segundos, en lugar de
+un request y un commit por (noticia, plataforma). Los resultados se guardan
+en SQLite (el mismo archivo de la queue persistente) y solo se borran cuando
+el lote se aplicó: un reinicio dentro de la ventana de flush no los pierde
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class ResultBuffer:
+    """
+    Acumula resultados y los envía con un flush periódico
+
+    Thread-safe: los workers de publicación llaman a add() en paralelo y un
+    thread propio hace flush cada `flush_interval` segundos, o antes si se
+    juntan `max_batch` resultados. Si el envío falla, el lote queda guardado
+    y se reintenta en el próximo flush, en el mismo orden.
+    """
+
+    def __init__(
+        self,
+        sender: Callable[[List[Dict]], bool],
+        flush_interval: float = 2.0,
+        max_batch: int = 50,
+        path: str = ':memory:'
+    ):
+        """
+        Args:
+            sender: Envía un lote; devuelve False si hay que reintentarlo
+            flush_interval: Segundos máximos que un resultado espera en el buffer
+            max_batch: Resultados por request
+            path: Archivo SQLite donde persisten los pendientes (':memory:' = sin persistencia)
+        """
+        self.sender = sender
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, max_batch)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # Una sola conexión compartida, serializada con self._lock
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+
+        pendientes = self.qsize()
+        if pendientes:
+            logger.info(f"💾 {pendientes} resultados de publicación pendientes de enviar")
+
+    def add(self, result: Dict):
+        """Guardar un resultado; despierta el flush si ya hay un lote completo"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO pending_results (payload, created_at) VALUES (?, ?)",
+                (json.dumps(result, default=str), time.time())
+            )
+            full = self._count() >= self.max_batch
+        if full:
+            self._wake.set()
+
+    def qsize(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def flush(self) -> int:
+        """
+        Enviar todo lo pendiente en lotes de `max_batch`
+
+        Returns:
+            Cantidad de resultados enviados
+        """
+        sent = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    rows = self._conn.execute(
+                        "SELECT id, payload FROM pending_results ORDER BY id LIMIT ?",
+                        (self.max_batch,)
+                    ).fetchall()
+                if not rows:
+                    return sent
+
+                try:
+                    ok = self.sender([json.loads(payload) for _, payload in rows])
+                except Exception as e:
+                    logger.error(f"Error enviando lote de resultados: {e}")
+                    ok = False
+
+                if not ok:
+                    # Queda guardado: se reintenta en el próximo flush
+                    return sent
+
+                ids = [row_id for row_id, _ in rows]
+                with self._lock:
+                    self._conn.execute(
+                        f"DELETE FROM pending_results WHERE id IN ({','.join('?' * len(ids))})", ids
+                    )
+                sent += len(ids)
+
+    def start(self):
+        """Iniciar el thread de flush periódico"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='result-buffer', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+        """Detener el thread y hacer un último flush"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        self.flush()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM pending_results").fetchone()[0]
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
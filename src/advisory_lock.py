@@ -0,0 +1,60 @@
+"""
+Locks de aplicación entre procesos con pg_try_advisory_lock
+Garantizan que una tarea (p.ej. el scraping) corra en una sola instancia
+aunque la disparen el scheduler y /scrape/manual desde varios workers
+"""
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from sqlalchemy import text
+
+from src.models import db
+
+SCRAPE_LOCK = 'webiascrap:scrape_news'
+
+# Fuera de PostgreSQL (SQLite en tests/desarrollo) solo hay exclusión dentro del proceso
+_local_locks: Dict[str, threading.Lock] = {}
+_local_locks_guard = threading.Lock()
+
+
+def lock_key(name: str) -> int:
+    """Clave bigint estable para pg_advisory_lock a partir de un nombre"""
+    digest = hashlib.sha256(name.encode()).digest()
+    return int.from_bytes(digest[:8], 'big', signed=True)
+
+
+@contextmanager
+def advisory_lock(name: str) -> Iterator[bool]:
+    """
+    Intenta tomar el lock sin esperar (requiere app context)
+
+    Usa una conexión propia con un lock de sesión: si el proceso muere, al
+    cerrarse la conexión PostgreSQL libera el lock solo.
+
+    Args:
+        name: Nombre del lock
+
+    Yields:
+        True si se tomó el lock, False si lo tiene otra instancia
+    """
+    if db.engine.dialect.name != 'postgresql':
+        with _local_locks_guard:
+            lock = _local_locks.setdefault(name, threading.Lock())
+        acquired = lock.acquire(blocking=False)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                lock.release()
+        return
+
+    key = lock_key(name)
+    with db.engine.connect() as conn:
+        acquired = bool(conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {'key': key}).scalar())
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': key})
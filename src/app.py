@@ -5,24 +5,27 @@ import logging
 import sys
 import os
 from datetime import datetime
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
 from flask_wtf.csrf import CSRFProtect
 from flask_cors import CORS
 from flask_httpauth import HTTPBasicAuth
 from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import text
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy import case, func, text
+from sqlalchemy.orm import selectinload
 
 # Agregar el directorio raíz al path
 sys.path.insert(0, '/app')
 
 from config.settings import get_config
-from src.models import db, init_db, Noticia, APublicar, User
-from src.news_scraper import NewsScraper
-from src.technical_sources_scraper import TechnicalSourcesScraper
-from src.social_media_processor import SocialMediaProcessor
+from src.models import db, init_db, Noticia, APublicar, User, FeedState, ProcessingJob
 from src.password_validator import validate_password, get_password_requirements
+from src.retention import prune_noticias
+from src import job_queue, publication_lease, publication_results
+from src.work_notifier import notifier, wait_for_ready
+from src.pagination import keyset_page, parse_page_size
+from src.credential_cache import CredentialCache
+from src.advisory_lock import advisory_lock, SCRAPE_LOCK
 
 # Configurar logging
 logging.basicConfig(
@@ -56,7 +59,8 @@ CORS(app, resources={
             "https://www.schaller-ponce.com.ar"
         ],
         "methods": ["GET", "POST", "OPTIONS"],
-        "allow_headers": ["Content-Type"]
+        "allow_headers": ["Content-Type"],
+        "expose_headers": ["X-Next-Cursor", "Link"]  # Paginación de /api/apublicar
     }
 })
 
@@ -66,11 +70,40 @@ init_db(app)
 
 # Inicializar autenticación HTTP Basic
 auth = HTTPBasicAuth()
+credential_cache = CredentialCache.from_config(app.config)
 
-@auth.verify_password
-def verify_password(username, password):
+
+def _session_user(username):
     """
-    Verificar credenciales de acceso
+    Usuario de la sesión firmada, si AUTH_SESSION_ENABLED y no venció
+
+    Si el navegador manda credenciales de otro usuario, la sesión no aplica.
+    Tampoco si la contraseña cambió desde el login (ver User.credential_version):
+    la cookie firmada no se puede revocar de otra forma.
+    """
+    if not app.config.get('AUTH_SESSION_ENABLED'):
+        return None
+
+    session_user = session.get('auth_user')
+    if not session_user or (username and username != session_user):
+        return None
+
+    max_age = app.config.get('AUTH_SESSION_MAX_AGE_SECONDS', 3600)
+    if datetime.utcnow().timestamp() - session.get('auth_at', 0) > max_age:
+        session.pop('auth_user', None)
+        return None
+
+    user = User.query.filter_by(username=session_user).first()
+    if not user or user.credential_version() != session.get('auth_ver'):
+        session.pop('auth_user', None)
+        return None
+
+    return session_user
+
+
+def _check_credentials(username, password):
+    """
+    Verificación completa (consulta + check_password_hash)
     Prioridad: 1) Base de datos, 2) Variables de entorno (fallback)
     """
     # Try database first
@@ -94,6 +127,35 @@ def verify_password(username, password):
 
     return None
 
+
+@auth.verify_password
+def verify_password(username, password):
+    """
+    Verificar credenciales de acceso
+    El hash de la contraseña se paga una vez por TTL del cache (o por sesión),
+    no en cada request
+    """
+    session_user = _session_user(username)
+    if session_user:
+        return session_user
+
+    if not username:
+        return None
+
+    verified = credential_cache.get(username, password)
+    if not verified:
+        verified = _check_credentials(username, password)
+        if verified:
+            credential_cache.store(username, password)
+
+    if verified and app.config.get('AUTH_SESSION_ENABLED'):
+        user = User.query.filter_by(username=verified).first()
+        session['auth_user'] = verified
+        session['auth_at'] = datetime.utcnow().timestamp()
+        session['auth_ver'] = user.credential_version() if user else None
+
+    return verified
+
 # Scheduler para scraping automático
 scheduler = BackgroundScheduler()
 
@@ -102,92 +164,100 @@ def scrape_and_save_news():
     """
     Función que ejecuta el scraping y guarda las noticias en la BD
     Combina NewsAPI y fuentes técnicas especializadas
+
+    Corre detrás de un advisory lock: si otra instancia (scheduler o
+    /scrape/manual en otro worker) ya está scrapeando, no hace nada.
+
+    Returns:
+        False si se omitió porque ya había un scraping en curso
     """
     with app.app_context():
-        try:
-            logger.info("🔍 Iniciando scraping de noticias...")
-            all_noticias = []
-
-            # 1. Scraping desde NewsAPI (fuentes generales)
-            api_key = app.config.get('NEWSAPI_KEY')
-            if api_key and api_key != 'your-newsapi-key-here':
-                logger.info("📰 Scraping desde NewsAPI...")
-                scraper = NewsScraper(
-                    api_key=api_key,
-                    keywords=app.config.get('NEWS_KEYWORDS', []),
-                    sources=app.config.get('NEWS_SOURCES', None)
-                )
-                noticias_newsapi = scraper.fetch_news(max_results=15)
-                all_noticias.extend(noticias_newsapi)
-                logger.info(f"✓ NewsAPI: {len(noticias_newsapi)} noticias obtenidas")
-            else:
-                logger.warning("⚠️ NewsAPI key no configurada. Saltando NewsAPI.")
-
-            # 2. Scraping desde fuentes técnicas (RSS)
-            logger.info("🔬 Scraping desde fuentes técnicas...")
-            # sources=None usa TODAS las fuentes configuradas en TechnicalSourcesScraper
-            technical_scraper = TechnicalSourcesScraper(
-                sources=None,  # Usar todas las fuentes disponibles (18 fuentes)
-                days_back=7
+        with advisory_lock(SCRAPE_LOCK) as acquired:
+            if not acquired:
+                logger.info("⏭️ Scraping ya en curso en otra instancia, se omite")
+                return False
+            _scrape_and_save_news()
+        return True
+
+
+def _scrape_and_save_news():
+    """Scraping + guardado (dentro de app context y con el lock tomado)"""
+    # Import diferido: newsapi, nltk y feedparser solo los necesita el scraping
+    from src.news_scraper import NewsScraper
+    from src.technical_sources_scraper import TechnicalSourcesScraper
+    from src.topic_tagger import get_tagger
+
+    try:
+        logger.info("🔍 Iniciando scraping de noticias...")
+        all_noticias = []
+        tagger = get_tagger(app.config.get('TOPICS_FILE'))  # Compilado una vez por proceso
+
+        # 1. Scraping desde NewsAPI (fuentes generales)
+        api_key = app.config.get('NEWSAPI_KEY')
+        if api_key and api_key != 'your-newsapi-key-here':
+            logger.info("📰 Scraping desde NewsAPI...")
+            scraper = NewsScraper(
+                api_key=api_key,
+                keywords=app.config.get('NEWS_KEYWORDS', []),
+                sources=app.config.get('NEWS_SOURCES', None),
+                tagger=tagger
             )
-            noticias_tecnicas = technical_scraper.fetch_all_sources(max_per_source=5)
-            all_noticias.extend(noticias_tecnicas)
-            logger.info(f"✓ Fuentes técnicas: {len(noticias_tecnicas)} artículos obtenidos")
-
-            if not all_noticias:
-                logger.warning("⚠️ No se encontraron noticias en ninguna fuente")
-                return
-
-            # Guardar en base de datos
-            nuevas = 0
-            duplicadas = 0
-
-            for noticia_data in all_noticias:
-                try:
-                    # Verificar si ya existe por URL
-                    existe = Noticia.query.filter_by(url=noticia_data['url']).first()
-                    if existe:
-                        duplicadas += 1
-                        continue
-
-                    # Crear nueva noticia
-                    noticia = Noticia(
-                        titulo=noticia_data['titulo'],
-                        texto=noticia_data['texto'],
-                        url=noticia_data['url'],
-                        fecha_hora=noticia_data['fecha_hora'],
-                        temas=noticia_data['temas']
-                    )
-
-                    db.session.add(noticia)
-                    nuevas += 1
-
-                except Exception as e:
-                    logger.error(f"Error guardando noticia: {e}")
-                    continue
-
-            # Commit de todas las noticias
+            noticias_newsapi = scraper.fetch_news(max_results=15)
+            all_noticias.extend(noticias_newsapi)
+            logger.info(f"✓ NewsAPI: {len(noticias_newsapi)} noticias obtenidas")
+        else:
+            logger.warning("⚠️ NewsAPI key no configurada. Saltando NewsAPI.")
+
+        # 2. Scraping desde fuentes técnicas (RSS)
+        logger.info("🔬 Scraping desde fuentes técnicas...")
+        # sources=None usa TODAS las fuentes configuradas en TechnicalSourcesScraper
+        technical_scraper = TechnicalSourcesScraper(
+            sources=None,  # Usar todas las fuentes disponibles (18 fuentes)
+            days_back=7,
+            max_workers=app.config.get('FEED_MAX_WORKERS', 8),
+            per_host_limit=app.config.get('FEED_PER_HOST_LIMIT', 2),
+            feed_timeout=app.config.get('FEED_TIMEOUT_SECONDS', 15),
+            total_deadline=app.config.get('FEED_TOTAL_DEADLINE_SECONDS', 60),
+            feed_state=FeedState.load_states(),  # Validadores para GET condicional
+            tagger=tagger
+        )
+        noticias_tecnicas = technical_scraper.fetch_all_sources(max_per_source=5)
+        all_noticias.extend(noticias_tecnicas)
+        logger.info(f"✓ Fuentes técnicas: {len(noticias_tecnicas)} artículos obtenidos")
+
+        if not all_noticias:
+            # Guardar validadores igual: los feeds sin cambios también los actualizan
+            FeedState.save_states(technical_scraper.feed_state)
             db.session.commit()
+            logger.warning("⚠️ No se encontraron noticias en ninguna fuente")
+            return
 
-            # Mantener solo las últimas 30 noticias
-            total_noticias = Noticia.query.count()
-            if total_noticias > app.config.get('MAX_NEWS_COUNT', 30):
-                # Obtener las más antiguas y eliminarlas
-                antiguas = Noticia.query.order_by(Noticia.fecha_hora.asc()).limit(
-                    total_noticias - app.config.get('MAX_NEWS_COUNT', 30)
-                ).all()
+        # Guardar en base de datos (un solo INSERT ... ON CONFLICT DO NOTHING)
+        resultado = Noticia.bulk_insert(all_noticias)
+        nuevas = resultado['insertadas']
+        duplicadas = resultado['duplicadas']
+        if resultado['invalidas']:
+            logger.warning(f"⚠️ {resultado['invalidas']} noticias omitidas por campos faltantes")
 
-                for antigua in antiguas:
-                    db.session.delete(antigua)
+        # Guardar validadores de feeds junto con las noticias (mismo commit)
+        FeedState.save_states(technical_scraper.feed_state)
 
-                db.session.commit()
-                logger.info(f"🗑️ Eliminadas {len(antiguas)} noticias antiguas")
+        # Commit de todas las noticias
+        db.session.commit()
+
+        # Retención: un único DELETE set-based (opcionalmente archivando)
+        prune_noticias(
+            max_count=app.config.get('MAX_NEWS_COUNT', 30),
+            max_age_days=app.config.get('MAX_NEWS_AGE_DAYS', 0),
+            archive=app.config.get('NEWS_ARCHIVE_ENABLED', False)
+        )
+        db.session.commit()
 
-            logger.info(f"✅ Scraping completado: {nuevas} nuevas, {duplicadas} duplicadas")
+        logger.info(f"✅ Scraping completado: {nuevas} nuevas, {duplicadas} duplicadas")
 
-        except Exception as e:
-            logger.error(f"❌ Error en scraping: {e}")
-            db.session.rollback()
+    except Exception as e:
+        logger.error(f"❌ Error en scraping: {e}")
+        db.session.rollback()
 
 
 @app.route('/')
@@ -218,9 +288,49 @@ def lista_apublicar():
     """
     Ver lista de noticias seleccionadas para publicar
     Requiere autenticación HTTP Basic
+
+    Query params:
+        - cursor: token de la página siguiente (paginación por selected_at, id)
+        - limit: tamaño de página (tope PAGE_SIZE_MAX)
     """
-    noticias = APublicar.query.order_by(APublicar.selected_at.desc()).all()
-    return render_template('apublicar.html', noticias=noticias)
+    limit = parse_page_size(
+        request.args.get('limit'),
+        default=app.config.get('PAGE_SIZE_DEFAULT', 50),
+        maximum=app.config.get('PAGE_SIZE_MAX', 200)
+    )
+    # keyset_page no admite NULL en la columna de orden (el cursor no podría codificarlo)
+    query = APublicar.query.options(
+        selectinload(APublicar.attempts)
+    ).filter(
+        APublicar.selected_at.isnot(None)
+    )
+
+    try:
+        page = keyset_page(query, APublicar.selected_at, APublicar.id, limit, request.args.get('cursor'))
+    except ValueError:
+        flash('El enlace de paginación no es válido, mostrando la primera página', 'warning')
+        return redirect(url_for('lista_apublicar'))
+
+    return render_template(
+        'apublicar.html',
+        noticias=page.items,
+        stats=_apublicar_stats(),
+        next_cursor=page.next_cursor,
+        limit=limit
+    )
+
+
+def _apublicar_stats():
+    """Totales de apublicar con una sola consulta agregada (sin cargar filas)"""
+    total, procesadas = db.session.query(
+        func.count(APublicar.id),
+        func.count(case((APublicar.procesado == True, 1)))  # noqa: E712
+    ).one()
+    return {
+        'total': total or 0,
+        'procesadas': procesadas or 0,
+        'pendientes': (total or 0) - (procesadas or 0)
+    }
 
 
 @app.route('/apublicar/eliminar/<int:noticia_id>', methods=['POST'])
@@ -311,8 +421,10 @@ def scrape_manual():
     Requiere autenticación HTTP Basic
     """
     try:
-        scrape_and_save_news()
-        flash('✅ Scraping ejecutado correctamente', 'success')
+        if scrape_and_save_news():
+            flash('✅ Scraping ejecutado correctamente', 'success')
+        else:
+            flash('⏳ Ya hay un scraping en curso. Intenta de nuevo en unos minutos.', 'info')
     except Exception as e:
         logger.error(f"Error en scraping manual: {e}")
         flash(f'❌ Error en scraping: {str(e)}', 'error')
@@ -355,12 +467,37 @@ def api_noticias():
 def api_apublicar():
     """
     API endpoint para obtener noticias a publicar en formato JSON
-    Devuelve últimas 30 noticias procesadas ordenadas por fecha de procesamiento
+    Devuelve noticias procesadas ordenadas por fecha de procesamiento (más recientes primero)
+
+    Query params:
+        - cursor: token de la página siguiente
+        - limit: tamaño de página (default 30, tope PAGE_SIZE_MAX)
+
+    El cuerpo sigue siendo una lista; el cursor de la página siguiente viaja en
+    el header X-Next-Cursor (y en Link rel="next") para no romper a los clientes.
     """
-    noticias = APublicar.query.filter(
+    limit = parse_page_size(
+        request.args.get('limit'),
+        default=30,
+        maximum=app.config.get('PAGE_SIZE_MAX', 200)
+    )
+    query = APublicar.query.options(
+        selectinload(APublicar.attempts)
+    ).filter(
         APublicar.processed_at.isnot(None)
-    ).order_by(APublicar.processed_at.desc()).limit(30).all()
-    return jsonify([noticia.to_dict() for noticia in noticias])
+    )
+
+    try:
+        page = keyset_page(query, APublicar.processed_at, APublicar.id, limit, request.args.get('cursor'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    response = jsonify([noticia.to_dict() for noticia in page.items])
+    if page.next_cursor:
+        next_url = url_for('api_apublicar', cursor=page.next_cursor, limit=limit)
+        response.headers['X-Next-Cursor'] = page.next_cursor
+        response.headers['Link'] = f'<{next_url}>; rel="next"'
+    return response
 
 
 @app.route('/apublicar-data')
@@ -368,25 +505,20 @@ def apublicar_data():
     """
     API endpoint para obtener estadísticas de procesamiento (para contador en tiempo real)
     """
-    noticias = APublicar.query.all()
-    total = len(noticias)
-    procesadas = sum(1 for n in noticias if n.procesado)
-    pendientes = total - procesadas
-
-    return jsonify({
-        'total': total,
-        'procesadas': procesadas,
-        'pendientes': pendientes
-    })
+    return jsonify(_apublicar_stats())
 
 
 @app.route('/apublicar/procesar/<int:noticia_id>', methods=['POST'])
 @auth.login_required
 def procesar_noticia(noticia_id):
     """
-    Procesar una noticia individual para RRSS (traducción + optimización)
+    Encolar el procesamiento de una noticia para RRSS (traducción + optimización)
+    Lo ejecuta el worker (src/worker.py); el request responde al instante.
+    Con Accept: application/json responde 202 con el job id.
     Requiere autenticación HTTP Basic
     """
+    wants_json = request.accept_mimetypes.best == 'application/json'
+
     try:
         # Obtener plataformas seleccionadas del formulario
         plataformas_seleccionadas = request.form.getlist('platforms')
@@ -405,23 +537,34 @@ def procesar_noticia(noticia_id):
         # Verificar que tengamos la API key de Anthropic
         anthropic_key = app.config.get('ANTHROPIC_API_KEY')
         if not anthropic_key:
+            if wants_json:
+                return jsonify({'error': 'API key de Anthropic no configurada'}), 500
             flash('❌ API key de Anthropic no configurada', 'error')
             return redirect(url_for('lista_apublicar'))
 
-        # Crear procesador
-        processor = SocialMediaProcessor(anthropic_api_key=anthropic_key)
+        # Encolar para el worker
+        job = job_queue.enqueue(
+            job_queue.JOB_PROCESS_ITEM,
+            {'noticia_id': noticia_id},
+            max_attempts=app.config.get('JOB_MAX_ATTEMPTS', 3)
+        )
+        db.session.commit()
 
-        # Procesar noticia
-        success = processor.process_item(noticia_id)
+        if wants_json:
+            return jsonify({
+                'job_id': job.id,
+                'status': job.status,
+                'status_url': url_for('api_job_status', job_id=job.id)
+            }), 202
 
-        if success:
-            plataformas_str = ', '.join(plataformas_seleccionadas)
-            flash(f'✅ Noticia procesada exitosamente. Se publicará en: {plataformas_str}', 'success')
-        else:
-            flash('❌ Error al procesar la noticia', 'error')
+        plataformas_str = ', '.join(plataformas_seleccionadas)
+        flash(f'⏳ Noticia en cola de procesamiento (job #{job.id}). Se publicará en: {plataformas_str}', 'success')
 
     except Exception as e:
-        logger.error(f"Error procesando noticia {noticia_id}: {e}")
+        logger.error(f"Error encolando noticia {noticia_id}: {e}")
+        db.session.rollback()
+        if wants_json:
+            return jsonify({'error': str(e)}), 500
         flash(f'❌ Error: {str(e)}', 'error')
 
     return redirect(url_for('lista_apublicar'))
@@ -431,7 +574,8 @@ def procesar_noticia(noticia_id):
 @auth.login_required
 def procesar_todas():
     """
-    Procesar todas las noticias pendientes (no procesadas) para RRSS
+    Encolar el procesamiento de todas las noticias pendientes (no procesadas) para RRSS
+    Lo ejecuta el worker (src/worker.py); el request responde al instante.
     Requiere autenticación HTTP Basic
     """
     try:
@@ -441,31 +585,42 @@ def procesar_todas():
             flash('❌ API key de Anthropic no configurada', 'error')
             return redirect(url_for('lista_apublicar'))
 
-        # Crear procesador
-        processor = SocialMediaProcessor(anthropic_api_key=anthropic_key)
-
         # Obtener límite del request (opcional)
         limit = request.form.get('limit', type=int)
 
-        # Procesar pendientes
-        stats = processor.process_all_pending(limit=limit)
-
-        # Mensaje de resultado
-        msg = f"✅ Procesamiento completado: {stats['exitosos']} exitosos"
-        if stats['fallidos'] > 0:
-            msg += f", {stats['fallidos']} fallidos"
-        if stats['ya_procesados'] > 0:
-            msg += f", {stats['ya_procesados']} ya procesados"
+        # Encolar para el worker (traduce varios items en paralelo)
+        job = job_queue.enqueue(
+            job_queue.JOB_PROCESS_ALL_PENDING,
+            {'limit': limit},
+            max_attempts=app.config.get('JOB_MAX_ATTEMPTS', 3)
+        )
+        db.session.commit()
 
-        flash(msg, 'success' if stats['fallidos'] == 0 else 'warning')
+        flash(f'⏳ Procesamiento de pendientes en cola (job #{job.id})', 'success')
 
     except Exception as e:
-        logger.error(f"Error procesando todas las noticias: {e}")
+        logger.error(f"Error encolando procesamiento de todas las noticias: {e}")
+        db.session.rollback()
         flash(f'❌ Error: {str(e)}', 'error')
 
     return redirect(url_for('lista_apublicar'))
 
 
+@app.route('/api/jobs/<int:job_id>')
+@auth.login_required
+def api_job_status(job_id):
+    """
+    Estado de un job de procesamiento (pending, running, done, dead)
+    Requiere autenticación HTTP Basic
+    """
+    job = db.session.get(ProcessingJob, job_id)
+
+    if not job:
+        return jsonify({'error': 'Job no encontrado'}), 404
+
+    return jsonify(job.to_dict())
+
+
 @app.route('/publicar-seleccionadas', methods=['POST'])
 @csrf.exempt  # Para llamadas desde social_publisher
 def publicar_seleccionadas():
@@ -473,7 +628,8 @@ def publicar_seleccionadas():
     Publicar noticias seleccionadas en plataformas elegidas
 
     NO procesa con Claude - solo publica
-    Noticias deben estar en fase 'procesado' o superior
+    Noticias deben estar procesadas. Quedan en fase 'procesado' con las plataformas
+    elegidas y SocialPublisher las reclama con POST /api/news/claim
 
     Request JSON:
     {
@@ -528,28 +684,36 @@ def publicar_seleccionadas():
                 resultados[str(noticia_id)] = {"error": "Noticia no procesada con Claude"}
                 continue
 
-            # Actualizar fase y plataformas seleccionadas
-            noticia.fase = 'publicando'
-            noticia.plataformas_seleccionadas = platforms
-            noticia.ultimo_intento = datetime.utcnow()
+            # Si un publisher la tiene reclamada, cambiarle las plataformas la publicaría dos veces
+            if publication_lease.is_leased(noticia):
+                resultados[str(noticia_id)] = {"error": "La noticia ya se está publicando"}
+                continue
 
-            # Inicializar plataformas_publicadas si no existe
-            if not noticia.plataformas_publicadas:
-                noticia.plataformas_publicadas = {}
+            # Las plataformas donde ya se publicó no se vuelven a intentar
+            publicadas = publication_results.platform_statuses(noticia.id, platforms)
+            pendientes = [p for p in platforms if publicadas.get(p) != publication_results.STATUS_SUCCESS]
+            if not pendientes:
+                resultados[str(noticia_id)] = {"error": "Ya publicada en las plataformas elegidas"}
+                continue
 
-            # Marcar plataformas como pendientes
-            for platform in platforms:
-                if platform not in noticia.plataformas_publicadas:
-                    noticia.plataformas_publicadas[platform] = {}
+            # Queda lista para que SocialPublisher la reclame (claim la pasa a 'publicando')
+            noticia.fase = 'procesado'
+            noticia.plataformas_seleccionadas = platforms
+            noticia.claimed_by = None
+            noticia.lease_expires_at = None
+            noticia.ultimo_intento = datetime.utcnow()
 
-                noticia.plataformas_publicadas[platform]['status'] = 'pending'
-                noticia.plataformas_publicadas[platform]['intentos'] = 0
+            # Marcar plataformas como pendientes (un intento 'pending' por plataforma)
+            publication_results.record_pending(noticia, pendientes)
 
             db.session.commit()
 
             logger.info(f"Noticia {noticia_id} marcada para publicación en: {platforms}")
             resultados[str(noticia_id)] = {"queued": True, "platforms": platforms}
 
+        if any(r.get('queued') for r in resultados.values()):
+            notifier.notify()
+
         return jsonify({
             'success': True,
             'resultados': resultados
@@ -627,6 +791,7 @@ def export_social_media():
         solo_procesados = request.args.get('procesados', 'true').lower() == 'true'
 
         # Crear procesador
+        from src.social_media_processor import SocialMediaProcessor
         anthropic_key = app.config.get('ANTHROPIC_API_KEY')
         processor = SocialMediaProcessor(anthropic_api_key=anthropic_key)
 
@@ -682,6 +847,7 @@ def stats_processing():
     Obtener estadísticas de procesamiento de RRSS
     """
     try:
+        from src.social_media_processor import SocialMediaProcessor
         anthropic_key = app.config.get('ANTHROPIC_API_KEY')
         processor = SocialMediaProcessor(anthropic_api_key=anthropic_key)
 
@@ -724,7 +890,9 @@ def api_news_to_publish():
             query = query.filter_by(procesado=True)
 
         # Ordenar por fecha de selección y limitar
-        noticias = query.order_by(APublicar.selected_at.asc()).limit(limit).all()
+        noticias = query.options(
+            selectinload(APublicar.attempts)
+        ).order_by(APublicar.selected_at.asc()).limit(limit).all()
 
         return jsonify({
             'count': len(noticias),
@@ -736,6 +904,134 @@ def api_news_to_publish():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/news/claim', methods=['POST'])
+@csrf.exempt
+def api_claim_news():
+    """
+    Reclamar noticias para publicar (varias réplicas de SocialPublisher sin duplicados)
+
+    Pasa atómicamente noticias de fase 'procesado' a 'publicando' con un lease.
+    Las reclamadas cuyo lease venció sin confirmar se vuelven a entregar.
+
+    Body JSON:
+    {
+        "publisher_id": "publisher-1:42",
+        "limit": 5,
+        "lease_seconds": 1800,  # opcional
+        "platforms": ["telegram", "bluesky"]  # opcional, para noticias sin selección
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    publisher_id = data.get('publisher_id')
+    if not publisher_id:
+        return jsonify({'error': 'publisher_id es requerido'}), 400
+
+    try:
+        limit = max(int(data.get('limit', 10)), 1)
+        max_lease = app.config.get('PUBLICATION_LEASE_SECONDS', 1800)
+        lease_seconds = min(max(int(data.get('lease_seconds', max_lease)), 1), max_lease)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'limit y lease_seconds deben ser enteros'}), 400
+
+    try:
+        noticias = publication_lease.claim(
+            publisher_id,
+            limit=limit,
+            lease_seconds=lease_seconds,
+            platforms=data.get('platforms')
+        )
+
+        return jsonify({
+            'count': len(noticias),
+            'noticias': [noticia.to_dict() for noticia in noticias]
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Error reclamando noticias para {publisher_id}: {e}")
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/news/lease-heartbeat', methods=['POST'])
+@csrf.exempt
+def api_lease_heartbeat():
+    """
+    Extender el lease de las noticias que un publisher todavía tiene en su queue
+
+    Body JSON:
+    {
+        "publisher_id": "publisher-1:42",
+        "noticia_ids": [12, 15]
+    }
+
+    Response JSON:
+    {
+        "renewed": [12],
+        "lost": [15]  # Las tiene otro publisher: descartarlas de la queue
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    publisher_id = data.get('publisher_id')
+    noticia_ids = data.get('noticia_ids')
+    if not publisher_id:
+        return jsonify({'error': 'publisher_id es requerido'}), 400
+    if not isinstance(noticia_ids, list) or not all(isinstance(i, int) for i in noticia_ids):
+        return jsonify({'error': 'noticia_ids debe ser una lista de enteros'}), 400
+
+    try:
+        renewed, lost = publication_lease.heartbeat(
+            publisher_id,
+            noticia_ids,
+            lease_seconds=app.config.get('PUBLICATION_LEASE_SECONDS', 1800)
+        )
+        return jsonify({'renewed': renewed, 'lost': lost}), 200
+
+    except Exception as e:
+        logger.error(f"Error renovando leases de {publisher_id}: {e}")
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/news/wait-for-work', methods=['GET'])
+@csrf.exempt
+def api_wait_for_work():
+    """
+    Long-poll para SocialPublisher: responde en cuanto hay una noticia nueva en fase 'procesado'
+
+    Query params:
+        - since: cursor ISO devuelto por la llamada anterior (sin cursor responde al instante
+          si ya hay noticias procesadas)
+        - timeout: segundos máximos de espera (tope LONGPOLL_MAX_TIMEOUT_SECONDS)
+
+    Response JSON:
+    {
+        "ready": true,
+        "count": 3,
+        "cursor": "2026-10-18T12:00:00"
+    }
+    """
+    since_raw = request.args.get('since')
+    try:
+        since = datetime.fromisoformat(since_raw) if since_raw else None
+    except ValueError:
+        return jsonify({'error': 'since debe ser una fecha ISO'}), 400
+
+    max_timeout = app.config.get('LONGPOLL_MAX_TIMEOUT_SECONDS', 30)
+    timeout = min(max(request.args.get('timeout', max_timeout, type=float), 0), max_timeout)
+
+    try:
+        return jsonify(wait_for_ready(
+            since=since,
+            timeout=timeout,
+            check_interval=app.config.get('LONGPOLL_CHECK_INTERVAL_SECONDS', 2)
+        )), 200
+
+    except Exception as e:
+        logger.error(f"Error en long-poll de noticias procesadas: {e}")
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/news/<int:noticia_id>/mark-published', methods=['POST'])
 @csrf.exempt
 def api_mark_published(noticia_id):
@@ -757,78 +1053,17 @@ def api_mark_published(noticia_id):
         if not data or 'platform' not in data:
             return jsonify({'error': 'platform es requerido'}), 400
 
-        platform = data['platform']
-
-        # Inicializar plataformas_publicadas si es None
-        if noticia.plataformas_publicadas is None:
-            noticia.plataformas_publicadas = {}
-
-        # Si hubo error
-        if data.get('error'):
-            noticia.plataformas_publicadas[platform] = {
-                'status': 'failed',
-                'error': data['error'],
-                'attempted_at': datetime.utcnow().isoformat()
-            }
-            noticia.ultimo_error = f"{platform}: {data['error']}"
-            noticia.intentos_publicacion = (noticia.intentos_publicacion or 0) + 1
-        else:
-            # Publicación exitosa
-            noticia.plataformas_publicadas[platform] = {
-                'status': 'success',
-                'post_id': data.get('post_id'),
-                'post_url': data.get('post_url'),
-                'published_at': datetime.utcnow().isoformat()
-            }
-
-            # Marcar como publicada si es la primera plataforma exitosa
-            if not noticia.publicado:
-                noticia.publicado = True
-                noticia.published_at = datetime.utcnow()
-
-            noticia.intentos_publicacion = (noticia.intentos_publicacion or 0) + 1
-            noticia.ultimo_error = None  # Limpiar error previo
-
-        # Marcar el campo JSONB como modificado para que SQLAlchemy detecte el cambio
-        flag_modified(noticia, 'plataformas_publicadas')
-
-        # Actualizar fase según el estado de todas las plataformas seleccionadas
-        plataformas_seleccionadas = noticia.plataformas_seleccionadas or []
-        if plataformas_seleccionadas:
-            publicadas_data = noticia.plataformas_publicadas or {}
-
-            # Contar plataformas completadas (success o failed)
-            completadas = [p for p in plataformas_seleccionadas if p in publicadas_data]
-            exitosas = [
-                p for p in completadas
-                if isinstance(publicadas_data.get(p), dict) and publicadas_data[p].get('status') == 'success'
-            ]
-
-            # Determinar nueva fase
-            if len(completadas) == len(plataformas_seleccionadas):
-                # Todas las plataformas seleccionadas fueron procesadas
-                if len(exitosas) == len(plataformas_seleccionadas):
-                    noticia.fase = 'publicado_completo'
-                elif len(exitosas) > 0:
-                    noticia.fase = 'publicado_parcial'
-                else:
-                    noticia.fase = 'fallido'
-            else:
-                # Aún faltan plataformas por procesar
-                noticia.fase = 'publicando'
-
+        resultado = publication_results.apply_result(
+            noticia, data, app.config.get('PUBLICATION_LEASE_SECONDS', 1800)
+        )
         db.session.commit()
 
-        # Obtener status de manera segura
-        platform_data = noticia.plataformas_publicadas.get(platform, {})
-        status = platform_data.get('status') if isinstance(platform_data, dict) else None
-
         return jsonify({
             'message': 'Noticia marcada como publicada',
             'noticia_id': noticia_id,
-            'platform': platform,
-            'status': status,
-            'fase': noticia.fase,
+            'platform': resultado['platform'],
+            'status': resultado['status'],
+            'fase': resultado['fase'],
             'total_platforms': len(noticia.plataformas_publicadas)
         }), 200
 
@@ -838,6 +1073,40 @@ def api_mark_published(noticia_id):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/news/mark-published-batch', methods=['POST'])
+@csrf.exempt
+def api_mark_published_batch():
+    """
+    Marcar muchos resultados de publicación en una sola transacción
+
+    Body JSON:
+    {
+        "results": [
+            {"noticia_id": 1, "platform": "telegram", "post_id": "42", "post_url": "https://t.me/..."},
+            {"noticia_id": 2, "platform": "bluesky", "error": "HTTP 500"}
+        ]
+    }
+
+    Response JSON: un resultado por entrada, en el mismo orden
+    (status 'error' para entradas inválidas o noticias inexistentes)
+    """
+    data = request.get_json(silent=True) or {}
+    results = data.get('results')
+    if not isinstance(results, list) or not all(isinstance(r, dict) for r in results):
+        return jsonify({'error': 'results debe ser una lista de objetos'}), 400
+
+    try:
+        applied = publication_results.apply_results(
+            results, app.config.get('PUBLICATION_LEASE_SECONDS', 1800)
+        )
+        return jsonify({'count': len(applied), 'results': applied}), 200
+
+    except Exception as e:
+        logger.error(f"Error marcando lote de publicaciones: {e}")
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/news/<int:noticia_id>/publication-status', methods=['GET'])
 def api_publication_status(noticia_id):
     """
@@ -889,6 +1158,7 @@ def reprocess_failed_translations():
             }), 200
 
         # Crear procesador
+        from src.social_media_processor import SocialMediaProcessor
         processor = SocialMediaProcessor()
 
         results = {
@@ -1044,6 +1314,10 @@ def change_password():
         user.set_password(new_password)
         db.session.commit()
 
+        # La contraseña anterior deja de valer también en el cache y en la sesión
+        credential_cache.invalidate_user(username)
+        session.pop('auth_user', None)
+
         logger.info(f"Contraseña cambiada para usuario '{username}'")
         flash('✅ Contraseña cambiada exitosamente', 'success')
 
@@ -1055,21 +1329,32 @@ def change_password():
     return redirect(url_for('settings'))
 
 
+def register_jobs(target_scheduler):
+    """
+    Registra los jobs periódicos en un scheduler de APScheduler
+    Lo usan init_scheduler (servidor de desarrollo) y src/scheduler.py (producción)
+    """
+    interval_hours = app.config.get('SCRAPE_INTERVAL_HOURS', 24)
+    target_scheduler.add_job(
+        func=scrape_and_save_news,
+        trigger='interval',
+        hours=interval_hours,
+        id='scrape_news',
+        name='Scrape AI News',
+        replace_existing=True
+    )
+    return interval_hours
+
+
 def init_scheduler():
     """
     Inicializa el scheduler para scraping automático
+    Solo para `python src/app.py`: bajo gunicorn (src/wsgi.py) el scheduler
+    corre en su propio proceso (python -m src.scheduler)
     """
     if not scheduler.running:
         # Agregar job de scraping
-        interval_hours = app.config.get('SCRAPE_INTERVAL_HOURS', 24)
-        scheduler.add_job(
-            func=scrape_and_save_news,
-            trigger='interval',
-            hours=interval_hours,
-            id='scrape_news',
-            name='Scrape AI News',
-            replace_existing=True
-        )
+        interval_hours = register_jobs(scheduler)
 
         # Iniciar scheduler
         scheduler.start()
@@ -0,0 +1,238 @@
+"""
+Traducción offline por lotes usando la Message Batches API de Anthropic
+Envía muchos prompts de translate_and_optimize como un único job asincrónico,
+espera a que termine y devuelve los resultados parseados
+"""
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+from src.translation_service import TranslationService
+
+logger = logging.getLogger(__name__)
+
+# Prefijo del custom_id de cada request (solo admite [a-zA-Z0-9_-], máx 64)
+CUSTOM_ID_PREFIX = 'apublicar-'
+
+
+@dataclass
+class BatchResult:
+    """
+    Resultado individual de un request dentro del batch
+    """
+    custom_id: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BatchBackend(ABC):
+    """
+    Interfaz mínima de un servidor de batches
+
+    Permite usar la API real de Anthropic o un servidor local falso en tests.
+    """
+
+    @abstractmethod
+    def create(self, requests: List[Dict]) -> str:
+        """
+        Crear un batch
+
+        Args:
+            requests: Lista de {'custom_id': str, 'params': dict de messages.create}
+
+        Returns:
+            ID del batch
+        """
+        pass
+
+    @abstractmethod
+    def is_done(self, batch_id: str) -> bool:
+        """
+        Verificar si el batch terminó de procesarse
+
+        Args:
+            batch_id: ID del batch
+
+        Returns:
+            True si ya se pueden leer los resultados
+        """
+        pass
+
+    @abstractmethod
+    def results(self, batch_id: str) -> Iterator[BatchResult]:
+        """
+        Leer los resultados de un batch terminado
+
+        Args:
+            batch_id: ID del batch
+
+        Returns:
+            Iterador de BatchResult
+        """
+        pass
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """
+    Backend sobre la Message Batches API de Anthropic
+    """
+
+    def __init__(self, client):
+        """
+        Args:
+            client: Cliente Anthropic ya inicializado
+        """
+        # SDKs viejos exponen los batches bajo client.beta
+        messages = client.messages
+        self.batches = getattr(messages, 'batches', None) or client.beta.messages.batches
+
+    def create(self, requests: List[Dict]) -> str:
+        batch = self.batches.create(requests=requests)
+        return batch.id
+
+    def is_done(self, batch_id: str) -> bool:
+        return self.batches.retrieve(batch_id).processing_status == 'ended'
+
+    def results(self, batch_id: str) -> Iterator[BatchResult]:
+        for entry in self.batches.results(batch_id):
+            result = entry.result
+            if result.type == 'succeeded':
+                yield BatchResult(custom_id=entry.custom_id, text=result.message.content[0].text)
+            else:
+                error = getattr(result, 'error', None)
+                yield BatchResult(custom_id=entry.custom_id, error=str(error) if error else result.type)
+
+
+class FakeBatchBackend(BatchBackend):
+    """
+    Servidor de batches local para tests (sin red)
+
+    Cada request se responde llamando a responder(params); si lanza una
+    excepción el request queda como error.
+    """
+
+    def __init__(self, responder: Callable[[Dict], str], polls_until_done: int = 1):
+        """
+        Args:
+            responder: Función que recibe los params de messages.create y devuelve el texto
+            polls_until_done: Cantidad de consultas de estado antes de terminar
+        """
+        self.responder = responder
+        self.polls_until_done = polls_until_done
+        self.batches: Dict[str, Dict] = {}
+
+    def create(self, requests: List[Dict]) -> str:
+        batch_id = f"msgbatch_fake_{len(self.batches) + 1}"
+        self.batches[batch_id] = {'requests': list(requests), 'polls': 0}
+        return batch_id
+
+    def is_done(self, batch_id: str) -> bool:
+        batch = self.batches[batch_id]
+        batch['polls'] += 1
+        return batch['polls'] >= self.polls_until_done
+
+    def results(self, batch_id: str) -> Iterator[BatchResult]:
+        for request in self.batches[batch_id]['requests']:
+            try:
+                yield BatchResult(custom_id=request['custom_id'], text=self.responder(request['params']))
+            except Exception as e:
+                yield BatchResult(custom_id=request['custom_id'], error=str(e))
+
+
+class BatchTranslator:
+    """
+    Traduce lotes de noticias con un job asincrónico en lugar de una llamada por noticia
+    """
+
+    def __init__(
+        self,
+        translation_service: TranslationService,
+        backend: Optional[BatchBackend] = None,
+        poll_interval: float = 60,
+        timeout: float = 24 * 3600
+    ):
+        """
+        Args:
+            translation_service: Servicio que arma los prompts y parsea las respuestas
+            backend: Servidor de batches (None = API de Anthropic)
+            poll_interval: Segundos entre consultas de estado
+            timeout: Segundos máximos de espera (la API expira batches a las 24h)
+        """
+        self.translation_service = translation_service
+        self.backend = backend or AnthropicBatchBackend(translation_service.client)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    def submit(self, noticias: List[Dict]) -> str:
+        """
+        Envía un batch con un request por noticia
+
+        Args:
+            noticias: Lista de diccionarios con keys: id, titulo, texto, url
+
+        Returns:
+            ID del batch
+        """
+        requests = [
+            {
+                'custom_id': f"{CUSTOM_ID_PREFIX}{noticia['id']}",
+                'params': self.translation_service.build_message_params(
+                    titulo=noticia.get('titulo', ''),
+                    texto=noticia.get('texto', ''),
+                    url=noticia.get('url', '')
+                )
+            }
+            for noticia in noticias
+        ]
+
+        batch_id = self.backend.create(requests)
+        logger.info(f"📦 Batch {batch_id} enviado con {len(requests)} noticias")
+        return batch_id
+
+    def wait(self, batch_id: str) -> bool:
+        """
+        Espera a que el batch termine
+
+        Args:
+            batch_id: ID del batch
+
+        Returns:
+            True si terminó, False si se agotó el timeout
+        """
+        deadline = time.monotonic() + self.timeout
+
+        while not self.backend.is_done(batch_id):
+            if time.monotonic() >= deadline:
+                logger.warning(f"⏱️ Batch {batch_id} sin terminar tras {self.timeout}s")
+                return False
+            time.sleep(self.poll_interval)
+
+        logger.info(f"✓ Batch {batch_id} terminado")
+        return True
+
+    def collect(self, batch_id: str) -> Dict[int, Dict]:
+        """
+        Lee y parsea los resultados de un batch terminado
+
+        Args:
+            batch_id: ID del batch
+
+        Returns:
+            {id de noticia: resultado}. El resultado tiene las mismas keys que
+            translate_and_optimize, o {'error': mensaje} si el request falló.
+        """
+        results = {}
+
+        for result in self.backend.results(batch_id):
+            if not result.custom_id.startswith(CUSTOM_ID_PREFIX):
+                continue
+            noticia_id = int(result.custom_id[len(CUSTOM_ID_PREFIX):])
+
+            if result.error:
+                results[noticia_id] = {'error': result.error}
+            else:
+                results[noticia_id] = self.translation_service._parse_response(result.text)
+
+        return results
@@ -0,0 +1,119 @@
+"""
+Cache en memoria de credenciales HTTP Basic ya verificadas
+El navegador reenvía usuario y contraseña en cada página, POST y asset; sin
+cache cada request paga un check_password_hash (PBKDF2, lento a propósito).
+La clave es un HMAC de (usuario, contraseña) con SECRET_KEY: la contraseña
+nunca queda en memoria en claro ni como hash barato de revertir
+"""
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Optional, Tuple
+
+
+class CredentialCache:
+    """
+    Credenciales verificadas con TTL corto y tamaño acotado (LRU)
+
+    Solo se guardan verificaciones exitosas: una contraseña incorrecta
+    siempre vuelve a pasar por el hash. Es por proceso; con varios workers
+    cada uno tiene su propio cache y el TTL acota cuánto sobrevive una
+    contraseña cambiada en otro proceso.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        ttl_seconds: float = 300,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            secret: Clave del HMAC (SECRET_KEY de la app)
+            ttl_seconds: Segundos de validez de una verificación (0 = cache desactivado)
+            max_entries: Entradas máximas; se desalojan las menos usadas recientemente
+            clock: Reloj monotónico (inyectable en tests)
+        """
+        self._secret = (secret or '').encode()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: 'OrderedDict[str, Tuple[str, float]]' = OrderedDict()
+        self._lock = Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    @classmethod
+    def from_config(cls, config) -> 'CredentialCache':
+        """Crea el cache según AUTH_CACHE_TTL_SECONDS / AUTH_CACHE_MAX_ENTRIES"""
+        return cls(
+            config.get('SECRET_KEY', ''),
+            ttl_seconds=config.get('AUTH_CACHE_TTL_SECONDS', 300),
+            max_entries=config.get('AUTH_CACHE_MAX_ENTRIES', 256)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _key(self, username: str, password: str) -> str:
+        # El largo del usuario como prefijo evita que ('ab', 'c') y ('a', 'bc') colisionen
+        message = f"{len(username)}:{username}:{password}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    def get(self, username: str, password: str) -> Optional[str]:
+        """
+        Usuario autenticado si (username, password) se verificó hace menos de ttl_seconds
+
+        Returns:
+            El username, o None si no está en cache o venció
+        """
+        if not self.enabled:
+            return None
+
+        key = self._key(username, password)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1] > self._clock():
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry[0]
+            if entry:
+                del self._entries[key]
+            self.stats['misses'] += 1
+            return None
+
+    def store(self, username: str, password: str):
+        """Registrar una verificación exitosa"""
+        if not self.enabled:
+            return
+
+        key = self._key(username, password)
+        with self._lock:
+            self._entries[key] = (username, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, username: str) -> int:
+        """
+        Olvidar todas las verificaciones de un usuario (p.ej. al cambiar la contraseña)
+
+        Returns:
+            Cantidad de entradas eliminadas
+        """
+        with self._lock:
+            keys = [key for key, (user, _) in self._entries.items() if user == username]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,72 @@
+"""
+Extracción de texto plano de HTML en una sola pasada
+Reemplaza BeautifulSoup + regex para los resúmenes de los feeds: no arma un
+árbol, descarta script/style, decodifica entidades, colapsa espacios y deja
+de parsear apenas se junta el máximo de palabras
+"""
+import re
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+# Su contenido no es texto visible
+SKIPPED_TAGS = frozenset({'script', 'style', 'template', 'noscript'})
+
+
+class _WordLimitReached(Exception):
+    pass
+
+
+class _TextExtractor(HTMLParser):
+    """HTMLParser que junta palabras del texto visible hasta un máximo"""
+
+    def __init__(self, max_words: Optional[int] = None):
+        super().__init__(convert_charrefs=True)  # Entidades ya decodificadas en handle_data
+        self.max_words = max_words
+        self.words: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        self.words.extend(data.split())
+        # Una palabra de más alcanza para saber que hubo que truncar
+        if self.max_words is not None and len(self.words) > self.max_words:
+            raise _WordLimitReached
+
+
+def html_to_text(html_text: str, max_words: Optional[int] = None) -> Tuple[str, bool]:
+    """
+    Texto visible de un fragmento HTML
+
+    Args:
+        html_text: HTML (o texto plano) a limpiar
+        max_words: Máximo de palabras a devolver (None = sin límite)
+
+    Returns:
+        (texto con espacios colapsados, True si se truncó en max_words)
+    """
+    if not html_text:
+        return '', False
+
+    parser = _TextExtractor(max_words)
+    try:
+        parser.feed(html_text)
+        parser.close()
+    except _WordLimitReached:
+        pass
+    except Exception:
+        # HTML que ni HTMLParser tolera: limpieza básica con regex
+        parser.words = re.sub(r'<[^>]+>', ' ', html_text).split()
+
+    words = parser.words
+    if max_words is not None and len(words) > max_words:
+        return ' '.join(words[:max_words]), True
+    return ' '.join(words), False
@@ -0,0 +1,275 @@
+"""
+Cola de jobs durable sobre la tabla processing_jobs
+Los endpoints encolan y responden al instante; src/worker.py reclama los jobs
+con un lease (FOR UPDATE SKIP LOCKED en PostgreSQL), lo renueva con heartbeats
+y los reintenta con backoff hasta pasarlos a dead-letter
+"""
+import json
+import logging
+import socket
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.models import db, ProcessingJob
+
+logger = logging.getLogger(__name__)
+
+# Tipos de job que entiende el worker
+JOB_PROCESS_ITEM = 'process_item'
+JOB_PROCESS_ALL_PENDING = 'process_all_pending'
+
+# Estados
+STATUS_PENDING = 'pending'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_DEAD = 'dead'
+
+ACTIVE_STATUSES = (STATUS_PENDING, STATUS_RUNNING)
+
+
+def default_worker_id() -> str:
+    """Identificador del worker: host:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue(tipo: str, payload: Optional[Dict] = None, max_attempts: int = 3,
+            dedup: bool = True) -> ProcessingJob:
+    """
+    Encola un job (el llamador hace commit)
+
+    Args:
+        tipo: Tipo de job (JOB_PROCESS_ITEM, JOB_PROCESS_ALL_PENDING)
+        payload: Parámetros del job
+        max_attempts: Intentos antes de pasar a dead-letter
+        dedup: Si ya hay un job activo con el mismo tipo y payload, devolver ese
+
+    Returns:
+        El job nuevo o el existente
+    """
+    payload = payload or {}
+    now = datetime.utcnow()
+    values = {
+        'tipo': tipo,
+        'payload': payload,
+        'dedup_key': json.dumps(payload, sort_keys=True, separators=(',', ':')) if dedup else None,
+        'status': STATUS_PENDING,
+        'attempts': 0,
+        'max_attempts': max_attempts,
+        'run_after': now,
+        'created_at': now
+    }
+
+    if not dedup:
+        job = ProcessingJob(**values)
+        db.session.add(job)
+        db.session.flush()
+    else:
+        job = _insert_or_get_active(values)
+        while job is None:
+            existing = _active_job(tipo, values['dedup_key'])
+            if existing:
+                return existing
+            # El job activo terminó entre el INSERT y la consulta: volver a intentar
+            job = _insert_or_get_active(values)
+
+    logger.info(f"📥 Job {job.id} encolado: {tipo} {payload}")
+    return job
+
+
+def _active_job(tipo: str, dedup_key: str) -> Optional[ProcessingJob]:
+    """Job activo (pending o running) con ese tipo y payload"""
+    job = ProcessingJob.query.filter(
+        ProcessingJob.tipo == tipo,
+        ProcessingJob.dedup_key == dedup_key,
+        ProcessingJob.status.in_(ACTIVE_STATUSES)
+    ).first()
+    if job:
+        logger.info(f"Job {job.id} ({tipo}) ya estaba en cola")
+    return job
+
+
+def _insert_or_get_active(values: Dict) -> Optional[ProcessingJob]:
+    """
+    Inserta el job salvo que ya haya uno activo con el mismo (tipo, dedup_key)
+
+    El índice único parcial uq_processing_jobs_active_dedup decide: dos
+    requests simultáneos no pueden encolar el mismo job (un SELECT previo
+    sí lo permitiría). En motores sin ON CONFLICT se consulta antes de insertar.
+
+    Returns:
+        El job nuevo, o None si ya había uno activo
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect not in ('postgresql', 'sqlite'):
+        if _active_job(values['tipo'], values['dedup_key']):
+            return None
+        job = ProcessingJob(**values)
+        db.session.add(job)
+        db.session.flush()
+        return job
+
+    dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+    stmt = (
+        dialect_insert(ProcessingJob)
+        .values(**values)
+        .on_conflict_do_nothing(
+            index_elements=['tipo', 'dedup_key'],
+            index_where=ProcessingJob.status.in_(ACTIVE_STATUSES)
+        )
+        .returning(ProcessingJob.id)
+    )
+    job_id = db.session.execute(stmt).scalar_one_or_none()
+    return db.session.get(ProcessingJob, job_id) if job_id is not None else None
+
+
+def claim(worker_id: str, lease_seconds: int = 300, tipos: Optional[List[str]] = None) -> Optional[ProcessingJob]:
+    """
+    Reclama el próximo job disponible y hace commit
+
+    Disponible = pendiente con run_after vencido, o en ejecución con el lease
+    vencido (el worker que lo tenía murió). Con SKIP LOCKED varios workers
+    reclaman en paralelo sin bloquearse ni tomar el mismo job.
+
+    Args:
+        worker_id: Identificador del worker que reclama
+        lease_seconds: Duración del lease
+        tipos: Limitar a estos tipos de job (None = todos)
+
+    Returns:
+        El job reclamado, o None si no hay
+    """
+    while True:
+        now = datetime.utcnow()
+        query = (
+            select(ProcessingJob)
+            .where(or_(
+                and_(ProcessingJob.status == STATUS_PENDING, ProcessingJob.run_after <= now),
+                and_(ProcessingJob.status == STATUS_RUNNING, ProcessingJob.lease_expires_at < now)
+            ))
+            .order_by(ProcessingJob.run_after, ProcessingJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if tipos:
+            query = query.where(ProcessingJob.tipo.in_(tipos))
+
+        job = db.session.execute(query).scalar_one_or_none()
+        if job is None:
+            db.session.commit()
+            return None
+
+        if job.status == STATUS_RUNNING and (job.attempts or 0) >= job.max_attempts:
+            # Lease vencido en su último intento: dead-letter y seguir buscando
+            job.status = STATUS_DEAD
+            job.last_error = job.last_error or f"Lease vencido (worker {job.locked_by})"
+            job.locked_by = None
+            job.finished_at = now
+            db.session.commit()
+            logger.error(f"☠️ Job {job.id} pasado a dead-letter: {job.last_error}")
+            continue
+
+        if job.status == STATUS_RUNNING:
+            logger.warning(f"Job {job.id}: lease de {job.locked_by} vencido, reclamado por {worker_id}")
+
+        job.status = STATUS_RUNNING
+        job.locked_by = worker_id
+        job.attempts = (job.attempts or 0) + 1
+        job.started_at = now
+        job.heartbeat_at = now
+        job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+        db.session.commit()
+        return job
+
+
+def heartbeat(job_id: int, worker_id: str, lease_seconds: int = 300) -> bool:
+    """
+    Renueva el lease de un job en ejecución
+
+    Args:
+        job_id: ID del job
+        worker_id: Worker que lo tiene reclamado
+        lease_seconds: Nueva duración del lease desde ahora
+
+    Returns:
+        False si el worker ya no es dueño del job (otro lo reclamó)
+    """
+    now = datetime.utcnow()
+    updated = db.session.execute(
+        update(ProcessingJob)
+        .where(
+            ProcessingJob.id == job_id,
+            ProcessingJob.locked_by == worker_id,
+            ProcessingJob.status == STATUS_RUNNING
+        )
+        .values(heartbeat_at=now, lease_expires_at=now + timedelta(seconds=lease_seconds))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    return updated == 1
+
+
+def complete(job_id: int, worker_id: str, result: Optional[Dict] = None) -> bool:
+    """
+    Marca un job como terminado y hace commit
+
+    Returns:
+        False si el worker ya no era dueño del job
+    """
+    updated = db.session.execute(
+        update(ProcessingJob)
+        .where(ProcessingJob.id == job_id, ProcessingJob.locked_by == worker_id)
+        .values(
+            status=STATUS_DONE,
+            result=result,
+            locked_by=None,
+            lease_expires_at=None,
+            finished_at=datetime.utcnow()
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+
+    if updated:
+        logger.info(f"✓ Job {job_id} terminado")
+    return updated == 1
+
+
+def fail(job_id: int, worker_id: str, error: str, retry_base_seconds: int = 30) -> Optional[str]:
+    """
+    Registra un intento fallido: reintenta con backoff exponencial o pasa a dead-letter
+
+    Args:
+        job_id: ID del job
+        worker_id: Worker que lo tenía reclamado
+        error: Mensaje de error
+        retry_base_seconds: Espera antes del primer reintento (se duplica en cada intento)
+
+    Returns:
+        Nuevo estado del job (pending/dead), o None si el worker ya no era dueño
+    """
+    job = db.session.get(ProcessingJob, job_id)
+    if job is None or job.locked_by != worker_id:
+        db.session.rollback()
+        return None
+
+    now = datetime.utcnow()
+    job.last_error = error
+    job.locked_by = None
+    job.lease_expires_at = None
+
+    if (job.attempts or 0) >= job.max_attempts:
+        job.status = STATUS_DEAD
+        job.finished_at = now
+        logger.error(f"☠️ Job {job_id} pasado a dead-letter tras {job.attempts} intentos: {error}")
+    else:
+        delay = retry_base_seconds * (2 ** ((job.attempts or 1) - 1))
+        job.status = STATUS_PENDING
+        job.run_after = now + timedelta(seconds=delay)
+        logger.warning(f"Job {job_id} falló (intento {job.attempts}/{job.max_attempts}), reintento en {delay}s: {error}")
+
+    db.session.commit()
+    return job.status
@@ -1,13 +1,21 @@
 """
 Modelos de base de datos para WebIAScrap
 """
+import hashlib
+import logging
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, TypeDecorator
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, Boolean, JSON, TypeDecorator, ForeignKey, Index, insert, select, text
+)
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.dialects.postgresql import ARRAY
 from werkzeug.security import generate_password_hash, check_password_hash
 import os
 
+logger = logging.getLogger(__name__)
+
 db = SQLAlchemy()
 
 
@@ -64,9 +72,86 @@ class Noticia(db.Model):
     temas = Column(StringArray, nullable=True)  # Lista de 3-5 temas (array en PostgreSQL, string en SQLite)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Filas por sentencia en bulk_insert (SQLite limita la cantidad de parámetros)
+    BULK_INSERT_CHUNK_SIZE = 500
+
     def __repr__(self):
         return f'<Noticia {self.id}: {self.titulo[:50]}>'
 
+    @classmethod
+    def bulk_insert(cls, noticias):
+        """
+        Inserta un lote de noticias ignorando las URLs que ya existen
+
+        En PostgreSQL y SQLite se usa una sola sentencia por bloque:
+        INSERT ... ON CONFLICT (url) DO NOTHING RETURNING id.
+        En otros motores se consultan primero las URLs existentes (una query).
+        Las noticias sin titulo, texto o url se omiten con un warning: una sola
+        fila NOT NULL inválida abortaría todo el bloque. El llamador hace commit.
+
+        Args:
+            noticias (list[dict]): Noticias con titulo, texto, url, fecha_hora y temas
+
+        Returns:
+            dict: {'insertadas': int, 'duplicadas': int, 'invalidas': int, 'ids': list[int]}
+        """
+        now = datetime.utcnow()
+        rows = []
+        seen_urls = set()
+        invalidas = 0
+
+        for data in noticias:
+            faltantes = [campo for campo in ('titulo', 'texto', 'url') if not data.get(campo)]
+            if faltantes:
+                logger.warning(f"Noticia omitida, faltan {', '.join(faltantes)}: {data.get('url') or data.get('titulo')}")
+                invalidas += 1
+                continue
+
+            url = data['url']
+            # Duplicados dentro del mismo lote cuentan como duplicadas
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            rows.append({
+                'titulo': data['titulo'],
+                'texto': data['texto'],
+                'url': url,
+                'fecha_hora': data.get('fecha_hora') or now,
+                'temas': data.get('temas'),
+                'created_at': now
+            })
+
+        dialect = db.session.get_bind().dialect.name
+        ids = []
+
+        for start in range(0, len(rows), cls.BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + cls.BULK_INSERT_CHUNK_SIZE]
+
+            if dialect in ('postgresql', 'sqlite'):
+                dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+                stmt = (
+                    dialect_insert(cls)
+                    .values(chunk)
+                    .on_conflict_do_nothing(index_elements=['url'])
+                    .returning(cls.id)
+                )
+                ids.extend(db.session.execute(stmt).scalars().all())
+            else:
+                existing = set(db.session.execute(
+                    select(cls.url).where(cls.url.in_([row['url'] for row in chunk]))
+                ).scalars())
+                nuevas = [row for row in chunk if row['url'] not in existing]
+                if nuevas:
+                    ids.extend(db.session.execute(insert(cls).returning(cls.id), nuevas).scalars().all())
+
+        return {
+            'insertadas': len(ids),
+            'duplicadas': len(noticias) - invalidas - len(ids),
+            'invalidas': invalidas,
+            'ids': ids
+        }
+
     def to_dict(self):
         """Convierte el objeto a diccionario"""
         # Procesar temas correctamente para evitar serializaci\u00f3n incorrecta
@@ -95,6 +180,27 @@ class Noticia(db.Model):
         }
 
 
+class NoticiaArchivada(db.Model):
+    """
+    Archivo de noticias eliminadas por la política de retención
+    Se llena en bloque con INSERT ... SELECT desde noticias (ver src/retention.py)
+    """
+    __tablename__ = 'noticias_archivo'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    noticia_id = Column(Integer, nullable=False)  # ID que tenía en la tabla noticias
+    titulo = Column(String(500), nullable=False)
+    texto = Column(Text, nullable=False)
+    url = Column(String(1000), nullable=False)  # Sin UNIQUE: una URL puede archivarse más de una vez
+    fecha_hora = Column(DateTime, nullable=False)
+    temas = Column(StringArray, nullable=True)
+    created_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<NoticiaArchivada {self.noticia_id}: {self.titulo[:50]}>'
+
+
 class APublicar(db.Model):
     """
     Tabla para almacenar noticias seleccionadas por el usuario para publicar
@@ -129,8 +235,13 @@ class APublicar(db.Model):
     # Tracking de publicación en redes sociales
     publicado = Column(Boolean, default=False)  # Si ya fue publicada en al menos una plataforma
     plataformas_seleccionadas = Column(JSON, nullable=True)  # ["telegram", "bluesky", "twitter", "linkedin"] - Plataformas elegidas por el usuario
-    plataformas_publicadas = Column(JSON, nullable=True)  # {"linkedin": {"post_id": "...", "url": "...", "published_at": "...", "intentos": 0}}
-    intentos_publicacion = Column(Integer, default=0)  # Contador de intentos de publicación GLOBAL (deprecated - usar plataformas_publicadas)
+    # Intentos por plataforma en publication_attempts (ver plataformas_publicadas)
+    attempts = relationship(
+        'PublicationAttempt',
+        order_by='PublicationAttempt.id',
+        cascade='all, delete-orphan'
+    )
+    intentos_publicacion = Column(Integer, default=0)  # Contador de intentos de publicación GLOBAL (deprecated - usar attempts)
     ultimo_error = Column(Text, nullable=True)  # Último error de publicación si hubo
 
     # Nuevos campos para flujo mejorado
@@ -139,6 +250,10 @@ class APublicar(db.Model):
     ultimo_intento = Column(DateTime, nullable=True)  # Timestamp del último intento de publicación
     proximo_reintento = Column(DateTime, nullable=True)  # Timestamp del próximo reintento automático
 
+    # Lease de publicación (ver src/publication_lease.py)
+    claimed_by = Column(String(200), nullable=True)  # Publisher que la reclamó
+    lease_expires_at = Column(DateTime, nullable=True)  # Si vence sin confirmar, otro publisher la reclama
+
     # Timestamps
     selected_at = Column(DateTime, default=datetime.utcnow)
     processed_at = Column(DateTime, nullable=True)  # Cuando fue procesado
@@ -148,6 +263,25 @@ class APublicar(db.Model):
     def __repr__(self):
         return f'<APublicar {self.id}: {self.titulo[:50]}>'
 
+    @property
+    def plataformas_publicadas(self):
+        """
+        Estado por plataforma con el formato del antiguo campo JSON
+
+        Por plataforma vale el primer intento exitoso y, si no hubo ninguno, el
+        último (misma regla que la fase, ver PublicationAttempt.resolve_status):
+        {"telegram": {"status": "success", "post_id": "...", "post_url": "...", "intentos": 1}}
+        Al listar muchas noticias, cargar `attempts` con selectinload para evitar N+1.
+        """
+        plataformas = {}
+        for attempt in self.attempts:
+            previo = plataformas.get(attempt.platform, {})
+            intentos = previo.get('intentos', 0) + (attempt.status != 'pending')
+            if PublicationAttempt.resolve_status([previo.get('status'), attempt.status]) == attempt.status:
+                previo = attempt.to_status_dict()
+            plataformas[attempt.platform] = dict(previo, intentos=intentos)
+        return plataformas
+
     def to_dict(self):
         """Convierte el objeto a diccionario"""
         # Procesar temas correctamente para evitar serializaci\u00f3n incorrecta
@@ -190,6 +324,8 @@ class APublicar(db.Model):
             'contador_reintentos': self.contador_reintentos,
             'ultimo_intento': self.ultimo_intento.isoformat() if self.ultimo_intento else None,
             'proximo_reintento': self.proximo_reintento.isoformat() if self.proximo_reintento else None,
+            'claimed_by': self.claimed_by,
+            'lease_expires_at': self.lease_expires_at.isoformat() if self.lease_expires_at else None,
             'selected_at': self.selected_at.isoformat() if self.selected_at else None,
             'processed_at': self.processed_at.isoformat() if self.processed_at else None,
             'published_at': self.published_at.isoformat() if self.published_at else None,
@@ -219,6 +355,194 @@ class APublicar(db.Model):
         }
 
 
+class FeedState(db.Model):
+    """
+    Estado persistente por feed RSS técnico
+    Guarda los validadores HTTP para hacer GET condicional en el próximo scraping
+    y la entrada más nueva ya vista (high-water mark) para emitir solo novedades
+    """
+    __tablename__ = 'feed_states'
+
+    source_id = Column(String(100), primary_key=True)  # ID en TechnicalSourcesScraper.TECHNICAL_SOURCES
+    etag = Column(String(500), nullable=True)
+    last_modified = Column(String(100), nullable=True)  # Header Last-Modified tal cual lo envió el servidor
+    content_hash = Column(String(64), nullable=True)  # SHA-256 del último cuerpo descargado
+    last_entry_at = Column(DateTime, nullable=True)  # Fecha de la entrada más nueva ya emitida
+    last_entry_guids = Column(JSON, nullable=True)  # guids/links ya emitidos con esa fecha
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<FeedState {self.source_id}>'
+
+    def to_dict(self):
+        """Convierte el estado al formato que usa TechnicalSourcesScraper"""
+        return {
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'content_hash': self.content_hash,
+            'last_entry_at': self.last_entry_at,
+            'last_entry_guids': self.last_entry_guids or []
+        }
+
+    @classmethod
+    def load_states(cls):
+        """
+        Carga el estado de todos los feeds
+
+        Returns:
+            dict: {source_id: estado}
+        """
+        return {state.source_id: state.to_dict() for state in cls.query.all()}
+
+    @classmethod
+    def save_states(cls, states):
+        """
+        Agrega a la sesión el estado actualizado de los feeds (el llamador hace commit)
+
+        Args:
+            states (dict): {source_id: estado} tal como lo dejó el scraper
+        """
+        states = {source_id: data for source_id, data in states.items() if data}
+        if not states:
+            return
+
+        existing = {
+            state.source_id: state
+            for state in cls.query.filter(cls.source_id.in_(list(states))).all()
+        }
+
+        for source_id, data in states.items():
+            state = existing.get(source_id)
+            if state is None:
+                state = cls(source_id=source_id)
+                db.session.add(state)
+
+            state.etag = data.get('etag')
+            state.last_modified = data.get('last_modified')
+            state.content_hash = data.get('content_hash')
+            state.last_entry_at = data.get('last_entry_at')
+            state.last_entry_guids = data.get('last_entry_guids')
+
+
+class PublicationAttempt(db.Model):
+    """
+    Un intento de publicación de una noticia en una plataforma
+    Reemplaza al JSON apublicar.plataformas_publicadas: cada resultado es un
+    INSERT y las consultas por plataforma/estado usan índice
+    """
+    __tablename__ = 'publication_attempts'
+    __table_args__ = (
+        Index('ix_publication_attempts_platform_status', 'platform', 'status'),
+        Index('ix_publication_attempts_noticia_platform', 'noticia_id', 'platform'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    noticia_id = Column(Integer, ForeignKey('apublicar.id', ondelete='CASCADE'), nullable=False)
+    platform = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False)  # pending, success, failed
+    post_id = Column(String(500), nullable=True)
+    url = Column(String(1000), nullable=True)
+    attempted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f'<PublicationAttempt {self.noticia_id}/{self.platform}: {self.status}>'
+
+    @staticmethod
+    def resolve_status(statuses):
+        """
+        Estado de una plataforma a partir de sus intentos en orden cronológico
+
+        Un intento exitoso gana: la plataforma ya está publicada aunque después
+        se registre un fallo o un pendiente. Si no hubo éxito vale el último.
+        """
+        statuses = [status for status in statuses if status]
+        if 'success' in statuses:
+            return 'success'
+        return statuses[-1] if statuses else None
+
+    def to_status_dict(self):
+        """Entrada de plataformas_publicadas con las claves del formato JSON anterior"""
+        fecha = self.attempted_at.isoformat() if self.attempted_at else None
+        info = {'status': self.status}
+        if self.status == 'success':
+            info.update(post_id=self.post_id, post_url=self.url, published_at=fecha)
+        elif self.status == 'failed':
+            info.update(error=self.error, attempted_at=fecha)
+        return info
+
+
+class TranslationCacheEntry(db.Model):
+    """
+    Resultado de traducción cacheado por contenido (ver src/translation_cache.py)
+    La clave es un hash de (modelo, versión del prompt, título+texto normalizados),
+    así el mismo artículo bajo otra URL no vuelve a pagar una llamada a Claude
+    """
+    __tablename__ = 'translation_cache'
+
+    key = Column(String(64), primary_key=True)  # SHA-256 hex
+    model = Column(String(100), nullable=False)
+    result = Column(JSON, nullable=False)  # Diccionario devuelto por translate_and_optimize
+    hits = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    last_hit_at = Column(DateTime, default=datetime.utcnow, index=True)  # Para desalojo LRU
+
+    def __repr__(self):
+        return f'<TranslationCacheEntry {self.key[:12]}>'
+
+
+class ProcessingJob(db.Model):
+    """
+    Job de procesamiento con Claude encolado en la BD (ver src/job_queue.py)
+    Lo ejecuta el worker (src/worker.py) fuera del request HTTP
+    """
+    __tablename__ = 'processing_jobs'
+    __table_args__ = (
+        # Un solo job activo por (tipo, payload): enqueue inserta con ON CONFLICT DO NOTHING
+        Index(
+            'uq_processing_jobs_active_dedup', 'tipo', 'dedup_key', unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+            sqlite_where=text("status IN ('pending', 'running')")
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    tipo = Column(String(50), nullable=False)  # process_item, process_all_pending
+    payload = Column(JSON, nullable=True)  # {"noticia_id": 123} / {"limit": 10}
+    dedup_key = Column(Text, nullable=True)  # Payload en JSON canónico; NULL = sin dedup
+    status = Column(String(20), nullable=False, default='pending', index=True)  # pending, running, done, dead
+    attempts = Column(Integer, default=0)  # Intentos ya iniciados
+    max_attempts = Column(Integer, default=3)  # Al agotarlos pasa a dead (dead-letter)
+    run_after = Column(DateTime, default=datetime.utcnow, index=True)  # No reclamar antes (backoff de reintentos)
+    locked_by = Column(String(200), nullable=True)  # Worker que lo tiene reclamado
+    lease_expires_at = Column(DateTime, nullable=True)  # Si vence sin heartbeat, otro worker lo reclama
+    heartbeat_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    result = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<ProcessingJob {self.id}: {self.tipo} {self.status}>'
+
+    def to_dict(self):
+        """Convierte el job a diccionario para el endpoint de estado"""
+        return {
+            'id': self.id,
+            'tipo': self.tipo,
+            'payload': self.payload or {},
+            'status': self.status,
+            'attempts': self.attempts or 0,
+            'max_attempts': self.max_attempts,
+            'last_error': self.last_error,
+            'result': self.result,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
 class User(db.Model):
     """
     Modelo de usuario con contraseñas hasheadas para autenticación
@@ -253,6 +577,15 @@ class User(db.Model):
         """
         return check_password_hash(self.password_hash, password)
 
+    def credential_version(self):
+        """
+        Huella del hash actual: cambia con cada set_password (sal nueva)
+
+        Las sesiones firmadas la guardan y dejan de valer al cambiar la contraseña,
+        aunque la cookie siga en otro navegador.
+        """
+        return hashlib.sha256(self.password_hash.encode()).hexdigest()[:16]
+
     def __repr__(self):
         return f'<User {self.username}>'
 
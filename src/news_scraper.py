@@ -3,21 +3,34 @@ Web Scraper para noticias de IA usando NewsAPI
 """
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, FrozenSet, Optional
 import re
+from functools import lru_cache
 from newsapi import NewsApiClient
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+
+from src.topic_tagger import TopicTagger, get_tagger
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _english_stopwords() -> FrozenSet[str]:
+    """Stopwords de NLTK, cargadas una vez por proceso y solo si se usan"""
+    try:
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+    except LookupError:
+        logger.warning("Stopwords no disponibles, usando set vacío")
+        return frozenset()
+
+
 class NewsScraper:
     """
     Scraper de noticias usando NewsAPI
     """
 
-    def __init__(self, api_key: str, keywords: List[str], sources: List[str] = None):
+    def __init__(self, api_key: str, keywords: List[str], sources: List[str] = None,
+                 tagger: Optional[TopicTagger] = None):
         """
         Inicializa el scraper
 
@@ -25,6 +38,7 @@ class NewsScraper:
             api_key: API key de NewsAPI
             keywords: Lista de palabras clave para buscar
             sources: Lista de fuentes de noticias (opcional)
+            tagger: Etiquetador de temas (None = taxonomía compartida del proceso)
         """
         if not api_key:
             raise ValueError("NewsAPI key es requerida")
@@ -33,13 +47,12 @@ class NewsScraper:
         self.keywords = keywords
         self.sources = sources
         self.client = NewsApiClient(api_key=api_key)
+        self.tagger = tagger or get_tagger()
 
-        # Cargar stopwords para extracción de temas
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except LookupError:
-            logger.warning("Stopwords no disponibles, usando set vacío")
-            self.stop_words = set()
+    @property
+    def stop_words(self) -> FrozenSet[str]:
+        """Stopwords para extracción de temas (el corpus se carga en el primer uso)"""
+        return _english_stopwords()
 
     def fetch_news(self, max_results: int = 30) -> List[Dict]:
         """
@@ -191,9 +204,9 @@ class NewsScraper:
             logger.warning(f"Error parseando fecha '{date_str}': {e}")
             return datetime.utcnow()
 
-    def _extract_topics(self, titulo: str, texto: str, max_topics: int = 5) -> str:
+    def _extract_topics(self, titulo: str, texto: str, max_topics: int = 5) -> List[str]:
         """
-        Extrae temas principales del artículo usando análisis simple de keywords
+        Extrae temas principales del artículo con la taxonomía compartida
 
         Args:
             titulo: Título del artículo
@@ -201,34 +214,13 @@ class NewsScraper:
             max_topics: Número máximo de temas a extraer
 
         Returns:
-            String con temas separados por comas
+            Lista de temas (el título pesa más que el texto)
         """
-        # Combinar título y texto (el título tiene más peso)
-        combined_text = f"{titulo} {titulo} {texto}".lower()
-
-        # Palabras técnicas relevantes de IA/ML
-        ai_keywords = {
-            'ai', 'artificial intelligence', 'machine learning', 'deep learning',
-            'neural network', 'nlp', 'computer vision', 'robotics',
-            'data science', 'algorithm', 'chatbot', 'llm', 'gpt',
-            'transformer', 'bert', 'tensorflow', 'pytorch', 'openai',
-            'anthropic', 'claude', 'chatgpt', 'generative', 'model'
-        }
-
-        # Buscar keywords relevantes
-        found_topics = []
-        for keyword in ai_keywords:
-            if keyword in combined_text:
-                # Capitalizar primera letra de cada palabra
-                topic = ' '.join(word.capitalize() for word in keyword.split())
-                if topic not in found_topics:
-                    found_topics.append(topic)
-
-            if len(found_topics) >= max_topics:
-                break
+        found_topics = self.tagger.tag(titulo, texto, max_topics=max_topics)
 
-        # Si no se encontraron suficientes keywords técnicas, extraer palabras importantes
+        # Si no se encontraron suficientes temas de la taxonomía, extraer palabras importantes
         if len(found_topics) < 3:
+            combined_text = f"{titulo} {titulo} {texto}".lower()
             words = re.findall(r'\b[a-z]{4,}\b', combined_text)
             word_freq = {}
 
@@ -239,15 +231,18 @@ class NewsScraper:
             # Ordenar por frecuencia
             sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
 
-            # Agregar palabras más frecuentes
-            for word, _ in sorted_words[:max_topics - len(found_topics)]:
-                found_topics.append(word.capitalize())
+            # Agregar palabras más frecuentes (sin repetir temas ya encontrados)
+            for word, _ in sorted_words:
+                if len(found_topics) >= max_topics:
+                    break
+                if word.capitalize() not in found_topics:
+                    found_topics.append(word.capitalize())
 
         # Asegurar que tengamos al menos algunos temas
         if not found_topics:
             found_topics = ['AI', 'Technology', 'News']
 
-        return ', '.join(found_topics[:max_topics])
+        return found_topics[:max_topics]
 
 
 def test_scraper(api_key: str):
@@ -0,0 +1,88 @@
+"""
+Paginación por cursor (keyset) para listados que solo crecen
+En lugar de OFFSET, cada página filtra con (columna, id) < (último visto), así
+el costo por página es constante y usa el índice sobre (columna, id)
+"""
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+
+
+@dataclass
+class Page:
+    """Una página de resultados y el cursor para pedir la siguiente"""
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(sort_value: datetime, item_id: int) -> str:
+    """Cursor opaco (base64 url-safe) con la clave del último elemento de la página"""
+    raw = json.dumps([sort_value.isoformat(), item_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> Tuple[datetime, int]:
+    """
+    Decodifica un cursor de encode_cursor
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        sort_raw, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_raw), int(item_id)
+    except Exception as e:
+        raise ValueError(f"Cursor inválido: {token!r}") from e
+
+
+def parse_page_size(raw: Optional[str], default: int = 50, maximum: int = 200) -> int:
+    """Tamaño de página pedido, acotado a [1, maximum] (default si no viene o no es número)"""
+    try:
+        size = int(raw) if raw not in (None, '') else default
+    except (TypeError, ValueError):
+        size = default
+    return max(1, min(size, maximum))
+
+
+def keyset_page(query, sort_column, id_column, limit: int, cursor: Optional[str] = None) -> Page:
+    """
+    Página descendente por (sort_column, id_column)
+
+    sort_column no debe tener NULLs en las filas de la query (filtrarlos antes).
+
+    Args:
+        query: Query ya filtrada (sin order_by ni limit)
+        sort_column: Columna de orden principal (p.ej. APublicar.selected_at)
+        id_column: Desempate único (p.ej. APublicar.id)
+        limit: Tamaño de página
+        cursor: next_cursor de la página anterior (None = primera página)
+
+    Returns:
+        Page con los elementos y el cursor de la siguiente (None si es la última)
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    if cursor:
+        sort_value, item_id = decode_cursor(cursor)
+        query = query.filter(tuple_(sort_column, id_column) < tuple_(sort_value, item_id))
+
+    # Pedir uno de más para saber si hay otra página sin un COUNT
+    rows = query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return Page(items=rows, next_cursor=next_cursor)
@@ -0,0 +1,179 @@
+"""
+Reclamo de noticias para publicar con lease
+Cada publisher toma sus noticias con un único UPDATE atómico que las pasa de
+'procesado' a 'publicando' (FOR UPDATE SKIP LOCKED en PostgreSQL), así varias
+réplicas de SocialPublisher no publican dos veces la misma noticia. El lease
+se extiende con cada mark-published y con el heartbeat del publisher; si vence
+sin que se confirme la publicación, otro publisher la vuelve a reclamar
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import selectinload
+
+from src.models import db, APublicar
+
+logger = logging.getLogger(__name__)
+
+# Fase de las noticias reclamadas por un publisher
+FASE_CLAIMED = 'publicando'
+
+
+def _claimable(now: datetime):
+    """Noticias procesadas libres, o reclamadas con el lease vencido"""
+    return and_(
+        APublicar.procesado == True,  # noqa: E712
+        or_(
+            APublicar.fase == 'procesado',
+            and_(
+                APublicar.fase == FASE_CLAIMED,
+                APublicar.claimed_by.isnot(None),
+                APublicar.lease_expires_at < now
+            )
+        )
+    )
+
+
+def is_leased(noticia: APublicar, now: Optional[datetime] = None) -> bool:
+    """True si un publisher tiene la noticia reclamada con el lease vigente"""
+    now = now or datetime.utcnow()
+    return (
+        noticia.fase == FASE_CLAIMED
+        and noticia.claimed_by is not None
+        and noticia.lease_expires_at is not None
+        and noticia.lease_expires_at >= now
+    )
+
+
+def claim(publisher_id: str, limit: int = 10, lease_seconds: int = 1800,
+          platforms: Optional[List[str]] = None) -> List[APublicar]:
+    """
+    Reclama hasta `limit` noticias para un publisher y hace commit
+
+    Args:
+        publisher_id: Identificador del publisher que reclama
+        limit: Máximo de noticias a reclamar
+        lease_seconds: Duración del lease (se renueva con cada mark-published)
+        platforms: Plataformas del publisher; se fijan como plataformas_seleccionadas
+            en las noticias sin selección, para que mark-published sepa cuándo
+            la publicación terminó y libere el lease
+
+    Returns:
+        Noticias reclamadas, en orden de selección
+    """
+    now = datetime.utcnow()
+
+    candidates = (
+        select(APublicar.id)
+        .where(_claimable(now))
+        .order_by(APublicar.selected_at, APublicar.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    # La condición se repite afuera: si otra transacción cambió la fila entre el
+    # SELECT y el UPDATE, PostgreSQL la re-evalúa y la descarta
+    claimed_ids = db.session.execute(
+        update(APublicar)
+        .where(APublicar.id.in_(candidates.scalar_subquery()), _claimable(now))
+        .values(
+            fase=FASE_CLAIMED,
+            claimed_by=publisher_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            ultimo_intento=now
+        )
+        .returning(APublicar.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+
+    if not claimed_ids:
+        db.session.commit()
+        return []
+
+    noticias = (
+        APublicar.query
+        .options(selectinload(APublicar.attempts))
+        .filter(APublicar.id.in_(claimed_ids))
+        .order_by(APublicar.selected_at, APublicar.id)
+        .populate_existing()
+        .all()
+    )
+    if platforms:
+        for noticia in noticias:
+            if not noticia.plataformas_seleccionadas:
+                noticia.plataformas_seleccionadas = list(platforms)
+    db.session.commit()
+
+    logger.info(f"📤 {publisher_id} reclamó {len(noticias)} noticias: {[n.id for n in noticias]}")
+    return noticias
+
+
+def renew(noticia: APublicar, lease_seconds: int = 1800, now: Optional[datetime] = None):
+    """
+    Renueva o libera el lease según la fase (el llamador hace commit)
+
+    Mientras la noticia siga en 'publicando' el lease se extiende; en una fase
+    final (publicado_completo, publicado_parcial, fallido) se libera.
+    """
+    if not noticia.claimed_by:
+        return
+
+    if noticia.fase == FASE_CLAIMED:
+        now = now or datetime.utcnow()
+        noticia.lease_expires_at = now + timedelta(seconds=lease_seconds)
+    else:
+        noticia.claimed_by = None
+        noticia.lease_expires_at = None
+
+
+def heartbeat(publisher_id: str, noticia_ids: List[int],
+              lease_seconds: int = 1800) -> Tuple[List[int], List[int]]:
+    """
+    Extiende el lease de las noticias que un publisher tiene en su queue y hace commit
+
+    Sin esto, una noticia cuyas plataformas quedan diferidas (token bucket) o
+    en backoff más allá del lease la reclamaría otra réplica mientras sigue en
+    la queue del primero. Las reclamadas con el lease vencido (p.ej. el mismo
+    publisher tras reiniciar con otro pid) se toman como en claim().
+
+    Args:
+        publisher_id: Publisher que las tiene encoladas
+        noticia_ids: Noticias con mensajes pendientes en su queue
+        lease_seconds: Nueva duración del lease desde ahora
+
+    Returns:
+        (renovadas, perdidas): perdidas son las que otro publisher tiene con el
+        lease vigente; el llamador debe descartarlas para no publicar dos veces
+    """
+    if not noticia_ids:
+        return [], []
+
+    now = datetime.utcnow()
+    renewed = db.session.execute(
+        update(APublicar)
+        .where(
+            APublicar.id.in_(noticia_ids),
+            APublicar.fase == FASE_CLAIMED,
+            APublicar.claimed_by.isnot(None),
+            or_(APublicar.claimed_by == publisher_id, APublicar.lease_expires_at < now)
+        )
+        .values(claimed_by=publisher_id, lease_expires_at=now + timedelta(seconds=lease_seconds))
+        .returning(APublicar.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+
+    lost = db.session.execute(
+        select(APublicar.id).where(
+            APublicar.id.in_(noticia_ids),
+            APublicar.fase == FASE_CLAIMED,
+            APublicar.claimed_by.isnot(None),
+            APublicar.claimed_by != publisher_id
+        )
+    ).scalars().all()
+    db.session.commit()
+
+    if lost:
+        logger.warning(f"⚠️ {publisher_id} perdió el lease de {sorted(lost)}: las reclamó otro publisher")
+    return sorted(renewed), sorted(lost)
@@ -0,0 +1,183 @@
+"""
+Registro de resultados de publicación reportados por SocialPublisher
+Compartido por POST /api/news/<id>/mark-published (un resultado) y
+POST /api/news/mark-published-batch (muchos resultados, una transacción).
+Cada resultado es un INSERT en publication_attempts; la fase se deriva de
+los intentos de la noticia en lugar de reescribir un JSON por noticia
+"""
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from src import publication_lease
+from src.models import db, APublicar, PublicationAttempt
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = 'pending'
+STATUS_SUCCESS = 'success'
+STATUS_FAILED = 'failed'
+
+
+def record_pending(noticia: APublicar, platforms: List[str], now: Optional[datetime] = None):
+    """
+    Registra las plataformas elegidas como pendientes (el llamador hace commit)
+
+    Un 'pending' no cierra ninguna plataforma; tras un fallo la vuelve a abrir
+    (la fase queda en 'publicando' hasta el nuevo resultado).
+    """
+    now = now or datetime.utcnow()
+    db.session.add_all([
+        PublicationAttempt(noticia_id=noticia.id, platform=platform, status=STATUS_PENDING, attempted_at=now)
+        for platform in platforms
+    ])
+
+
+def platform_statuses(noticia_id: int, platforms: List[str]) -> Dict[str, str]:
+    """
+    Estado de cada plataforma de una noticia, con una sola consulta
+
+    Aplica PublicationAttempt.resolve_status (un éxito gana; si no, el último
+    intento), la misma regla que APublicar.plataformas_publicadas.
+
+    Returns:
+        {plataforma: status} de las plataformas de `platforms` con algún intento
+    """
+    intentos: Dict[str, List[str]] = {}
+    rows = db.session.query(PublicationAttempt.platform, PublicationAttempt.status).filter(
+        PublicationAttempt.noticia_id == noticia_id,
+        PublicationAttempt.platform.in_(platforms)
+    ).order_by(PublicationAttempt.id)
+    for platform, status in rows:
+        intentos.setdefault(platform, []).append(status)
+    return {platform: PublicationAttempt.resolve_status(statuses) for platform, statuses in intentos.items()}
+
+
+def platform_counts(noticia_id: int, platforms: List[str]) -> Tuple[int, int]:
+    """
+    Plataformas terminadas y exitosas de una noticia
+
+    Una plataforma está terminada si su estado (ver platform_statuses) es
+    success o failed: un reintento pendiente la vuelve a abrir.
+
+    Returns:
+        (completadas, exitosas) entre `platforms`
+    """
+    estados = platform_statuses(noticia_id, platforms).values()
+    completadas = sum(1 for status in estados if status in (STATUS_SUCCESS, STATUS_FAILED))
+    exitosas = sum(1 for status in estados if status == STATUS_SUCCESS)
+    return completadas, exitosas
+
+
+def derive_fase(noticia: APublicar) -> Optional[str]:
+    """
+    Fase según el estado de todas las plataformas seleccionadas
+
+    Returns:
+        La nueva fase, o None si la noticia no tiene plataformas seleccionadas
+    """
+    seleccionadas = list(dict.fromkeys(noticia.plataformas_seleccionadas or []))
+    if not seleccionadas:
+        return None
+
+    completadas, exitosas = platform_counts(noticia.id, seleccionadas)
+
+    if completadas < len(seleccionadas):
+        # Aún faltan plataformas por procesar
+        return 'publicando'
+    if exitosas == len(seleccionadas):
+        return 'publicado_completo'
+    if exitosas > 0:
+        return 'publicado_parcial'
+    return 'fallido'
+
+
+def apply_result(noticia: APublicar, data: Dict, lease_seconds: int = 1800) -> Dict:
+    """
+    Registra el resultado de una plataforma (el llamador hace commit)
+
+    Args:
+        noticia: Noticia publicada
+        data: {"platform", "post_id", "post_url", "error"}; con error es un fallo
+        lease_seconds: Renovación del lease si la noticia sigue publicándose
+
+    Returns:
+        Dict con platform, status y la fase resultante
+    """
+    platform = data['platform']
+    now = datetime.utcnow()
+    status = STATUS_FAILED if data.get('error') else STATUS_SUCCESS
+
+    db.session.add(PublicationAttempt(
+        noticia_id=noticia.id,
+        platform=platform,
+        status=status,
+        post_id=data.get('post_id') if status == STATUS_SUCCESS else None,
+        url=data.get('post_url') if status == STATUS_SUCCESS else None,
+        error=data.get('error'),
+        attempted_at=now
+    ))
+
+    noticia.intentos_publicacion = (noticia.intentos_publicacion or 0) + 1
+    if status == STATUS_FAILED:
+        noticia.ultimo_error = f"{platform}: {data['error']}"
+    else:
+        # Marcar como publicada si es la primera plataforma exitosa
+        if not noticia.publicado:
+            noticia.publicado = True
+            noticia.published_at = now
+        noticia.ultimo_error = None  # Limpiar error previo
+
+    # El INSERT tiene que estar en la BD antes de derivar la fase
+    db.session.flush()
+    fase = derive_fase(noticia)
+    if fase:
+        noticia.fase = fase
+
+    # Cada confirmación extiende el lease; en fase final lo libera
+    publication_lease.renew(noticia, lease_seconds, now=now)
+
+    return {
+        'noticia_id': noticia.id,
+        'platform': platform,
+        'status': status,
+        'fase': noticia.fase
+    }
+
+
+def apply_results(results: List[Dict], lease_seconds: int = 1800) -> List[Dict]:
+    """
+    Aplica muchos resultados con una sola consulta de noticias y un solo commit
+
+    Los resultados inválidos o de noticias inexistentes se informan con
+    status 'error' sin frenar al resto del lote.
+
+    Args:
+        results: Lista de {"noticia_id", "platform", "post_id", "post_url", "error"}
+        lease_seconds: Renovación del lease de las noticias que siguen publicándose
+
+    Returns:
+        Un resultado por entrada, en el mismo orden
+    """
+    ids = {r.get('noticia_id') for r in results if isinstance(r.get('noticia_id'), int)}
+    noticias = {
+        noticia.id: noticia
+        for noticia in APublicar.query.filter(APublicar.id.in_(ids))
+    } if ids else {}
+
+    applied = []
+    for data in results:
+        noticia_id = data.get('noticia_id')
+        if not data.get('platform'):
+            applied.append({'noticia_id': noticia_id, 'status': 'error', 'error': 'platform es requerido'})
+        elif noticia_id not in noticias:
+            applied.append({'noticia_id': noticia_id, 'platform': data['platform'],
+                            'status': 'error', 'error': 'Noticia no encontrada'})
+        else:
+            applied.append(apply_result(noticias[noticia_id], data, lease_seconds))
+
+    db.session.commit()
+
+    ok = sum(1 for r in applied if r['status'] != 'error')
+    logger.info(f"📝 Lote de publicación aplicado: {ok}/{len(results)} resultados")
+    return applied
@@ -0,0 +1,137 @@
+"""
+Política de retención para la tabla noticias
+Elimina (y opcionalmente archiva) noticias con sentencias set-based,
+sin cargar filas en memoria
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from sqlalchemy import delete, insert, literal, or_, select
+
+from src.models import db, Noticia, NoticiaArchivada
+
+logger = logging.getLogger(__name__)
+
+
+def _prune_condition(max_count: Optional[int], max_age_days: Optional[int]):
+    """
+    Construye la condición WHERE que identifica las noticias a podar
+
+    Args:
+        max_count: Cantidad máxima de noticias a conservar (las más recientes)
+        max_age_days: Antigüedad máxima en días según fecha_hora
+
+    Returns:
+        Expresión SQLAlchemy o None si no hay política activa
+    """
+    conditions = []
+
+    if max_count is not None and max_count >= 0:
+        # Conservar las N más recientes: id NOT IN (top N por fecha_hora)
+        keep_ids = (
+            select(Noticia.id)
+            .order_by(Noticia.fecha_hora.desc(), Noticia.id.desc())
+            .limit(max_count)
+        )
+        conditions.append(Noticia.id.not_in(keep_ids.scalar_subquery()))
+
+    if max_age_days:
+        cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+        conditions.append(Noticia.fecha_hora < cutoff)
+
+    if not conditions:
+        return None
+
+    return or_(*conditions)
+
+
+ARCHIVE_COLUMNS = ['noticia_id', 'titulo', 'texto', 'url', 'fecha_hora', 'temas', 'created_at', 'archived_at']
+ARCHIVE_CHUNK_SIZE = 500  # Ids por sentencia fuera de PostgreSQL (límite de parámetros de SQLite)
+
+
+def _move_to_archive(condition) -> int:
+    """
+    Archiva y elimina las noticias que cumplen `condition`
+
+    Las dos operaciones tienen que ver las mismas filas: evaluar el top N dos
+    veces deja una ventana en la que un borrado concurrente lo corre y se
+    elimina una noticia sin archivarla. En PostgreSQL es una sola sentencia
+    (WITH moved AS (DELETE ... RETURNING ...) INSERT ... SELECT FROM moved);
+    en el resto se toman los ids una vez y se usan en ambas.
+
+    Returns:
+        Cantidad de noticias movidas
+    """
+    archived_at = literal(datetime.utcnow(), NoticiaArchivada.archived_at.type)
+
+    if db.session.get_bind().dialect.name == 'postgresql':
+        moved = (
+            delete(Noticia)
+            .where(condition)
+            .returning(Noticia.id, Noticia.titulo, Noticia.texto, Noticia.url,
+                       Noticia.fecha_hora, Noticia.temas, Noticia.created_at)
+            .cte('moved')
+        )
+        result = db.session.execute(
+            insert(NoticiaArchivada).from_select(
+                ARCHIVE_COLUMNS,
+                select(moved.c.id, moved.c.titulo, moved.c.texto, moved.c.url,
+                       moved.c.fecha_hora, moved.c.temas, moved.c.created_at, archived_at)
+            ).execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
+    ids = db.session.execute(select(Noticia.id).where(condition)).scalars().all()
+    for start in range(0, len(ids), ARCHIVE_CHUNK_SIZE):
+        chunk = ids[start:start + ARCHIVE_CHUNK_SIZE]
+        db.session.execute(
+            insert(NoticiaArchivada).from_select(
+                ARCHIVE_COLUMNS,
+                select(Noticia.id, Noticia.titulo, Noticia.texto, Noticia.url,
+                       Noticia.fecha_hora, Noticia.temas, Noticia.created_at, archived_at)
+                .where(Noticia.id.in_(chunk))
+            )
+        )
+        db.session.execute(
+            delete(Noticia).where(Noticia.id.in_(chunk)).execution_options(synchronize_session=False)
+        )
+    return len(ids)
+
+
+def prune_noticias(
+    max_count: Optional[int] = None,
+    max_age_days: Optional[int] = None,
+    archive: bool = False
+) -> Dict[str, int]:
+    """
+    Poda la tabla noticias según políticas de cantidad y/o antigüedad
+
+    Una noticia se elimina si queda fuera de las max_count más recientes
+    o si es más antigua que max_age_days. Con archive=True las filas se
+    mueven a noticias_archivo (ver _move_to_archive). El llamador hace commit.
+
+    Args:
+        max_count: Cantidad máxima de noticias a conservar (None = sin límite)
+        max_age_days: Antigüedad máxima en días (None/0 = sin límite)
+        archive: Si True, mueve las filas a noticias_archivo en lugar de solo borrarlas
+
+    Returns:
+        Diccionario con 'eliminadas' y 'archivadas'
+    """
+    condition = _prune_condition(max_count, max_age_days)
+    if condition is None:
+        return {'eliminadas': 0, 'archivadas': 0}
+
+    if archive:
+        eliminadas = archivadas = _move_to_archive(condition)
+    else:
+        result = db.session.execute(
+            delete(Noticia).where(condition).execution_options(synchronize_session=False)
+        )
+        eliminadas = result.rowcount or 0
+        archivadas = 0
+
+    if eliminadas:
+        logger.info(f"🗑️ Retención: {eliminadas} noticias eliminadas ({archivadas} archivadas)")
+
+    return {'eliminadas': eliminadas, 'archivadas': archivadas}
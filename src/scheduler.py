@@ -0,0 +1,49 @@
+"""
+Proceso dedicado del scheduler de scraping
+Corre los jobs de register_jobs (src/app.py) una sola vez por despliegue,
+mientras la API escala en workers de gunicorn. scrape_and_save_news además
+toma un advisory lock, así que una segunda réplica o un /scrape/manual
+simultáneo no scrapean dos veces
+
+Uso:
+    python -m src.scheduler
+"""
+import logging
+import signal
+import sys
+from datetime import datetime
+
+from apscheduler.schedulers.blocking import BlockingScheduler
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, '/app')
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """
+    Función principal
+    """
+    from src.app import app, register_jobs
+
+    scheduler = BlockingScheduler()
+    interval_hours = register_jobs(scheduler)
+
+    if app.config.get('SCRAPE_ON_START', True):
+        # Scraping inicial, como hacía `python src/app.py` al arrancar
+        scheduler.modify_job('scrape_news', next_run_time=datetime.now())
+
+    def shutdown(*args):
+        logger.info("🛑 Scheduler deteniéndose...")
+        scheduler.shutdown(wait=False)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    logger.info(f"⏰ Scheduler iniciado - ejecutando cada {interval_hours} horas")
+    scheduler.start()
+
+
+if __name__ == '__main__':
+    main()
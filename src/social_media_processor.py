@@ -3,39 +3,71 @@ Procesador de contenido para redes sociales
 Integra traducción y optimización para diferentes plataformas
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Optional
+from flask import current_app, has_app_context
 from src.translation_service import TranslationService
+from src.batch_translation import BatchBackend, BatchTranslator
+from src.translation_cache import TranslationCache
 from src.models import APublicar, db
+from src.work_notifier import notifier
 
 logger = logging.getLogger(__name__)
 
+# Fases que pasan a 'procesado' al terminar la traducción si la noticia ya tiene
+# plataformas elegidas o AUTO_PUBLISH_PROCESSED está activo (las posteriores, p.ej.
+# un reproceso de algo ya publicado, no se vuelven a ofrecer al publisher)
+PRE_PUBLISH_PHASES = (None, 'pendiente', 'scrapeado', 'procesando')
+
 
 class SocialMediaProcessor:
     """
     Procesador que traduce y optimiza contenido para redes sociales
     """
 
-    def __init__(self, anthropic_api_key: Optional[str] = None):
+    def __init__(self, anthropic_api_key: Optional[str] = None, max_workers: int = 1):
         """
         Inicializa el procesador
 
         Args:
             anthropic_api_key: API key de Anthropic (opcional, usa .env si no se provee)
+            max_workers: Items procesados en paralelo en process_batch (1 = secuencial)
         """
+        self.max_workers = max(1, max_workers)
+        self.auto_publish = bool(has_app_context() and current_app.config.get('AUTO_PUBLISH_PROCESSED', False))
+
+        # Cache de traducciones por contenido (solo si hay app con BD disponible)
+        cache = TranslationCache.from_app(current_app._get_current_object()) if has_app_context() else None
+
         try:
-            self.translation_service = TranslationService(api_key=anthropic_api_key)
+            self.translation_service = TranslationService(
+                api_key=anthropic_api_key,
+                max_concurrency=self.max_workers,
+                cache=cache
+            )
             logger.info("✓ Servicio de traducción inicializado")
         except Exception as e:
             logger.error(f"✗ Error inicializando servicio de traducción: {e}")
             raise
 
-    def process_item(self, item_id: int) -> bool:
+    def _mark_ready(self, item: APublicar):
+        """
+        Dejar la noticia en fase 'procesado' (lista para que la reclame SocialPublisher)
+
+        Solo si el usuario ya eligió plataformas o AUTO_PUBLISH_PROCESSED está activo;
+        si no, espera a la selección en /apublicar (publicar-seleccionadas).
+        """
+        if item.fase in PRE_PUBLISH_PHASES and (item.plataformas_seleccionadas or self.auto_publish):
+            item.fase = 'procesado'
+
+    def process_item(self, item_id: int, use_cache: bool = True) -> bool:
         """
         Procesa un único item de APublicar
 
         Args:
             item_id: ID del item en la tabla APublicar
+            use_cache: False para ignorar el cache de traducciones y llamar a la API
 
         Returns:
             True si se procesó exitosamente, False en caso contrario
@@ -58,7 +90,8 @@ class SocialMediaProcessor:
             result = self.translation_service.translate_and_optimize(
                 titulo=item.titulo,
                 texto=item.texto,
-                url=item.url
+                url=item.url,
+                use_cache=use_cache
             )
 
             # Actualizar item con resultados
@@ -71,9 +104,11 @@ class SocialMediaProcessor:
             item.categoria = result['categoria']
             item.procesado = True
             item.processed_at = datetime.utcnow()
+            self._mark_ready(item)
 
             # Guardar en base de datos
             db.session.commit()
+            notifier.notify()
 
             logger.info(f"✓ Item {item_id} procesado exitosamente")
             logger.info(f"  - Categoría: {item.categoria}")
@@ -86,12 +121,18 @@ class SocialMediaProcessor:
             db.session.rollback()
             return False
 
-    def process_batch(self, item_ids: List[int]) -> Dict[str, int]:
+    def process_batch(self, item_ids: List[int], max_workers: Optional[int] = None) -> Dict[str, int]:
         """
         Procesa un lote de items
 
+        Con más de un worker cada item se procesa en su propio thread con su
+        propio app context (y por lo tanto su propia sesión de BD), y se
+        guarda apenas termina. La concurrencia real contra la API la regula
+        el limitador del TranslationService, que baja ante rate limits.
+
         Args:
             item_ids: Lista de IDs de items a procesar
+            max_workers: Workers en paralelo (None = el configurado en el procesador)
 
         Returns:
             Diccionario con estadísticas de procesamiento
@@ -105,22 +146,61 @@ class SocialMediaProcessor:
 
         logger.info(f"Iniciando procesamiento de {len(item_ids)} items...")
 
-        for item_id in item_ids:
-            # Verificar si ya fue procesado
-            item = APublicar.query.get(item_id)
-            if item and item.procesado:
-                stats['ya_procesados'] += 1
-                continue
+        # Verificar en una sola query cuáles ya fueron procesados
+        ya_procesados = {
+            item_id for (item_id,) in db.session.query(APublicar.id).filter(
+                APublicar.id.in_(item_ids),
+                APublicar.procesado == True
+            )
+        }
+        stats['ya_procesados'] = len(ya_procesados)
+        pendientes = [item_id for item_id in item_ids if item_id not in ya_procesados]
 
-            # Procesar item
-            if self.process_item(item_id):
-                stats['exitosos'] += 1
-            else:
-                stats['fallidos'] += 1
+        workers = min(max_workers or self.max_workers, len(pendientes))
+
+        if workers <= 1:
+            for item_id in pendientes:
+                if self.process_item(item_id):
+                    stats['exitosos'] += 1
+                else:
+                    stats['fallidos'] += 1
+        else:
+            app = current_app._get_current_object()
+
+            def worker(item_id: int) -> bool:
+                # App context propio = sesión de BD propia para este thread
+                with app.app_context():
+                    return self.process_item(item_id)
+
+            logger.info(f"Procesando {len(pendientes)} items con {workers} workers")
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='procesar') as executor:
+                futures = {executor.submit(worker, item_id): item_id for item_id in pendientes}
+
+                for future in as_completed(futures):
+                    try:
+                        ok = future.result()
+                    except Exception as e:
+                        logger.error(f"✗ Error procesando item {futures[future]}: {e}")
+                        ok = False
+
+                    if ok:
+                        stats['exitosos'] += 1
+                    else:
+                        stats['fallidos'] += 1
 
         logger.info(f"Procesamiento completado: {stats['exitosos']} exitosos, "
                    f"{stats['fallidos']} fallidos, {stats['ya_procesados']} ya procesados")
 
+        usage = self.translation_service.get_usage_stats()
+        logger.info(f"📊 Tokens: {usage['input_tokens']} input, {usage['output_tokens']} output, "
+                   f"cache {usage['cache_read_input_tokens']} leídos / {usage['cache_creation_input_tokens']} escritos "
+                   f"({usage['cache_hits']} hits, {usage['cache_misses']} misses)")
+
+        if self.translation_service.cache:
+            cache_stats = self.translation_service.cache.get_stats()
+            logger.info(f"⚡ Cache de traducciones: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
         return stats
 
     def process_all_pending(self, limit: Optional[int] = None) -> Dict[str, int]:
@@ -152,13 +232,130 @@ class SocialMediaProcessor:
 
         return self.process_batch(item_ids)
 
+    def submit_pending_batch(self, limit: Optional[int] = None,
+                             backend: Optional[BatchBackend] = None) -> Optional[str]:
+        """
+        Envía los items pendientes como un único batch offline
+
+        Pensado para backlogs grandes: la Message Batches API cobra la mitad
+        y no consume el rate limit de la API sincrónica, a cambio de una
+        latencia de minutos a horas.
+
+        Args:
+            limit: Número máximo de items a enviar (None = todos)
+            backend: Servidor de batches (None = API de Anthropic)
+
+        Returns:
+            ID del batch, o None si no hay pendientes
+        """
+        query = APublicar.query.filter(
+            APublicar.fase.in_(['pendiente', 'scrapeado']),
+            APublicar.procesado == False
+        ).order_by(APublicar.id)
+
+        if limit:
+            query = query.limit(limit)
+
+        noticias = [
+            {'id': item.id, 'titulo': item.titulo, 'texto': item.texto, 'url': item.url}
+            for item in query
+        ]
+
+        if not noticias:
+            logger.info("No hay items pendientes para enviar en batch")
+            return None
+
+        translator = BatchTranslator(self.translation_service, backend=backend)
+        return translator.submit(noticias)
+
+    def apply_batch_results(self, batch_id: str, backend: Optional[BatchBackend] = None,
+                            wait: bool = True, poll_interval: float = 60,
+                            timeout: float = 24 * 3600) -> Dict[str, int]:
+        """
+        Espera un batch y aplica sus resultados a APublicar en bloque
+
+        Carga todos los items con una sola query y guarda con un único commit.
+
+        Args:
+            batch_id: ID del batch devuelto por submit_pending_batch
+            backend: Servidor de batches (None = API de Anthropic)
+            wait: Si es False y el batch no terminó, no espera
+            poll_interval: Segundos entre consultas de estado
+            timeout: Segundos máximos de espera
+
+        Returns:
+            Diccionario con estadísticas de procesamiento
+        """
+        stats = {'total': 0, 'exitosos': 0, 'fallidos': 0, 'ya_procesados': 0}
+
+        translator = BatchTranslator(
+            self.translation_service,
+            backend=backend,
+            poll_interval=poll_interval,
+            timeout=timeout if wait else 0
+        )
+
+        if not translator.wait(batch_id):
+            logger.info(f"Batch {batch_id} todavía en proceso")
+            return stats
+
+        results = translator.collect(batch_id)
+        stats['total'] = len(results)
+
+        items = {
+            item.id: item
+            for item in APublicar.query.filter(APublicar.id.in_(list(results)))
+        }
+        now = datetime.utcnow()
+
+        for item_id, result in results.items():
+            item = items.get(item_id)
+
+            if not item or result.get('error') or not result.get('titulo_es'):
+                logger.error(f"✗ Batch {batch_id}: item {item_id} falló: {result.get('error', 'respuesta vacía')}")
+                stats['fallidos'] += 1
+                continue
+
+            if item.procesado:
+                stats['ya_procesados'] += 1
+                continue
+
+            item.titulo_es = result['titulo_es']
+            item.texto_es = result['texto_es']
+            item.resumen_corto = result['resumen_corto']
+            item.resumen_medio = result['resumen_medio']
+            item.resumen_largo = result['resumen_largo']
+            item.hashtags = result['hashtags']
+            item.categoria = result['categoria']
+            item.procesado = True
+            item.processed_at = now
+            self._mark_ready(item)
+            stats['exitosos'] += 1
+
+        try:
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"✗ Error guardando resultados del batch {batch_id}: {e}")
+            db.session.rollback()
+            stats['fallidos'] += stats['exitosos']
+            stats['exitosos'] = 0
+
+        if stats['exitosos']:
+            notifier.notify()
+
+        logger.info(f"Batch {batch_id} aplicado: {stats['exitosos']} exitosos, "
+                   f"{stats['fallidos']} fallidos, {stats['ya_procesados']} ya procesados")
+
+        return stats
+
     def reprocess_item(self, item_id: int, force: bool = False) -> bool:
         """
         Re-procesa un item ya procesado
 
         Args:
             item_id: ID del item
-            force: Si es True, fuerza el reprocesamiento aunque ya esté procesado
+            force: Si es True, fuerza el reprocesamiento aunque ya esté procesado,
+                con una nueva llamada a la API (sin cache de traducciones)
 
         Returns:
             True si se reprocesó exitosamente
@@ -181,7 +378,7 @@ class SocialMediaProcessor:
             db.session.commit()
 
             # Procesar nuevamente
-            return self.process_item(item_id)
+            return self.process_item(item_id, use_cache=not force)
 
         except Exception as e:
             logger.error(f"Error re-procesando item {item_id}: {e}")
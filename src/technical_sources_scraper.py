@@ -1,13 +1,20 @@
 """
 Scraper de fuentes técnicas especializadas en IA/ML usando RSS/Atom feeds
 """
+import hashlib
 import logging
+import time
 import feedparser
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from threading import Lock, BoundedSemaphore
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
-import re
+
+from src.html_text import html_to_text
+from src.topic_tagger import TopicTagger, get_tagger
 
 logger = logging.getLogger(__name__)
 
@@ -112,17 +119,51 @@ class TechnicalSourcesScraper:
         }
     }
 
-    def __init__(self, sources: Optional[List[str]] = None, days_back: int = 7):
+    # Tamaño de bloque al descargar feeds (permite cortar descargas lentas)
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    # Palabras máximas del texto de cada artículo
+    MAX_DESCRIPTION_WORDS = 1000
+
+    def __init__(
+        self,
+        sources: Optional[List[str]] = None,
+        days_back: int = 7,
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+        feed_timeout: float = 15,
+        total_deadline: float = 60,
+        feed_state: Optional[Dict[str, Dict]] = None,
+        tagger: Optional[TopicTagger] = None
+    ):
         """
         Inicializa el scraper de fuentes técnicas
 
         Args:
             sources: Lista de IDs de fuentes a scrapear (None = todas)
             days_back: Días hacia atrás para buscar artículos
+            max_workers: Feeds descargados en paralelo (1 = modo secuencial)
+            per_host_limit: Conexiones simultáneas máximas contra un mismo host
+            feed_timeout: Segundos máximos para descargar un feed
+            total_deadline: Segundos máximos para todo el ciclo de scraping
+            feed_state: Estado persistido por fuente ({source_id: {etag, last_modified,
+                content_hash, last_entry_at, last_entry_guids}}). Se actualiza in-place
+                y el llamador lo guarda.
+            tagger: Etiquetador de temas (None = taxonomía compartida del proceso)
         """
         self.sources = sources or list(self.TECHNICAL_SOURCES.keys())
         self.days_back = days_back
         self.cutoff_date = datetime.now() - timedelta(days=days_back)
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.feed_timeout = feed_timeout
+        self.total_deadline = total_deadline
+        self.feed_state = feed_state if feed_state is not None else {}
+        self.tagger = tagger or get_tagger()
+
+        # Un semáforo por host (arxiv aporta 2 feeds, no queremos saturarlo)
+        self._host_semaphores: Dict[str, BoundedSemaphore] = {}
+        self._host_lock = Lock()
 
     def fetch_all_sources(self, max_per_source: int = 10) -> List[Dict]:
         """
@@ -134,29 +175,27 @@ class TechnicalSourcesScraper:
         Returns:
             Lista de diccionarios con artículos
         """
-        all_articles = []
-
+        source_ids = []
         for source_id in self.sources:
             if source_id not in self.TECHNICAL_SOURCES:
                 logger.warning(f"Fuente desconocida: {source_id}")
                 continue
-
-            source_info = self.TECHNICAL_SOURCES[source_id]
-            logger.info(f"Scrapeando: {source_info['name']}")
-
-            try:
-                articles = self._fetch_rss_feed(
-                    source_info['rss_url'],
-                    source_info['name'],
-                    source_info['tipo'],
-                    max_per_source
-                )
-                all_articles.extend(articles)
-                logger.info(f"  ✓ {len(articles)} artículos obtenidos de {source_info['name']}")
-
-            except Exception as e:
-                logger.error(f"  ✗ Error scrapeando {source_info['name']}: {e}")
-                continue
+            source_ids.append(source_id)
+            # Crear el estado acá (no en los threads) para no mutar el dict en paralelo
+            self.feed_state.setdefault(source_id, {})
+
+        if self.max_workers > 1 and len(source_ids) > 1:
+            results = self._fetch_sources_concurrently(source_ids, max_per_source)
+        else:
+            results = {
+                source_id: self._fetch_source(source_id, max_per_source)
+                for source_id in source_ids
+            }
+
+        # Combinar en el mismo orden que self.sources, sin importar cuál terminó primero
+        all_articles = []
+        for source_id in source_ids:
+            all_articles.extend(results.get(source_id, []))
 
         # Eliminar duplicados por URL
         seen_urls = set()
@@ -174,42 +213,216 @@ class TechnicalSourcesScraper:
         logger.info(f"Total de artículos únicos: {len(unique_articles)}")
         return unique_articles
 
+    def _fetch_sources_concurrently(self, source_ids: List[str], max_per_source: int) -> Dict[str, List[Dict]]:
+        """
+        Descarga las fuentes en paralelo con un pool acotado de threads
+
+        Las fuentes que no terminan antes de total_deadline se omiten del ciclo.
+
+        Args:
+            source_ids: IDs de fuentes a scrapear
+            max_per_source: Máximo de artículos por fuente
+
+        Returns:
+            Diccionario {source_id: artículos} con las fuentes que terminaron a tiempo
+        """
+        results = {}
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(source_ids)),
+            thread_name_prefix='feed'
+        )
+        futures = {
+            executor.submit(self._fetch_source, source_id, max_per_source): source_id
+            for source_id in source_ids
+        }
+
+        try:
+            for future in as_completed(futures, timeout=self.total_deadline):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            pendientes = [source_id for future, source_id in futures.items() if not future.done()]
+            logger.warning(
+                f"⏱️ Deadline de {self.total_deadline}s alcanzado, fuentes omitidas: {', '.join(pendientes)}"
+            )
+        finally:
+            # No esperar a los threads colgados: su descarga se corta por feed_timeout
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def _fetch_source(self, source_id: str, max_per_source: int) -> List[Dict]:
+        """
+        Scrapea una fuente individual registrando el resultado
+
+        Args:
+            source_id: ID de la fuente en TECHNICAL_SOURCES
+            max_per_source: Máximo de artículos por fuente
+
+        Returns:
+            Lista de artículos (vacía si hubo error)
+        """
+        source_info = self.TECHNICAL_SOURCES[source_id]
+        logger.info(f"Scrapeando: {source_info['name']}")
+
+        try:
+            articles = self._fetch_rss_feed(
+                source_info['rss_url'],
+                source_info['name'],
+                source_info['tipo'],
+                max_per_source,
+                state=self.feed_state.setdefault(source_id, {})
+            )
+            logger.info(f"  ✓ {len(articles)} artículos obtenidos de {source_info['name']}")
+            return articles
+
+        except Exception as e:
+            logger.error(f"  ✗ Error scrapeando {source_info['name']}: {e}")
+            return []
+
+    @contextmanager
+    def _host_slot(self, feed_url: str):
+        """
+        Limita las conexiones simultáneas contra un mismo host
+
+        Args:
+            feed_url: URL del feed a descargar
+        """
+        host = urlparse(feed_url).netloc
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+
+        with semaphore:
+            yield
+
+    def _download_feed(self, feed_url: str, state: Optional[Dict] = None) -> Tuple[int, bytes, Dict[str, str]]:
+        """
+        Descarga el cuerpo de un feed respetando feed_timeout
+
+        El timeout de requests aplica a cada operación de socket, así que además
+        se controla el tiempo total para cortar servidores que envían lento.
+        Si hay validadores guardados se hace un GET condicional (ETag / Last-Modified).
+
+        Args:
+            feed_url: URL del feed
+            state: Estado guardado de la fuente (etag, last_modified)
+
+        Returns:
+            Tupla (status HTTP, contenido, headers HTTP en minúsculas).
+            Con status 304 el contenido viene vacío.
+
+        Raises:
+            TimeoutError: Si la descarga excede feed_timeout
+            requests.RequestException: Si falla la conexión o el status HTTP
+        """
+        request_headers = {'User-Agent': feedparser.USER_AGENT}
+        if state:
+            if state.get('etag'):
+                request_headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                request_headers['If-Modified-Since'] = state['last_modified']
+
+        with self._host_slot(feed_url):
+            started = time.monotonic()
+            response = requests.get(
+                feed_url,
+                headers=request_headers,
+                timeout=self.feed_timeout,
+                stream=True
+            )
+            try:
+                if response.status_code == 304:
+                    return 304, b'', {k.lower(): v for k, v in response.headers.items()}
+
+                response.raise_for_status()
+
+                chunks = []
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    if time.monotonic() - started > self.feed_timeout:
+                        raise TimeoutError(f"Descarga excedió {self.feed_timeout}s")
+
+                headers = {k.lower(): v for k, v in response.headers.items()}
+            finally:
+                response.close()
+
+        return response.status_code, b''.join(chunks), headers
+
     def _fetch_rss_feed(
         self,
         feed_url: str,
         source_name: str,
         tipo: str,
-        max_articles: int
+        max_articles: int,
+        state: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Obtiene artículos de un feed RSS/Atom
 
+        Si el servidor responde 304 o el contenido tiene el mismo hash que la
+        última vez, se omite el parseo y no se devuelven artículos. Además, solo
+        se devuelven entradas más nuevas que la última vista (high-water mark).
+
         Args:
             feed_url: URL del feed RSS
             source_name: Nombre de la fuente
             tipo: Tipo de contenido (Research, Tutorial, etc.)
             max_articles: Máximo de artículos a obtener
+            state: Estado persistido de la fuente (se actualiza in-place)
 
         Returns:
             Lista de artículos procesados
         """
+        if state is None:
+            state = {}
+
         try:
-            # Parsear el feed
-            feed = feedparser.parse(feed_url)
+            # Descargar con timeout propio (GET condicional si hay validadores)
+            status, content, headers = self._download_feed(feed_url, state)
+
+            if status == 304:
+                logger.info(f"  = {source_name}: sin cambios (304)")
+                return []
+
+            content_hash = hashlib.sha256(content).hexdigest()
+            if content_hash == state.get('content_hash'):
+                logger.info(f"  = {source_name}: contenido sin cambios (hash)")
+                self._update_validators(state, headers, content_hash)
+                return []
+
+            feed = feedparser.parse(content, response_headers=headers)
 
             if feed.bozo:
                 logger.warning(f"Feed mal formado: {feed_url} - {feed.bozo_exception}")
 
             articles = []
 
+            # High-water mark: fecha de la entrada más nueva emitida en corridas
+            # anteriores y los guids ya emitidos con esa misma fecha (varias
+            # entradas pueden compartirla)
+            last_entry_at = state.get('last_entry_at')
+            last_entry_guids = set(state.get('last_entry_guids') or [])
+            newest_at, newest_guids = last_entry_at, set(last_entry_guids)
+
             for entry in feed.entries[:max_articles * 2]:  # Obtener más para filtrar por fecha
                 # Parsear fecha de publicación
-                fecha_hora = self._parse_feed_date(entry)
+                entry_date = self._entry_date(entry)
+                fecha_hora = entry_date or datetime.now()
+                guid = self._entry_guid(entry)
 
                 # Filtrar artículos antiguos
                 if fecha_hora < self.cutoff_date:
                     continue
 
+                # Filtrar entradas ya vistas (las que no traen fecha quedan para el dedup por URL)
+                if entry_date and last_entry_at:
+                    if entry_date < last_entry_at:
+                        continue
+                    if entry_date == last_entry_at and guid in last_entry_guids:
+                        continue
+
                 # Extraer información
                 titulo = entry.get('title', 'Sin título').strip()
                 url = entry.get('link', '')
@@ -218,7 +431,7 @@ class TechnicalSourcesScraper:
                 texto = self._extract_description(entry)
 
                 # Extraer temas del feed
-                temas = self._extract_feed_topics(entry, tipo)
+                temas = self._extract_feed_topics(entry, tipo, texto)
 
                 # Agregar artículo
                 articles.append({
@@ -230,15 +443,36 @@ class TechnicalSourcesScraper:
                     'fuente': source_name
                 })
 
+                if entry_date and (newest_at is None or entry_date > newest_at):
+                    newest_at, newest_guids = entry_date, {guid}
+                elif entry_date and entry_date == newest_at:
+                    newest_guids.add(guid)
+
                 if len(articles) >= max_articles:
                     break
 
+            self._update_validators(state, headers, content_hash)
+            state['last_entry_at'] = newest_at
+            state['last_entry_guids'] = sorted(newest_guids)
             return articles
 
         except Exception as e:
             logger.error(f"Error procesando feed {feed_url}: {e}")
             return []
 
+    def _update_validators(self, state: Dict, headers: Dict[str, str], content_hash: str):
+        """
+        Guarda los validadores HTTP para el próximo GET condicional
+
+        Args:
+            state: Estado de la fuente a actualizar
+            headers: Headers de la respuesta (en minúsculas)
+            content_hash: SHA-256 del cuerpo descargado
+        """
+        state['etag'] = headers.get('etag')
+        state['last_modified'] = headers.get('last-modified')
+        state['content_hash'] = content_hash
+
     def _parse_feed_date(self, entry: Dict) -> datetime:
         """
         Parsea la fecha de publicación de una entrada de feed
@@ -249,6 +483,19 @@ class TechnicalSourcesScraper:
         Returns:
             Objeto datetime
         """
+        # Si no hay fecha válida, usar fecha actual
+        return self._entry_date(entry) or datetime.now()
+
+    def _entry_date(self, entry: Dict) -> Optional[datetime]:
+        """
+        Obtiene la fecha declarada por la entrada del feed
+
+        Args:
+            entry: Entrada del feed
+
+        Returns:
+            Objeto datetime o None si la entrada no trae fecha válida
+        """
         # Intentar diferentes campos de fecha
         date_fields = ['published_parsed', 'updated_parsed', 'created_parsed']
 
@@ -261,8 +508,19 @@ class TechnicalSourcesScraper:
                     except Exception:
                         pass
 
-        # Si no hay fecha válida, usar fecha actual
-        return datetime.now()
+        return None
+
+    def _entry_guid(self, entry: Dict) -> str:
+        """
+        Identificador estable de una entrada (guid/id del feed o, si falta, el link)
+
+        Args:
+            entry: Entrada del feed
+
+        Returns:
+            Identificador de la entrada (máximo 1000 caracteres)
+        """
+        return (entry.get('id') or entry.get('link') or entry.get('title', ''))[:1000]
 
     def _extract_description(self, entry: Dict) -> str:
         """
@@ -287,49 +545,33 @@ class TechnicalSourcesScraper:
             else:
                 content = str(entry.content)
 
-        # Limpiar HTML
+        # Limpiar HTML y limitar a MAX_DESCRIPTION_WORDS palabras en la misma pasada
         if content:
             content = self._clean_html(content)
 
-        # Limitar a 1000 palabras
-        palabras = content.split()
-        if len(palabras) > 1000:
-            content = ' '.join(palabras[:1000]) + '...'
-
         return content if content else 'Sin contenido disponible'
 
     def _clean_html(self, html_text: str) -> str:
         """
-        Limpia tags HTML del texto
+        Limpia tags HTML del texto (sin script/style, entidades decodificadas)
 
         Args:
             html_text: Texto con HTML
 
         Returns:
-            Texto limpio
+            Texto limpio, con '...' si se cortó en MAX_DESCRIPTION_WORDS palabras
         """
-        try:
-            soup = BeautifulSoup(html_text, 'html.parser')
-            text = soup.get_text(separator=' ', strip=True)
-
-            # Limpiar espacios múltiples
-            text = re.sub(r'\s+', ' ', text)
-
-            return text.strip()
+        text, truncated = html_to_text(html_text, max_words=self.MAX_DESCRIPTION_WORDS)
+        return text + '...' if truncated else text
 
-        except Exception:
-            # Si falla el parsing, intentar limpieza básica
-            text = re.sub(r'<[^>]+>', '', html_text)
-            text = re.sub(r'\s+', ' ', text)
-            return text.strip()
-
-    def _extract_feed_topics(self, entry: Dict, tipo: str) -> List[str]:
+    def _extract_feed_topics(self, entry: Dict, tipo: str, texto: str = '') -> List[str]:
         """
         Extrae temas de una entrada de feed
 
         Args:
             entry: Entrada del feed
             tipo: Tipo de fuente
+            texto: Descripción ya limpia de la entrada
 
         Returns:
             Lista de strings con temas (3-5 temas)
@@ -339,49 +581,27 @@ class TechnicalSourcesScraper:
         # Agregar tipo de fuente como primer tema
         topics.append(tipo)
 
-        # Extraer tags/categorías del feed
+        def add(topic: str):
+            if topic and topic.lower() not in {t.lower() for t in topics}:
+                topics.append(topic)
+
+        # Extraer tags/categorías del feed (con el nombre de la taxonomía si lo tienen)
         if hasattr(entry, 'tags'):
             for tag in entry.tags[:3]:
                 tag_name = tag.get('term', '').strip()
-                if tag_name and tag_name not in topics:
-                    topics.append(tag_name.title())
-
-        # Extraer keywords técnicas del título
-        titulo = entry.get('title', '').lower()
-
-        ai_keywords = {
-            'llm': 'LLM',
-            'gpt': 'GPT',
-            'transformer': 'Transformers',
-            'bert': 'BERT',
-            'pytorch': 'PyTorch',
-            'tensorflow': 'TensorFlow',
-            'neural': 'Neural Networks',
-            'deep learning': 'Deep Learning',
-            'machine learning': 'Machine Learning',
-            'computer vision': 'Computer Vision',
-            'nlp': 'NLP',
-            'reinforcement learning': 'Reinforcement Learning',
-            'gan': 'GAN',
-            'diffusion': 'Diffusion Models',
-            'stable diffusion': 'Stable Diffusion',
-            'dalle': 'DALL-E',
-            'chatgpt': 'ChatGPT',
-            'claude': 'Claude',
-            'anthropic': 'Anthropic',
-            'openai': 'OpenAI',
-            'hugging face': 'Hugging Face'
-        }
+                add(self.tagger.canonical(tag_name) or tag_name.title())
 
-        for keyword, topic in ai_keywords.items():
-            if keyword in titulo and topic not in topics:
-                topics.append(topic)
-                if len(topics) >= 5:
-                    break
+        # Temas de la taxonomía compartida (título con más peso que la descripción)
+        for topic in self.tagger.tag(entry.get('title', ''), texto):
+            if len(topics) >= 5:
+                break
+            add(topic)
 
         # Asegurar al menos 3 temas
-        if len(topics) < 3:
-            topics.extend(['AI', 'Machine Learning', 'Technology'][:3 - len(topics)])
+        for default in ('AI', 'Machine Learning', 'Technology'):
+            if len(topics) >= 3:
+                break
+            add(default)
 
         return topics[:5]  # Retornar lista directamente (compatible con PostgreSQL ARRAY)
 
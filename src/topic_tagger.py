@@ -0,0 +1,207 @@
+"""
+Etiquetado de temas con un autómata Aho-Corasick
+Compila todos los sinónimos de la taxonomía (config/topics.json) en un solo
+autómata, así etiquetar un texto es O(largo del texto + coincidencias) sin
+importar cuántos temas haya. Lo comparten NewsScraper y TechnicalSourcesScraper
+"""
+import json
+import logging
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOPICS_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'topics.json'
+)
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _normalize(text: str) -> str:
+    """Minúsculas y espacios colapsados (los patrones y el texto se comparan así)"""
+    return _WHITESPACE.sub(' ', (text or '').lower())
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class _Automaton:
+    """Autómata Aho-Corasick sobre caracteres (trie + enlaces de fallo)"""
+
+    def __init__(self, patterns: List[str]):
+        self.lengths = [len(pattern) for pattern in patterns]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._out[state].append(index)
+
+        # Enlaces de fallo por BFS: el sufijo propio más largo que también es prefijo
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Recorre el texto una sola vez
+
+        Yields:
+            (inicio, índice del patrón) de cada coincidencia, solapadas incluidas
+        """
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._out[state]:
+                yield position + 1 - self.lengths[index], index
+
+
+class TopicTagger:
+    """
+    Etiquetador de temas con coincidencia por palabra completa
+
+    Cada tema tiene uno o más sinónimos; 'gpt' coincide en 'GPT-4' pero no en
+    'ChatGPT'. Cuando dos sinónimos se solapan gana el que empieza antes y,
+    a igual inicio, el más largo ('stable diffusion' antes que 'diffusion').
+    Las apariciones en el título pesan title_weight y las del cuerpo body_weight;
+    a igual puntaje va primero el tema que aparece antes.
+    """
+
+    def __init__(self, topics: Dict[str, List[str]], title_weight: float = 3.0, body_weight: float = 1.0):
+        """
+        Args:
+            topics: {tema: [sinónimos]}
+            title_weight: Peso de cada aparición en el título
+            body_weight: Peso de cada aparición en el cuerpo
+        """
+        self.title_weight = title_weight
+        self.body_weight = body_weight
+        self.topics = list(topics)
+
+        patterns, self._labels = [], []
+        for label, synonyms in topics.items():
+            for synonym in dict.fromkeys(_normalize(s).strip() for s in [label, *synonyms]):
+                if synonym:
+                    patterns.append(synonym)
+                    self._labels.append(label)
+        self._synonyms = dict(zip(patterns, self._labels))
+        self._automaton = _Automaton(patterns)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'TopicTagger':
+        """
+        Carga la taxonomía desde un JSON {"topics": {...}, "title_weight", "body_weight"}
+
+        Raises:
+            OSError, ValueError: Si el archivo no existe o no es válido
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        topics = data.get('topics')
+        if not isinstance(topics, dict):
+            raise ValueError(f"{path}: falta el objeto 'topics'")
+
+        return cls(
+            topics,
+            title_weight=float(data.get('title_weight', 3)),
+            body_weight=float(data.get('body_weight', 1))
+        )
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Tema de la taxonomía si `term` completo es uno de sus sinónimos ('pytorch' → 'PyTorch')"""
+        return self._synonyms.get(_normalize(term).strip())
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Temas presentes en un texto
+
+        Returns:
+            Lista de (posición, tema) sin solapamientos, en orden de aparición
+        """
+        text = _normalize(text)
+        candidates = []
+        for start, index in self._automaton.iter_matches(text):
+            end = start + self._automaton.lengths[index]
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end < len(text) and _is_word_char(text[end]):
+                continue
+            candidates.append((start, -end, index))
+
+        # Leftmost-longest: descartar coincidencias dentro de una ya aceptada
+        matches, covered_until = [], 0
+        for start, neg_end, index in sorted(candidates):
+            if start >= covered_until:
+                matches.append((start, self._labels[index]))
+                covered_until = -neg_end
+        return matches
+
+    def tag(self, title: str, body: str = '', max_topics: int = 5) -> List[str]:
+        """
+        Temas de un artículo ordenados por relevancia
+
+        Args:
+            title: Título del artículo
+            body: Resumen o texto del artículo
+            max_topics: Máximo de temas a devolver
+
+        Returns:
+            Lista de temas (puede estar vacía si nada coincide)
+        """
+        scores: Dict[str, float] = {}
+        first_seen: Dict[str, Tuple[int, int]] = {}
+
+        for section, (text, weight) in enumerate(((title, self.title_weight), (body, self.body_weight))):
+            for position, label in self.find(text):
+                scores[label] = scores.get(label, 0) + weight
+                first_seen.setdefault(label, (section, position))
+
+        ranked = sorted(scores, key=lambda label: (-scores[label], first_seen[label]))
+        return ranked[:max_topics]
+
+
+@lru_cache(maxsize=None)
+def _load_tagger(path: str) -> TopicTagger:
+    try:
+        tagger = TopicTagger.from_file(path)
+        logger.info(f"🏷️ Taxonomía de temas cargada: {len(tagger.topics)} temas ({path})")
+        return tagger
+    except (OSError, ValueError) as e:
+        logger.error(f"❌ No se pudo cargar la taxonomía de temas {path}: {e}")
+        return TopicTagger({})
+
+
+def get_tagger(path: Optional[str] = None) -> TopicTagger:
+    """
+    Etiquetador compartido, compilado una vez por proceso y por archivo
+
+    Args:
+        path: Archivo de taxonomía (None = TOPICS_FILE o config/topics.json)
+
+    Returns:
+        TopicTagger (vacío si el archivo no se pudo cargar; el error queda en el log)
+    """
+    return _load_tagger(os.path.abspath(path or os.getenv('TOPICS_FILE') or DEFAULT_TOPICS_FILE))
@@ -0,0 +1,209 @@
+"""
+Cache persistente de traducciones direccionado por contenido
+Evita pagar otra llamada a Claude cuando el mismo artículo vuelve con otra URL
+(sindicación, parámetros de tracking) o se reprocesa
+"""
+import hashlib
+import logging
+import re
+import unicodedata
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Optional
+
+from sqlalchemy import delete, select, update
+
+from src.models import db, TranslationCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """
+    Cache de resultados de translate_and_optimize en la tabla translation_cache
+
+    Cada operación corre en su propio app context (y por lo tanto en su propia
+    sesión de BD): no interfiere con la sesión del llamador y se puede usar
+    desde los threads de batch_translate. Ante errores de BD se comporta como
+    un miss, nunca rompe la traducción.
+    """
+
+    def __init__(self, app, ttl_days: int = 30, max_entries: int = 10000, evict_every: int = 50):
+        """
+        Args:
+            app: Aplicación Flask con la BD inicializada
+            ttl_days: Días de validez de una entrada (0 = sin vencimiento)
+            max_entries: Entradas máximas; se desalojan las menos usadas recientemente (0 = sin límite)
+            evict_every: Cada cuántas escrituras se ejecuta el desalojo
+        """
+        self.app = app
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self.evict_every = max(1, evict_every)
+
+        self._lock = Lock()
+        self._writes_since_evict = 0
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evicted': 0, 'errors': 0}
+
+    @classmethod
+    def from_app(cls, app) -> Optional['TranslationCache']:
+        """
+        Crea el cache según la configuración de la app
+
+        Args:
+            app: Aplicación Flask
+
+        Returns:
+            TranslationCache, o None si TRANSLATION_CACHE_ENABLED está desactivado
+        """
+        if not app.config.get('TRANSLATION_CACHE_ENABLED', True):
+            return None
+
+        return cls(
+            app,
+            ttl_days=app.config.get('TRANSLATION_CACHE_TTL_DAYS', 30),
+            max_entries=app.config.get('TRANSLATION_CACHE_MAX_ENTRIES', 10000)
+        )
+
+    @staticmethod
+    def normalize(text: Optional[str]) -> str:
+        """Normaliza Unicode (NFKC) y colapsa espacios en blanco"""
+        return re.sub(r'\s+', ' ', unicodedata.normalize('NFKC', text or '')).strip()
+
+    @classmethod
+    def make_key(cls, model: str, prompt_version: str, titulo: str, texto: str) -> str:
+        """
+        Clave del cache: SHA-256 de modelo, versión del prompt y contenido normalizado
+
+        La URL no forma parte de la clave a propósito: el mismo cuerpo bajo
+        otra URL debe reutilizar la traducción.
+
+        Returns:
+            Hash hexadecimal de 64 caracteres
+        """
+        payload = '\x1f'.join([model, prompt_version, cls.normalize(titulo), cls.normalize(texto)])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Busca un resultado cacheado
+
+        Args:
+            key: Clave generada con make_key
+
+        Returns:
+            Resultado de la traducción, o None si no está o venció
+        """
+        try:
+            with self.app.app_context():
+                query = select(TranslationCacheEntry.result).where(TranslationCacheEntry.key == key)
+                if self.ttl_days:
+                    query = query.where(TranslationCacheEntry.created_at >= self._cutoff())
+                result = db.session.execute(query).scalar_one_or_none()
+
+                if result is not None:
+                    db.session.execute(
+                        update(TranslationCacheEntry)
+                        .where(TranslationCacheEntry.key == key)
+                        .values(hits=TranslationCacheEntry.hits + 1, last_hit_at=datetime.utcnow())
+                    )
+                    db.session.commit()
+        except Exception as e:
+            logger.warning(f"⚠️ Error leyendo cache de traducciones: {e}")
+            self._count('errors')
+            result = None
+
+        self._count('hits' if result is not None else 'misses')
+        return dict(result) if result is not None else None
+
+    def set(self, key: str, model: str, result: Dict[str, str]) -> None:
+        """
+        Guarda un resultado (reemplaza la entrada si ya existía)
+
+        Args:
+            key: Clave generada con make_key
+            model: Modelo que generó el resultado
+            result: Diccionario devuelto por translate_and_optimize
+        """
+        try:
+            with self.app.app_context():
+                now = datetime.utcnow()
+                db.session.merge(TranslationCacheEntry(
+                    key=key, model=model, result=dict(result), hits=0,
+                    created_at=now, last_hit_at=now
+                ))
+                db.session.commit()
+        except Exception as e:
+            # Dos threads guardando la misma clave: alcanza con una
+            logger.warning(f"⚠️ Error guardando en cache de traducciones: {e}")
+            self._count('errors')
+            return
+
+        self._count('stores')
+
+        with self._lock:
+            self._writes_since_evict += 1
+            due = self._writes_since_evict >= self.evict_every
+            if due:
+                self._writes_since_evict = 0
+
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Elimina entradas vencidas y, si se supera max_entries, las menos usadas
+
+        Returns:
+            Cantidad de entradas eliminadas
+        """
+        eliminadas = 0
+
+        try:
+            with self.app.app_context():
+                if self.ttl_days:
+                    eliminadas += db.session.execute(
+                        delete(TranslationCacheEntry)
+                        .where(TranslationCacheEntry.created_at < self._cutoff())
+                        .execution_options(synchronize_session=False)
+                    ).rowcount or 0
+
+                if self.max_entries:
+                    keep = (
+                        select(TranslationCacheEntry.key)
+                        .order_by(TranslationCacheEntry.last_hit_at.desc())
+                        .limit(self.max_entries)
+                    )
+                    eliminadas += db.session.execute(
+                        delete(TranslationCacheEntry)
+                        .where(TranslationCacheEntry.key.not_in(keep.scalar_subquery()))
+                        .execution_options(synchronize_session=False)
+                    ).rowcount or 0
+
+                db.session.commit()
+        except Exception as e:
+            logger.warning(f"⚠️ Error desalojando cache de traducciones: {e}")
+            self._count('errors')
+            return 0
+
+        if eliminadas:
+            logger.info(f"🧹 Cache de traducciones: {eliminadas} entradas desalojadas")
+        self._count('evicted', eliminadas)
+        return eliminadas
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Contadores del cache desde que se creó esta instancia
+
+        Returns:
+            Diccionario con hits, misses, stores, evicted y errors
+        """
+        with self._lock:
+            return dict(self.stats)
+
+    def _cutoff(self) -> datetime:
+        return datetime.utcnow() - timedelta(days=self.ttl_days)
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
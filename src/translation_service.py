@@ -2,12 +2,255 @@
 Servicio de traducción y optimización de contenido usando Claude API
 """
 import os
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition, Lock
 from typing import Dict, List, Optional
-from anthropic import Anthropic
 
 logger = logging.getLogger(__name__)
 
+# Status HTTP con los que la API indica rate limit (429) o sobrecarga (529)
+RATE_LIMIT_STATUS_CODES = (429, 529)
+
+# Instrucciones fijas de traducción, en un bloque de system marcado para prompt
+# caching. El glosario y el ejemplo fijan la terminología y además llevan el bloque
+# por encima de PROMPT_CACHE_MIN_TOKENS: más corto, Sonnet no lo cachea
+# (ver _check_prompt_cache y el test que lo verifica)
+TRANSLATION_SYSTEM_PROMPT = """Eres un experto en traducción técnica de contenido sobre Inteligencia Artificial y ciencia de datos.
+
+Tu tarea es traducir el artículo que te envíe el usuario de inglés a español y generar contenido optimizado para redes sociales.
+
+**INSTRUCCIONES:**
+
+1. **Traducción al español:**
+   - Traduce el título y contenido manteniendo la precisión técnica
+   - Usa terminología técnica en español (ej: "aprendizaje automático", "redes neuronales")
+   - Mantén los nombres propios de herramientas/frameworks en inglés (TensorFlow, PyTorch, etc.)
+
+2. **Categorización:**
+   - Determina la categoría del artículo: Tutorial, Research, Tools, Case Study, News, Opinion, o General
+   - Base tu decisión en el contenido y enfoque del artículo
+
+3. **Resúmenes para RRSS:**
+   - **Resumen Corto** (máximo 280 caracteres): Para Twitter/LinkedIn. Debe ser impactante y conciso.
+   - **Resumen Medio** (máximo 1000 caracteres): Para Facebook. Más contexto y detalle.
+   - **Resumen Largo** (800-1000 caracteres): Para Instagram/WhatsApp/Blog. Explicación más detallada.
+
+4. **Hashtags:**
+   - Genera 5-8 hashtags relevantes en español
+   - Incluye hashtags generales (#IA, #MachineLearning) y específicos del tema
+   - Usa CamelCase para mejor legibilidad
+
+5. **Glosario (usa siempre estas traducciones):**
+   - artificial intelligence → inteligencia artificial (IA)
+   - machine learning → aprendizaje automático
+   - deep learning → aprendizaje profundo
+   - neural network → red neuronal
+   - large language model (LLM) → modelo de lenguaje grande (LLM)
+   - training / fine-tuning → entrenamiento / ajuste fino
+   - inference → inferencia
+   - dataset → conjunto de datos
+   - benchmark → benchmark (referencia de evaluación)
+   - weights / parameters → pesos / parámetros
+   - prompt → prompt (instrucción)
+   - embedding → embedding (representación vectorial)
+   - reinforcement learning → aprendizaje por refuerzo
+   - supervised / unsupervised learning → aprendizaje supervisado / no supervisado
+   - computer vision → visión por computadora
+   - natural language processing (NLP) → procesamiento de lenguaje natural (PLN)
+   - open source → código abierto
+   - open weights → pesos abiertos
+   - data science → ciencia de datos
+   - data pipeline → pipeline de datos
+   - feature → característica (en modelos) / funcionalidad (en productos)
+   - overfitting → sobreajuste
+   - hallucination → alucinación
+   - agent → agente
+   - chip / GPU / accelerator → chip / GPU / acelerador
+   - startup → startup
+   - funding round → ronda de financiación
+   - Mantén en inglés las siglas y nombres propios: GPT, BERT, RAG, API, CUDA, Hugging Face, OpenAI, Anthropic, Google DeepMind
+
+6. **Estilo:**
+   - Español neutro, sin regionalismos, en tercera persona
+   - No agregues datos, cifras ni opiniones que no estén en el artículo original
+   - No incluyas URLs, menciones (@) ni emojis en los resúmenes
+   - Las cifras y unidades se mantienen como en el original (ej: "175B parámetros", "2,5x más rápido")
+   - Si el texto original está incompleto o truncado, traduce lo que hay sin inventar el resto
+
+**EJEMPLO:**
+
+Artículo de entrada:
+Título: Researchers release open weights model that beats larger LLMs on reasoning benchmarks
+Contenido: A team of researchers released a 7B parameter open weights model trained with reinforcement learning. On math and coding benchmarks it outperforms models ten times its size, and it runs on a single consumer GPU.
+
+Respuesta esperada:
+
+[TITULO_ES]
+Investigadores publican un modelo de pesos abiertos que supera a LLMs más grandes en benchmarks de razonamiento
+[/TITULO_ES]
+
+[TEXTO_ES]
+Un equipo de investigadores publicó un modelo de pesos abiertos de 7B parámetros entrenado con aprendizaje por refuerzo. En benchmarks de matemáticas y programación supera a modelos diez veces más grandes, y se ejecuta en una sola GPU de consumo.
+[/TEXTO_ES]
+
+[RESUMEN_CORTO]
+Un modelo de pesos abiertos de 7B parámetros, entrenado con aprendizaje por refuerzo, supera a LLMs diez veces más grandes en matemáticas y programación, y corre en una sola GPU de consumo.
+[/RESUMEN_CORTO]
+
+[RESUMEN_MEDIO]
+Investigadores publicaron un modelo de pesos abiertos de 7B parámetros entrenado con aprendizaje por refuerzo. En benchmarks de razonamiento matemático y de programación obtiene mejores resultados que modelos diez veces más grandes. Además, se ejecuta en una sola GPU de consumo, lo que facilita que equipos pequeños lo prueben y lo adapten.
+[/RESUMEN_MEDIO]
+
+[RESUMEN_LARGO]
+Un equipo de investigadores publicó un nuevo modelo de pesos abiertos de 7B parámetros entrenado con aprendizaje por refuerzo. Según los benchmarks de matemáticas y programación presentados, el modelo supera a LLMs diez veces más grandes en tareas de razonamiento. Otro punto destacado es su eficiencia: se ejecuta en una sola GPU de consumo, sin necesidad de infraestructura especializada. Esto lo vuelve accesible para investigadores, startups y desarrolladores que quieran experimentar con modelos de razonamiento o ajustarlos a sus propios casos de uso.
+[/RESUMEN_LARGO]
+
+[HASHTAGS]
+#IA, #LLM, #PesosAbiertos, #AprendizajePorRefuerzo, #CódigoAbierto, #MachineLearning
+[/HASHTAGS]
+
+[CATEGORIA]
+Research
+[/CATEGORIA]
+
+**FORMATO DE RESPUESTA:**
+Devuelve EXACTAMENTE en este formato (respeta las etiquetas):
+
+[TITULO_ES]
+Título traducido aquí
+[/TITULO_ES]
+
+[TEXTO_ES]
+Texto completo traducido aquí
+[/TEXTO_ES]
+
+[RESUMEN_CORTO]
+Resumen de máximo 280 caracteres
+[/RESUMEN_CORTO]
+
+[RESUMEN_MEDIO]
+Resumen de máximo 1000 caracteres
+[/RESUMEN_MEDIO]
+
+[RESUMEN_LARGO]
+Resumen extenso de 800-1000 caracteres
+[/RESUMEN_LARGO]
+
+[HASHTAGS]
+#Hashtag1, #Hashtag2, #Hashtag3, etc
+[/HASHTAGS]
+
+[CATEGORIA]
+Categoría (una sola palabra)
+[/CATEGORIA]"""
+
+# Versión del prompt para el cache de traducciones: cambia sola al editar las instrucciones
+PROMPT_VERSION = hashlib.sha256(TRANSLATION_SYSTEM_PROMPT.encode('utf-8')).hexdigest()[:12]
+
+# Tamaño mínimo de un prefijo cacheable en Sonnet; debajo de esto cache_control se ignora
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+_prompt_cache_checked = False
+
+
+def _estimate_tokens(text: str) -> int:
+    """Estimación gruesa de tokens (~4 caracteres por token)"""
+    return len(text) // 4
+
+
+def _check_prompt_cache():
+    """Avisar una vez por proceso si una edición dejó el bloque de system debajo del mínimo cacheable"""
+    global _prompt_cache_checked
+    if _prompt_cache_checked:
+        return
+    _prompt_cache_checked = True
+
+    tokens = _estimate_tokens(TRANSLATION_SYSTEM_PROMPT)
+    if tokens < PROMPT_CACHE_MIN_TOKENS:
+        logger.warning(
+            f"⚠️ Prompt caching inactivo: el system prompt tiene ~{tokens} tokens "
+            f"(mínimo {PROMPT_CACHE_MIN_TOKENS}); cada artículo se factura completo"
+        )
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limita las llamadas concurrentes a la API y se adapta a los rate limits
+
+    Sigue un esquema AIMD: cada ronda de éxitos sube el límite en 1 (hasta
+    max_concurrency) y cada 429/529 lo reduce a la mitad y pausa a todos
+    los workers durante el backoff (o el retry-after que indique la API).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        base_backoff: float = 2.0,
+        max_backoff: float = 60.0
+    ):
+        """
+        Args:
+            max_concurrency: Llamadas simultáneas máximas
+            min_concurrency: Piso al reducir por rate limit
+            base_backoff: Pausa inicial (segundos) tras un rate limit
+            max_backoff: Pausa máxima (segundos)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.limit = self.max_concurrency
+        self.active = 0
+        self._backoff = base_backoff
+        self._successes = 0
+        self._paused_until = 0.0
+        self._condition = Condition()
+
+    def acquire(self):
+        """Bloquea hasta que haya un slot libre y no haya pausa activa"""
+        with self._condition:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    self._condition.wait(pause)
+                    continue
+                if self.active < self.limit:
+                    self.active += 1
+                    return
+                self._condition.wait()
+
+    def release(self, rate_limited: bool = False, retry_after: Optional[float] = None):
+        """
+        Libera un slot y ajusta el límite según el resultado de la llamada
+
+        Args:
+            rate_limited: True si la API respondió 429/529
+            retry_after: Segundos sugeridos por la API (header retry-after)
+        """
+        with self._condition:
+            self.active -= 1
+
+            if rate_limited:
+                self.limit = max(self.min_concurrency, self.limit // 2)
+                pause = retry_after if retry_after else self._backoff
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                self._backoff = min(self._backoff * 2, self.max_backoff)
+                self._successes = 0
+                logger.warning(f"⏳ Rate limit de la API: concurrencia {self.limit}, pausa {pause:.1f}s")
+            else:
+                self._backoff = self.base_backoff
+                self._successes += 1
+                if self.limit < self.max_concurrency and self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+
+            self._condition.notify_all()
+
 
 class TranslationService:
     """
@@ -15,28 +258,74 @@ class TranslationService:
     contenido optimizado para redes sociales usando Claude API
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 1,
+        max_rate_limit_retries: int = 5,
+        cache=None
+    ):
         """
         Inicializa el servicio de traducción
 
         Args:
             api_key: API key de Anthropic (si no se provee, usa variable de entorno)
+            max_concurrency: Llamadas simultáneas máximas a la API (se reduce ante 429)
+            max_rate_limit_retries: Reintentos por artículo cuando la API responde 429/529
+            cache: TranslationCache opcional delante de translate_and_optimize
         """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
         if not self.api_key:
             raise ValueError("Se requiere ANTHROPIC_API_KEY en .env o como parámetro")
 
-        self.client = Anthropic(api_key=self.api_key)
+        _check_prompt_cache()
+
+        self._client = None  # Se crea en el primer uso (importar anthropic es caro)
+        self._client_lock = Lock()
         self.model = "claude-sonnet-4-5"  # Claude Sonnet 4.5
+        self.limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.cache = cache
+
+        # Tokens consumidos (incluye lecturas/escrituras del prompt cache)
+        self._usage_lock = Lock()
+        self.usage = {
+            'requests': 0,
+            'input_tokens': 0,
+            'output_tokens': 0,
+            'cache_creation_input_tokens': 0,
+            'cache_read_input_tokens': 0,
+            'cache_hits': 0,
+            'cache_misses': 0
+        }
 
-    def translate_and_optimize(self, titulo: str, texto: str, url: str) -> Dict[str, str]:
+    @property
+    def client(self):
+        """Cliente de Anthropic, creado en el primer uso"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from anthropic import Anthropic
+                    self._client = Anthropic(api_key=self.api_key)
+        return self._client
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+
+    def translate_and_optimize(self, titulo: str, texto: str, url: str,
+                               use_cache: bool = True) -> Dict[str, str]:
         """
         Traduce el contenido al español y genera variantes para RRSS
 
+        Si hay cache configurado, el mismo contenido (aunque venga con otra URL)
+        se devuelve sin llamar a la API.
+
         Args:
             titulo: Título original en inglés
             texto: Texto/resumen original en inglés
             url: URL de la noticia (para contexto)
+            use_cache: False para forzar una llamada a la API
 
         Returns:
             Diccionario con:
@@ -48,20 +337,16 @@ class TranslationService:
                 - hashtags: Hashtags relevantes separados por coma
                 - categoria: Categoría del contenido
         """
-        prompt = self._build_translation_prompt(titulo, texto, url)
+        cache_key = None
+        if self.cache and use_cache:
+            cache_key = self.cache.make_key(self.model, PROMPT_VERSION, titulo, texto)
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.info(f"⚡ Traducción desde cache para: {titulo[:50]}...")
+                return cached
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.3,  # Temperatura baja para traducciones más precisas
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+            response = self._create_message(**self.build_message_params(titulo, texto, url))
 
             # Extraer el contenido de la respuesta
             content = response.content[0].text
@@ -70,6 +355,14 @@ class TranslationService:
             result = self._parse_response(content)
 
             logger.info(f"Traducción completada para: {titulo[:50]}...")
+
+            if self.cache and self._is_valid_translation(result, titulo):
+                self.cache.set(
+                    cache_key or self.cache.make_key(self.model, PROMPT_VERSION, titulo, texto),
+                    self.model,
+                    result
+                )
+
             return result
 
         except Exception as e:
@@ -78,70 +371,144 @@ class TranslationService:
             # Esto evita que se guarden traducciones fallidas en la DB
             raise Exception(f"Fallo en traducción para '{titulo[:50]}...': {str(e)}")
 
-    def _build_translation_prompt(self, titulo: str, texto: str, url: str) -> str:
-        """
-        Construye el prompt para Claude con instrucciones específicas
+    @staticmethod
+    def _is_valid_translation(result: Dict[str, str], titulo: str) -> bool:
         """
-        return f"""Eres un experto en traducción técnica de contenido sobre Inteligencia Artificial y ciencia de datos.
-
-Tu tarea es traducir el siguiente artículo de inglés a español y generar contenido optimizado para redes sociales.
-
-**ARTÍCULO ORIGINAL:**
-Título: {titulo}
-URL: {url}
-Contenido: {texto}
+        True si vale la pena cachear el resultado
 
-**INSTRUCCIONES:**
+        No se cachean respuestas vacías ni traducciones fallidas (titulo_es == titulo),
+        para que reprocess-failed-translations vuelva a llamar a la API.
+        """
+        titulo_es = (result.get('titulo_es') or '').strip()
+        return bool(titulo_es) and bool((result.get('texto_es') or '').strip()) and titulo_es != (titulo or '').strip()
 
-1. **Traducción al español:**
-   - Traduce el título y contenido manteniendo la precisión técnica
-   - Usa terminología técnica en español (ej: "aprendizaje automático", "redes neuronales")
-   - Mantén los nombres propios de herramientas/frameworks en inglés (TensorFlow, PyTorch, etc.)
+    def build_message_params(self, titulo: str, texto: str, url: str) -> Dict:
+        """
+        Parámetros de messages.create para traducir un artículo
 
-2. **Categorización:**
-   - Determina la categoría del artículo: Tutorial, Research, Tools, Case Study, News, Opinion, o General
-   - Base tu decisión en el contenido y enfoque del artículo
+        Se comparten entre la llamada sincrónica y el modo batch offline.
 
-3. **Resúmenes para RRSS:**
-   - **Resumen Corto** (máximo 280 caracteres): Para Twitter/LinkedIn. Debe ser impactante y conciso.
-   - **Resumen Medio** (máximo 1000 caracteres): Para Facebook. Más contexto y detalle.
-   - **Resumen Largo** (800-1000 caracteres): Para Instagram/WhatsApp/Blog. Explicación más detallada.
+        Args:
+            titulo: Título original en inglés
+            texto: Texto/resumen original en inglés
+            url: URL de la noticia (para contexto)
 
-4. **Hashtags:**
-   - Genera 5-8 hashtags relevantes en español
-   - Incluye hashtags generales (#IA, #MachineLearning) y específicos del tema
-   - Usa CamelCase para mejor legibilidad
+        Returns:
+            Diccionario listo para client.messages.create(**params)
+        """
+        return {
+            'model': self.model,
+            'max_tokens': 2000,
+            'temperature': 0.3,  # Temperatura baja para traducciones más precisas
+            'system': [
+                {
+                    "type": "text",
+                    "text": TRANSLATION_SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
+            'messages': [
+                {
+                    "role": "user",
+                    "content": self._build_translation_prompt(titulo, texto, url)
+                }
+            ]
+        }
 
-**FORMATO DE RESPUESTA:**
-Devuelve EXACTAMENTE en este formato (respeta las etiquetas):
+    def _create_message(self, **params):
+        """
+        Llama a messages.create respetando el limitador de concurrencia
 
-[TITULO_ES]
-Título traducido aquí
-[/TITULO_ES]
+        Ante 429/529 reduce la concurrencia, espera el backoff y reintenta
+        hasta max_rate_limit_retries veces.
 
-[TEXTO_ES]
-Texto completo traducido aquí
-[/TEXTO_ES]
+        Args:
+            **params: Parámetros para client.messages.create
 
-[RESUMEN_CORTO]
-Resumen de máximo 280 caracteres
-[/RESUMEN_CORTO]
+        Returns:
+            Respuesta de la API
+        """
+        for attempt in range(self.max_rate_limit_retries + 1):
+            self.limiter.acquire()
+            try:
+                response = self.client.messages.create(**params)
+            except Exception as e:
+                if not self._is_rate_limit_error(e):
+                    self.limiter.release()
+                    raise
+
+                self.limiter.release(rate_limited=True, retry_after=self._retry_after(e))
+                if attempt >= self.max_rate_limit_retries:
+                    raise
+                logger.warning(f"Rate limit ({attempt + 1}/{self.max_rate_limit_retries}), reintentando...")
+                continue
+
+            self.limiter.release()
+            self._record_usage(response)
+            return response
+
+    def _record_usage(self, response) -> None:
+        """
+        Acumula el uso de tokens informado por la respuesta
 
-[RESUMEN_MEDIO]
-Resumen de máximo 1000 caracteres
-[/RESUMEN_MEDIO]
+        cache_read_input_tokens > 0 indica un hit del prompt cache;
+        cache_creation_input_tokens > 0, un miss que escribió el cache.
+        """
+        usage = getattr(response, 'usage', None)
+
+        with self._usage_lock:
+            self.usage['requests'] += 1
+            if usage is None:
+                return
+            for key in ('input_tokens', 'output_tokens',
+                        'cache_creation_input_tokens', 'cache_read_input_tokens'):
+                self.usage[key] += getattr(usage, key, None) or 0
+            if getattr(usage, 'cache_read_input_tokens', None):
+                self.usage['cache_hits'] += 1
+            else:
+                self.usage['cache_misses'] += 1
+
+        logger.debug(
+            f"Tokens: input={getattr(usage, 'input_tokens', 0)}, "
+            f"cache_read={getattr(usage, 'cache_read_input_tokens', 0) or 0}, "
+            f"cache_write={getattr(usage, 'cache_creation_input_tokens', 0) or 0}"
+        )
+
+    def get_usage_stats(self) -> Dict[str, int]:
+        """
+        Estadísticas acumuladas de tokens y del prompt cache
 
-[RESUMEN_LARGO]
-Resumen extenso de 800-1000 caracteres
-[/RESUMEN_LARGO]
+        Returns:
+            Copia de los contadores (tokens, cache_hits y cache_misses por request)
+        """
+        with self._usage_lock:
+            return dict(self.usage)
+
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        """True si el error de la API es un rate limit (429) o sobrecarga (529)"""
+        return getattr(error, 'status_code', None) in RATE_LIMIT_STATUS_CODES
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Segundos indicados por el header retry-after del error (si vino)"""
+        response = getattr(error, 'response', None)
+        value = response.headers.get('retry-after') if response is not None else None
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
 
-[HASHTAGS]
-#Hashtag1, #Hashtag2, #Hashtag3, etc
-[/HASHTAGS]
+    def _build_translation_prompt(self, titulo: str, texto: str, url: str) -> str:
+        """
+        Construye la parte variable del prompt (solo el artículo)
 
-[CATEGORIA]
-Categoría (una sola palabra)
-[/CATEGORIA]
+        Las instrucciones fijas van en TRANSLATION_SYSTEM_PROMPT.
+        """
+        return f"""**ARTÍCULO ORIGINAL:**
+Título: {titulo}
+URL: {url}
+Contenido: {texto}
 
 Procede con la traducción y optimización:"""
 
@@ -196,7 +563,7 @@ Contenido: {texto[:500]}
 Responde SOLO con el nombre de la categoría:"""
 
         try:
-            response = self.client.messages.create(
+            response = self._create_message(
                 model=self.model,
                 max_tokens=50,
                 temperature=0,
@@ -210,19 +577,21 @@ Responde SOLO con el nombre de la categoría:"""
             logger.error(f"Error categorizando: {e}")
             return 'General'
 
-    def batch_translate(self, noticias: List[Dict]) -> List[Dict]:
+    def batch_translate(self, noticias: List[Dict], max_workers: Optional[int] = None) -> List[Dict]:
         """
         Traduce un lote de noticias
 
         Args:
             noticias: Lista de diccionarios con keys: titulo, texto, url
+            max_workers: Traducciones en paralelo (None = max_concurrency del servicio)
 
         Returns:
-            Lista de resultados de traducción
+            Lista de resultados de traducción (en el mismo orden que noticias)
         """
-        results = []
+        workers = max_workers or self.limiter.max_concurrency
 
-        for i, noticia in enumerate(noticias):
+        def translate(indexed):
+            i, noticia = indexed
             logger.info(f"Traduciendo noticia {i+1}/{len(noticias)}: {noticia.get('titulo', '')[:50]}...")
 
             result = self.translate_and_optimize(
@@ -235,9 +604,13 @@ Responde SOLO con el nombre de la categoría:"""
             if 'id' in noticia:
                 result['id'] = noticia['id']
 
-            results.append(result)
+            return result
+
+        if workers <= 1 or len(noticias) <= 1:
+            return [translate(indexed) for indexed in enumerate(noticias)]
 
-        return results
+        with ThreadPoolExecutor(max_workers=min(workers, len(noticias)), thread_name_prefix='translate') as executor:
+            return list(executor.map(translate, enumerate(noticias)))
 
 
 def test_translation_service():
@@ -0,0 +1,120 @@
+"""
+Aviso de noticias listas para publicar (fase 'procesado')
+El endpoint /api/news/wait-for-work hace long-poll sobre wait_for_ready():
+si el procesamiento ocurre en este mismo proceso, notify() lo despierta al
+instante; si ocurre en otro (src/worker.py), lo detecta re-consultando la BD
+cada pocos segundos, mucho más barato que un ciclo completo del publisher
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import func
+
+from src.models import db, APublicar
+
+logger = logging.getLogger(__name__)
+
+
+class WorkNotifier:
+    """
+    Condición compartida entre los threads del proceso web
+
+    Cada notify() incrementa una generación; los que esperan se despiertan
+    cuando la generación cambia respecto de la que leyeron antes de consultar
+    la BD, así no se pierde un aviso que llegue entre la consulta y la espera.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        with self._cond:
+            return self._generation
+
+    def notify(self):
+        """Despertar a todos los que esperan trabajo"""
+        with self._cond:
+            self._generation += 1
+            self._cond.notify_all()
+
+    def wait(self, generation: int, timeout: float) -> bool:
+        """
+        Esperar hasta que haya un notify() posterior a `generation`
+
+        Returns:
+            True si hubo aviso, False si venció el timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._generation != generation, timeout)
+
+
+notifier = WorkNotifier()
+
+
+def ready_snapshot() -> Tuple[int, Optional[datetime]]:
+    """
+    Cantidad de noticias en fase 'procesado' y el processed_at más reciente
+    """
+    count, latest = db.session.query(
+        func.count(APublicar.id),
+        func.max(APublicar.processed_at)
+    ).filter(
+        APublicar.fase == 'procesado',
+        APublicar.procesado == True  # noqa: E712
+    ).one()
+    return count or 0, latest
+
+
+def wait_for_ready(since: Optional[datetime] = None, timeout: float = 25,
+                   check_interval: float = 2,
+                   clock: Callable[[], float] = time.monotonic) -> Dict:
+    """
+    Esperar a que aparezca una noticia procesada después de `since`
+
+    Args:
+        since: Cursor devuelto por la llamada anterior. Sin cursor se responde
+            al instante si ya hay noticias procesadas (primera llamada del
+            publisher); si no hay ninguna se espera como con cursor = ahora
+        timeout: Segundos máximos de espera
+        check_interval: Segundos entre consultas a la BD (cambios de otros procesos)
+        clock: Reloj monotónico (inyectable en tests)
+
+    Returns:
+        Dict con ready, count y cursor (ISO) para la próxima llamada
+    """
+    deadline = clock() + timeout
+
+    while True:
+        generation = notifier.generation
+        now = datetime.utcnow()
+        count, latest = ready_snapshot()
+        # Cerrar la transacción: no retener la conexión mientras se espera
+        db.session.rollback()
+
+        if since is None:
+            if count:
+                return _response(True, count, latest)
+            # Tabla vacía: sin un cursor el publisher reintentaría en un loop
+            since = now
+
+        if count and latest and latest > since:
+            return _response(True, count, latest)
+
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return _response(False, count, since)
+
+        notifier.wait(generation, min(check_interval, remaining))
+
+
+def _response(ready: bool, count: int, cursor: Optional[datetime]) -> Dict:
+    return {
+        'ready': ready,
+        'count': count,
+        'cursor': cursor.isoformat() if cursor else None
+    }
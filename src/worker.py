@@ -0,0 +1,201 @@
+"""
+Worker de procesamiento con Claude
+Reclama jobs de processing_jobs y los ejecuta con SocialMediaProcessor,
+fuera de los requests HTTP de la app Flask
+
+Uso:
+    python -m src.worker
+"""
+import logging
+import signal
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+from flask import Flask
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, '/app')
+
+from src import job_queue
+from src.models import init_db
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """
+    Loop de worker: claim → ejecutar (con heartbeat) → complete/fail
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 2,
+        lease_seconds: int = 300,
+        heartbeat_interval: Optional[float] = None,
+        retry_base_seconds: int = 30
+    ):
+        """
+        Args:
+            app: Aplicación Flask con la BD inicializada
+            worker_id: Identificador del worker (None = host:pid)
+            poll_interval: Segundos de espera cuando la cola está vacía
+            lease_seconds: Duración del lease de cada job
+            heartbeat_interval: Segundos entre heartbeats (None = un tercio del lease)
+            retry_base_seconds: Espera antes del primer reintento de un job fallido
+        """
+        self.app = app
+        self.worker_id = worker_id or job_queue.default_worker_id()
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval or lease_seconds / 3
+        self.retry_base_seconds = retry_base_seconds
+        self._stop = threading.Event()
+
+    def stop(self, *args):
+        """Termina el loop después del job en curso"""
+        logger.info(f"🛑 Worker {self.worker_id} deteniéndose...")
+        self._stop.set()
+
+    def run_forever(self):
+        """Procesa jobs hasta que se llame a stop()"""
+        logger.info(f"👷 Worker {self.worker_id} iniciado")
+
+        while not self._stop.is_set():
+            try:
+                worked = self.run_once()
+            except Exception as e:
+                logger.error(f"✗ Error en el loop del worker: {e}")
+                worked = False
+
+            if not worked:
+                self._stop.wait(self.poll_interval)
+
+        logger.info(f"Worker {self.worker_id} detenido")
+
+    def run_once(self) -> bool:
+        """
+        Reclama y ejecuta un job
+
+        Returns:
+            True si había un job, False si la cola estaba vacía
+        """
+        with self.app.app_context():
+            job = job_queue.claim(self.worker_id, lease_seconds=self.lease_seconds)
+            if job is None:
+                return False
+            job_id, tipo, payload = job.id, job.tipo, dict(job.payload or {})
+            logger.info(f"▶️ Job {job_id}: {tipo} {payload} (intento {job.attempts}/{job.max_attempts})")
+
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat_loop,
+            args=(job_id, stop_heartbeat),
+            name=f'heartbeat-{job_id}',
+            daemon=True
+        )
+        heartbeat.start()
+
+        try:
+            with self.app.app_context():
+                result = self.execute(tipo, payload)
+            error = None
+        except Exception as e:
+            result, error = None, str(e)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+
+        with self.app.app_context():
+            if error is None:
+                job_queue.complete(job_id, self.worker_id, result)
+            else:
+                job_queue.fail(job_id, self.worker_id, error, retry_base_seconds=self.retry_base_seconds)
+
+        return True
+
+    def execute(self, tipo: str, payload: Dict) -> Dict:
+        """
+        Ejecuta un job según su tipo (dentro de un app context)
+
+        Args:
+            tipo: Tipo de job
+            payload: Parámetros del job
+
+        Returns:
+            Resultado a guardar en el job
+
+        Raises:
+            Exception: Si el procesamiento falló (el job se reintenta)
+        """
+        from src.social_media_processor import SocialMediaProcessor
+
+        if tipo == job_queue.JOB_PROCESS_ITEM:
+            noticia_id = payload['noticia_id']
+            processor = SocialMediaProcessor(anthropic_api_key=self.app.config.get('ANTHROPIC_API_KEY'))
+            if not processor.process_item(noticia_id):
+                raise RuntimeError(f"No se pudo procesar la noticia {noticia_id}")
+            return {'noticia_id': noticia_id, 'procesado': True}
+
+        if tipo == job_queue.JOB_PROCESS_ALL_PENDING:
+            processor = SocialMediaProcessor(
+                anthropic_api_key=self.app.config.get('ANTHROPIC_API_KEY'),
+                max_workers=self.app.config.get('TRANSLATION_MAX_WORKERS', 4)
+            )
+            return processor.process_all_pending(limit=payload.get('limit'))
+
+        raise ValueError(f"Tipo de job desconocido: {tipo}")
+
+    def _heartbeat_loop(self, job_id: int, stop: threading.Event):
+        """Renueva el lease mientras el job se ejecuta"""
+        while not stop.wait(self.heartbeat_interval):
+            try:
+                with self.app.app_context():
+                    if not job_queue.heartbeat(job_id, self.worker_id, self.lease_seconds):
+                        logger.warning(f"⚠️ Job {job_id}: el lease ya no es de este worker")
+                        return
+            except Exception as e:
+                logger.warning(f"⚠️ Error en heartbeat del job {job_id}: {e}")
+
+
+def create_app() -> Flask:
+    """
+    Crea una app Flask mínima (solo BD y configuración) para el worker
+    """
+    from config.settings import get_config
+
+    app = Flask(__name__)
+    app.config.from_object(get_config())
+    init_db(app)
+    return app
+
+
+def main():
+    """
+    Función principal
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+    app = create_app()
+    worker = JobWorker(
+        app,
+        poll_interval=app.config.get('WORKER_POLL_INTERVAL', 2),
+        lease_seconds=app.config.get('JOB_LEASE_SECONDS', 300),
+        retry_base_seconds=app.config.get('JOB_RETRY_BASE_SECONDS', 30)
+    )
+
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+
+    worker.run_forever()
+
+
+if __name__ == '__main__':
+    main()
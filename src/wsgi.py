@@ -0,0 +1,16 @@
+"""
+Punto de entrada WSGI para producción
+
+    gunicorn -c gunicorn.conf.py src.wsgi:app
+
+No inicia el scheduler: el scraping periódico corre en un proceso aparte
+(python -m src.scheduler), así agregar workers no multiplica los jobs
+"""
+import sys
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, '/app')
+
+from src.app import app  # noqa: E402
+
+application = app
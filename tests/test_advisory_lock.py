@@ -0,0 +1,55 @@
+"""
+Tests para los advisory locks que serializan el scraping
+"""
+import pytest
+import threading
+import sys
+sys.path.insert(0, '/app')
+
+from src.advisory_lock import advisory_lock, lock_key, SCRAPE_LOCK
+from src.models import db
+
+
+def test_lock_key_estable_y_en_rango_bigint():
+    """La misma clave en todos los procesos, dentro del rango de pg_advisory_lock"""
+    assert lock_key(SCRAPE_LOCK) == lock_key(SCRAPE_LOCK)
+    assert lock_key(SCRAPE_LOCK) != lock_key('otro')
+    assert -2**63 <= lock_key(SCRAPE_LOCK) < 2**63
+
+
+def test_segundo_intento_no_toma_el_lock(app):
+    """Mientras una instancia tiene el lock, otra no entra; al soltarlo sí"""
+    resultados = []
+
+    def intentar():
+        with app.app_context():
+            with advisory_lock(SCRAPE_LOCK) as acquired:
+                resultados.append(acquired)
+
+    with advisory_lock(SCRAPE_LOCK) as acquired:
+        assert acquired
+        hilo = threading.Thread(target=intentar)
+        hilo.start()
+        hilo.join()
+
+    intentar()
+    assert resultados == [False, True]
+
+
+@pytest.fixture
+def app():
+    """Crear aplicación de prueba"""
+    from flask import Flask
+    from config.settings import TestingConfig
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    from src.models import init_db
+    init_db(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,49 @@
+"""
+Tests de la sesión firmada que evita re-verificar HTTP Basic en cada request
+"""
+import base64
+import os
+import pytest
+import sys
+sys.path.insert(0, '/app')
+
+os.environ.setdefault('FLASK_ENV', 'testing')
+
+from src.models import db, User
+
+
+def _basic(username, password):
+    token = base64.b64encode(f'{username}:{password}'.encode()).decode()
+    return {'Authorization': f'Basic {token}'}
+
+
+def test_sesion_vale_sin_credenciales_hasta_que_cambia_la_contrasena(client):
+    """Cambiar la contraseña (desde cualquier navegador) invalida las sesiones abiertas"""
+    user = User(username='editor')
+    user.set_password('Clave-Segura-1')
+    db.session.add(user)
+    db.session.commit()
+
+    assert client.get('/api/jobs/999', headers=_basic('editor', 'Clave-Segura-1')).status_code == 404
+    assert client.get('/api/jobs/999').status_code == 404  # La sesión reemplaza a las credenciales
+
+    user.set_password('Clave-Segura-2')
+    db.session.commit()
+
+    assert client.get('/api/jobs/999').status_code == 401
+    assert client.get('/api/jobs/999', headers=_basic('editor', 'Clave-Segura-2')).status_code == 404
+
+
+@pytest.fixture
+def client():
+    """Cliente de la app real con AUTH_SESSION_ENABLED"""
+    from src.app import app, credential_cache
+
+    app.config['AUTH_SESSION_ENABLED'] = True
+    with app.app_context():
+        db.create_all()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+    app.config['AUTH_SESSION_ENABLED'] = False
+    credential_cache.invalidate_user('editor')
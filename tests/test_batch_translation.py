@@ -0,0 +1,115 @@
+"""
+Tests para el modo batch offline de traducción (servidor de batches falso)
+"""
+import pytest
+from datetime import datetime
+import sys
+sys.path.insert(0, '/app')
+
+from src.batch_translation import BatchTranslator, FakeBatchBackend
+from src.models import db, APublicar
+from src.social_media_processor import SocialMediaProcessor
+
+RESPUESTA = """[TITULO_ES]
+{titulo} traducido
+[/TITULO_ES]
+[TEXTO_ES]
+Texto traducido
+[/TEXTO_ES]
+[HASHTAGS]
+#IA
+[/HASHTAGS]
+[CATEGORIA]
+News
+[/CATEGORIA]"""
+
+
+def _responder(params):
+    prompt = params['messages'][-1]['content']
+    if 'ROMPER' in prompt:
+        raise RuntimeError('overloaded')
+    titulo = prompt.split('TÍTULO:')[1].split('\n')[0].strip() if 'TÍTULO:' in prompt else 'Noticia'
+    return RESPUESTA.format(titulo=titulo)
+
+
+def test_batch_translator_envia_espera_y_parsea(processor):
+    """Un request por noticia, polling hasta terminar y resultados por ID"""
+    backend = FakeBatchBackend(_responder, polls_until_done=3)
+    translator = BatchTranslator(processor.translation_service, backend=backend, poll_interval=0)
+
+    batch_id = translator.submit([
+        {'id': 7, 'titulo': 'Uno', 'texto': 'a', 'url': 'u1'},
+        {'id': 9, 'titulo': 'ROMPER', 'texto': 'b', 'url': 'u2'},
+    ])
+
+    assert [r['custom_id'] for r in backend.batches[batch_id]['requests']] == ['apublicar-7', 'apublicar-9']
+    assert translator.wait(batch_id) is True
+    assert backend.batches[batch_id]['polls'] == 3
+
+    results = translator.collect(batch_id)
+    assert results[7]['categoria'] == 'News'
+    assert results[7]['titulo_es']
+    assert results[9] == {'error': 'overloaded'}
+
+
+def test_batch_translator_timeout(processor):
+    """Si el batch no termina dentro del timeout, wait devuelve False"""
+    backend = FakeBatchBackend(_responder, polls_until_done=100)
+    translator = BatchTranslator(processor.translation_service, backend=backend, poll_interval=0, timeout=0)
+
+    batch_id = translator.submit([{'id': 1, 'titulo': 'Uno', 'texto': 'a', 'url': 'u1'}])
+
+    assert translator.wait(batch_id) is False
+
+
+def test_procesar_pendientes_en_batch(app, processor):
+    """Los resultados se aplican en bloque y los fallidos quedan pendientes"""
+    for i, titulo in enumerate(['Uno', 'Dos', 'ROMPER']):
+        db.session.add(APublicar(titulo=titulo, texto='x', url=f'https://e.com/{i}',
+                                  fecha_hora=datetime.utcnow(), fase='scrapeado'))
+    db.session.add(APublicar(titulo='Listo', texto='x', url='https://e.com/listo',
+                              fecha_hora=datetime.utcnow(), procesado=True))
+    db.session.commit()
+
+    backend = FakeBatchBackend(_responder)
+    batch_id = processor.submit_pending_batch(backend=backend)
+    assert len(backend.batches[batch_id]['requests']) == 3
+
+    stats = processor.apply_batch_results(batch_id, backend=backend, poll_interval=0)
+
+    assert stats == {'total': 3, 'exitosos': 2, 'fallidos': 1, 'ya_procesados': 0}
+    assert APublicar.query.filter_by(procesado=True).count() == 3
+    assert APublicar.query.filter_by(titulo='ROMPER').first().procesado is False
+
+
+def test_sin_pendientes_no_envia_batch(app, processor):
+    """Sin items pendientes no se crea ningún batch"""
+    backend = FakeBatchBackend(_responder)
+
+    assert processor.submit_pending_batch(backend=backend) is None
+    assert backend.batches == {}
+
+
+@pytest.fixture
+def processor():
+    """Procesador sin llamadas reales a la API"""
+    return SocialMediaProcessor(anthropic_api_key='test-key')
+
+
+@pytest.fixture
+def app():
+    """Crear aplicación de prueba"""
+    from flask import Flask
+    from config.settings import TestingConfig
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    from src.models import init_db
+    init_db(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
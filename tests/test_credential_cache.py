@@ -0,0 +1,84 @@
+"""
+Tests para el cache de credenciales HTTP Basic
+"""
+import sys
+sys.path.insert(0, '/app')
+
+from src.credential_cache import CredentialCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hit_dentro_del_ttl_y_miss_al_vencer():
+    """Una verificación se reutiliza hasta que vence el TTL"""
+    clock = _Clock()
+    cache = CredentialCache('secreto', ttl_seconds=60, clock=clock)
+
+    assert cache.get('admin', 'clave') is None
+    cache.store('admin', 'clave')
+    assert cache.get('admin', 'clave') == 'admin'
+
+    clock.now = 61
+    assert cache.get('admin', 'clave') is None
+    assert len(cache) == 0
+    assert cache.stats == {'hits': 1, 'misses': 2}
+
+
+def test_otra_contrasena_no_sale_del_cache():
+    """La clave incluye la contraseña: una incorrecta siempre es miss"""
+    cache = CredentialCache('secreto')
+    cache.store('admin', 'clave')
+
+    assert cache.get('admin', 'otra') is None
+    assert cache.get('admi', 'nclave') is None
+
+
+def test_no_guarda_la_contrasena_en_claro():
+    """Las claves son HMAC con el secreto de la app"""
+    cache = CredentialCache('secreto')
+    cache.store('admin', 'clave-super-secreta')
+
+    key = next(iter(cache._entries))
+    assert 'clave-super-secreta' not in key
+    assert key != CredentialCache('otro-secreto')._key('admin', 'clave-super-secreta')
+
+
+def test_lru_acotado():
+    """Al superar max_entries se desaloja la menos usada"""
+    cache = CredentialCache('secreto', max_entries=2)
+    cache.store('a', '1')
+    cache.store('b', '2')
+    cache.get('a', '1')
+    cache.store('c', '3')
+
+    assert cache.get('a', '1') == 'a'
+    assert cache.get('b', '2') is None
+    assert cache.get('c', '3') == 'c'
+
+
+def test_invalidate_user():
+    """Cambiar la contraseña olvida todas las verificaciones del usuario"""
+    cache = CredentialCache('secreto')
+    cache.store('admin', 'vieja')
+    cache.store('admin', 'otra')
+    cache.store('editor', 'clave')
+
+    assert cache.invalidate_user('admin') == 2
+    assert cache.get('admin', 'vieja') is None
+    assert cache.get('editor', 'clave') == 'editor'
+
+
+def test_ttl_cero_desactiva():
+    """Con TTL 0 no se guarda nada"""
+    cache = CredentialCache('secreto', ttl_seconds=0)
+    cache.store('admin', 'clave')
+
+    assert not cache.enabled
+    assert cache.get('admin', 'clave') is None
+    assert len(cache) == 0
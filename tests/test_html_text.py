@@ -0,0 +1,52 @@
+"""
+Tests para la extracción de texto de HTML en streaming
+"""
+import sys
+sys.path.insert(0, '/app')
+
+from src.html_text import html_to_text
+from src.technical_sources_scraper import TechnicalSourcesScraper
+
+
+def test_descarta_script_y_style_y_decodifica_entidades():
+    html = (
+        '<style>p { color: red }</style>'
+        '<p>Deep&nbsp;learning &amp; <b>PyTorch</b>\n\n  tips&hellip;</p>'
+        '<script>track("x")</script><p>Fin</p>'
+    )
+
+    assert html_to_text(html) == ('Deep learning & PyTorch tips… Fin', False)
+
+
+def test_tags_separan_palabras():
+    """Igual que get_text(separator=' '): texto en tags contiguos no se pega"""
+    assert html_to_text('<li>uno</li><li>dos</li>dos<br>tres') == ('uno dos dos tres', False)
+
+
+def test_corta_en_max_words():
+    html = '<p>' + ' '.join(f'w{i}' for i in range(5000)) + '</p><p>resto</p>'
+
+    text, truncated = html_to_text(html, max_words=1000)
+
+    assert truncated
+    assert text.split() == [f'w{i}' for i in range(1000)]
+    assert html_to_text('<p>a b c</p>', max_words=3) == ('a b c', False)
+
+
+def test_texto_plano_y_vacio():
+    assert html_to_text('  sin   html  ') == ('sin html', False)
+    assert html_to_text('') == ('', False)
+
+
+def test_descripcion_del_feed_limitada_a_1000_palabras():
+    """El scraper agrega '...' cuando corta la descripción"""
+    import feedparser
+
+    scraper = TechnicalSourcesScraper(sources=['huggingface'])
+    entry = feedparser.FeedParserDict(summary='<div>' + 'palabra ' * 1500 + '</div>')
+
+    texto = scraper._extract_description(entry)
+
+    assert texto.endswith('palabra...')
+    assert len(texto.split()) == 1000
+    assert scraper._extract_description(feedparser.FeedParserDict(summary='<p></p>')) == 'Sin contenido disponible'
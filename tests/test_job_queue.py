@@ -0,0 +1,136 @@
+"""
+Tests para la cola de jobs de procesamiento y el worker
+"""
+import pytest
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '/app')
+
+from src import job_queue
+from src.models import db, ProcessingJob
+from src.worker import JobWorker
+
+
+def test_enqueue_claim_complete(app):
+    """Un job encolado se reclama una sola vez y termina en done"""
+    job = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1})
+    db.session.commit()
+
+    claimed = job_queue.claim('w1')
+    assert claimed.id == job.id
+    assert claimed.status == 'running'
+    assert claimed.attempts == 1
+    assert job_queue.claim('w2') is None
+
+    assert job_queue.complete(job.id, 'w1', {'ok': True}) is True
+    assert db.session.get(ProcessingJob, job.id).status == 'done'
+
+
+def test_enqueue_dedup_de_jobs_activos(app):
+    """Encolar dos veces la misma noticia devuelve el mismo job"""
+    primero = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1})
+    segundo = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1})
+    otro = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 2})
+
+    assert primero.id == segundo.id
+    assert otro.id != primero.id
+
+
+def test_indice_unico_impide_dos_jobs_activos_iguales(app):
+    """Aunque el SELECT previo no lo vea, el índice parcial rechaza el segundo job activo"""
+    primero = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1})
+    db.session.commit()
+
+    # Lo que insertaría un request concurrente que ya pasó su chequeo
+    duplicado = job_queue._insert_or_get_active({
+        'tipo': job_queue.JOB_PROCESS_ITEM, 'payload': {'noticia_id': 1},
+        'dedup_key': primero.dedup_key, 'status': 'pending', 'attempts': 0, 'max_attempts': 3,
+        'run_after': datetime.utcnow(), 'created_at': datetime.utcnow()
+    })
+    assert duplicado is None
+    assert ProcessingJob.query.count() == 1
+
+    # Terminado, deja de bloquear: se puede volver a encolar
+    job_queue.claim('w1')
+    job_queue.complete(primero.id, 'w1')
+    nuevo = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1})
+    assert nuevo.id != primero.id
+    assert job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1}, dedup=False).dedup_key is None
+
+
+def test_lease_vencido_se_reclama_y_heartbeat_perdido(app):
+    """Si el worker deja vencer el lease, otro lo reclama y el primero lo pierde"""
+    job = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1})
+    db.session.commit()
+    job_queue.claim('w1', lease_seconds=60)
+
+    job.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+
+    assert job_queue.claim('w2').locked_by == 'w2'
+    assert job_queue.heartbeat(job.id, 'w1') is False
+    assert job_queue.heartbeat(job.id, 'w2') is True
+    assert job_queue.complete(job.id, 'w1') is False
+
+
+def test_reintentos_con_backoff_y_dead_letter(app):
+    """Un job que falla se reintenta con backoff y al agotar intentos pasa a dead"""
+    job = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1}, max_attempts=2)
+    db.session.commit()
+
+    job_queue.claim('w1')
+    assert job_queue.fail(job.id, 'w1', 'boom', retry_base_seconds=60) == 'pending'
+    assert job_queue.claim('w1') is None  # Todavía en backoff
+
+    job.run_after = datetime.utcnow()
+    db.session.commit()
+    job_queue.claim('w1')
+    assert job_queue.fail(job.id, 'w1', 'boom otra vez') == 'dead'
+
+    job = db.session.get(ProcessingJob, job.id)
+    assert job.status == 'dead'
+    assert job.attempts == 2
+    assert job.last_error == 'boom otra vez'
+
+
+def test_worker_ejecuta_y_registra_fallos(app):
+    """El worker completa los jobs exitosos y reintenta los que fallan"""
+    class _Worker(JobWorker):
+        def execute(self, tipo, payload):
+            if payload['noticia_id'] == 2:
+                raise RuntimeError('sin traducción')
+            return {'noticia_id': payload['noticia_id']}
+
+    ok = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 1})
+    ko = job_queue.enqueue(job_queue.JOB_PROCESS_ITEM, {'noticia_id': 2})
+    db.session.commit()
+
+    worker = _Worker(app, worker_id='test', heartbeat_interval=0.01)
+    assert worker.run_once() is True
+    assert worker.run_once() is True
+    assert worker.run_once() is False
+
+    db.session.expire_all()
+    assert db.session.get(ProcessingJob, ok.id).status == 'done'
+    assert db.session.get(ProcessingJob, ok.id).result == {'noticia_id': 1}
+    assert db.session.get(ProcessingJob, ko.id).status == 'pending'
+    assert db.session.get(ProcessingJob, ko.id).last_error == 'sin traducción'
+
+
+@pytest.fixture
+def app():
+    """Crear aplicación de prueba"""
+    from flask import Flask
+    from config.settings import TestingConfig
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    from src.models import init_db
+    init_db(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
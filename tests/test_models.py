@@ -2,11 +2,13 @@
 Tests para modelos de base de datos
 """
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+from sqlalchemy import delete
 import sys
 sys.path.insert(0, '/app')
 
-from src.models import db, Noticia, APublicar
+from src.models import db, Noticia, APublicar, FeedState, NoticiaArchivada
+from src.retention import prune_noticias
 
 
 def test_crear_noticia(app):
@@ -98,6 +100,156 @@ def test_url_unica_noticia(app):
         db.session.rollback()
 
 
+def test_bulk_insert_ignora_urls_existentes(app):
+    """Test inserción masiva con URLs duplicadas (en la BD y dentro del lote)"""
+    with app.app_context():
+        db.session.add(Noticia(
+            titulo="Existente",
+            texto="Contenido",
+            url="https://ejemplo.com/existente",
+            fecha_hora=datetime.utcnow(),
+            temas=["AI"]
+        ))
+        db.session.commit()
+
+        lote = [
+            {'titulo': 'Nueva 1', 'texto': 'x', 'url': 'https://ejemplo.com/1',
+             'fecha_hora': datetime.utcnow(), 'temas': ['AI', 'ML']},
+            {'titulo': 'Repetida', 'texto': 'x', 'url': 'https://ejemplo.com/existente',
+             'fecha_hora': datetime.utcnow(), 'temas': ['AI']},
+            {'titulo': 'Nueva 2', 'texto': 'x', 'url': 'https://ejemplo.com/2',
+             'fecha_hora': datetime.utcnow(), 'temas': []},
+            {'titulo': 'Nueva 1 bis', 'texto': 'x', 'url': 'https://ejemplo.com/1',
+             'fecha_hora': datetime.utcnow(), 'temas': []},
+        ]
+
+        resultado = Noticia.bulk_insert(lote)
+        db.session.commit()
+
+        assert resultado['insertadas'] == 2
+        assert resultado['duplicadas'] == 2
+        assert len(resultado['ids']) == 2
+        assert Noticia.query.count() == 3
+        assert Noticia.query.filter_by(url='https://ejemplo.com/1').first().temas == ['AI', 'ML']
+
+
+def test_bulk_insert_omite_noticias_sin_campos_requeridos(app):
+    """Las noticias sin titulo, texto o url se omiten y se cuentan aparte de las duplicadas"""
+    with app.app_context():
+        lote = [
+            {'titulo': 'Valida', 'texto': 'x', 'url': 'https://ejemplo.com/ok'},
+            {'titulo': 'Sin URL', 'texto': 'x'},
+            {'texto': 'x', 'url': 'https://ejemplo.com/sin-titulo'},
+            {'titulo': 'Sin texto', 'texto': None, 'url': 'https://ejemplo.com/sin-texto'},
+            {'titulo': 'Valida bis', 'texto': 'x', 'url': 'https://ejemplo.com/ok'},
+        ]
+
+        resultado = Noticia.bulk_insert(lote)
+        db.session.commit()
+
+        assert resultado['insertadas'] == 1
+        assert resultado['invalidas'] == 3
+        assert resultado['duplicadas'] == 1
+        assert Noticia.query.count() == 1
+
+
+def _crear_noticias(cantidad):
+    """Crea noticias con fechas decrecientes (la 0 es la más reciente)"""
+    ahora = datetime.utcnow()
+    for i in range(cantidad):
+        db.session.add(Noticia(
+            titulo=f"Noticia {i}",
+            texto="Contenido",
+            url=f"https://ejemplo.com/retencion/{i}",
+            fecha_hora=ahora - timedelta(days=i),
+            temas=["AI"]
+        ))
+    db.session.commit()
+
+
+def test_retencion_por_cantidad(app):
+    """Test poda conservando solo las N noticias más recientes"""
+    with app.app_context():
+        _crear_noticias(10)
+
+        resultado = prune_noticias(max_count=4)
+        db.session.commit()
+
+        assert resultado == {'eliminadas': 6, 'archivadas': 0}
+        titulos = {n.titulo for n in Noticia.query.all()}
+        assert titulos == {f"Noticia {i}" for i in range(4)}
+
+
+def test_retencion_por_antiguedad_con_archivo(app):
+    """Test poda por antigüedad moviendo las filas a noticias_archivo"""
+    with app.app_context():
+        _crear_noticias(10)
+
+        resultado = prune_noticias(max_count=8, max_age_days=5, archive=True)
+        db.session.commit()
+
+        # Se podan las de 5+ días (por antigüedad) que incluyen a las que exceden 8
+        assert resultado == {'eliminadas': 5, 'archivadas': 5}
+        assert Noticia.query.count() == 5
+        archivadas = NoticiaArchivada.query.order_by(NoticiaArchivada.fecha_hora.desc()).all()
+        assert [a.titulo for a in archivadas] == [f"Noticia {i}" for i in range(5, 10)]
+        assert archivadas[0].temas == ["AI"]
+        assert archivadas[0].archived_at is not None
+
+
+def test_retencion_archiva_todo_lo_que_elimina(app, monkeypatch):
+    """Un borrado concurrente entre el archivo y el DELETE no deja filas sin archivar"""
+    with app.app_context():
+        _crear_noticias(6)
+        mas_reciente = Noticia.query.filter_by(titulo="Noticia 0").one().id
+        execute = db.session.execute
+        llamadas = []
+
+        def execute_con_borrado_concurrente(statement, *args, **kwargs):
+            result = execute(statement, *args, **kwargs)
+            llamadas.append(statement)
+            if len(llamadas) == 1:
+                # Otro request elimina la más reciente y corre el top N
+                execute(delete(Noticia).where(Noticia.id == mas_reciente))
+            return result
+
+        monkeypatch.setattr(db.session, 'execute', execute_con_borrado_concurrente)
+        resultado = prune_noticias(max_count=3, archive=True)
+        monkeypatch.undo()
+        db.session.commit()
+
+        archivadas = {a.titulo for a in NoticiaArchivada.query.all()}
+        assert resultado == {'eliminadas': 3, 'archivadas': 3}
+        assert archivadas == {"Noticia 3", "Noticia 4", "Noticia 5"}
+        assert {n.titulo for n in Noticia.query.all()} == {"Noticia 1", "Noticia 2"}
+
+
+def test_retencion_sin_politica_no_elimina(app):
+    """Test que sin políticas activas no se elimina nada"""
+    with app.app_context():
+        _crear_noticias(3)
+
+        assert prune_noticias() == {'eliminadas': 0, 'archivadas': 0}
+        assert Noticia.query.count() == 3
+
+
+def test_feed_state_guardar_y_cargar(app):
+    """Test persistencia de validadores de feeds"""
+    with app.app_context():
+        FeedState.save_states({'huggingface': {'etag': '"v1"', 'content_hash': 'abc'}, 'openai': {}})
+        db.session.commit()
+
+        FeedState.save_states({'huggingface': {'etag': '"v2"', 'last_modified': 'ayer', 'content_hash': 'def'}})
+        db.session.commit()
+
+        states = FeedState.load_states()
+        assert list(states) == ['huggingface']
+        assert states['huggingface']['etag'] == '"v2"'
+        assert states['huggingface']['last_modified'] == 'ayer'
+        assert states['huggingface']['content_hash'] == 'def'
+        assert states['huggingface']['last_entry_at'] is None
+
+
 @pytest.fixture
 def app():
     """Crear aplicación de prueba"""
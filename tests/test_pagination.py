@@ -0,0 +1,112 @@
+"""
+Tests para la paginación por cursor (keyset)
+"""
+import pytest
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '/app')
+
+from src.models import db, APublicar
+from src.pagination import decode_cursor, encode_cursor, keyset_page, parse_page_size
+
+
+def _seed(cantidad, empates=False):
+    base = datetime(2026, 10, 18, 12, 0, 0)
+    for i in range(cantidad):
+        selected_at = base if empates else base + timedelta(minutes=i)
+        db.session.add(APublicar(titulo=f'N{i}', texto='x', url=f'https://e.com/{i}',
+                                 fecha_hora=base, selected_at=selected_at))
+    db.session.commit()
+
+
+def _todas_las_paginas(limit):
+    ids, cursor, paginas = [], None, 0
+    while True:
+        page = keyset_page(APublicar.query, APublicar.selected_at, APublicar.id, limit, cursor)
+        ids.extend(n.id for n in page.items)
+        paginas += 1
+        if not page.has_more:
+            return ids, paginas
+        cursor = page.next_cursor
+
+
+def test_recorre_todo_sin_repetir_ni_saltear(app):
+    """Las páginas cubren la tabla completa en orden descendente"""
+    _seed(7)
+
+    ids, paginas = _todas_las_paginas(limit=3)
+
+    esperado = [n.id for n in APublicar.query.order_by(APublicar.selected_at.desc(), APublicar.id.desc())]
+    assert ids == esperado
+    assert paginas == 3
+
+
+def test_empates_en_la_columna_de_orden(app):
+    """Con el mismo selected_at el id desempata y no se pierden filas"""
+    _seed(5, empates=True)
+
+    ids, _ = _todas_las_paginas(limit=2)
+
+    assert ids == sorted(ids, reverse=True)
+    assert len(set(ids)) == 5
+
+
+def test_ultima_pagina_exacta_no_tiene_cursor(app):
+    """Si la última página se llena justo, no se ofrece una siguiente vacía"""
+    _seed(4)
+
+    assert keyset_page(APublicar.query, APublicar.selected_at, APublicar.id, 4).next_cursor is None
+
+
+def test_filas_sin_selected_at_no_rompen_el_cursor(app):
+    """Con el filtro de /apublicar una fila con selected_at NULL no llega al cursor"""
+    _seed(3)
+    sin_fecha = APublicar(titulo='Sin fecha', texto='x', url='https://e.com/null',
+                          fecha_hora=datetime(2026, 10, 18), selected_at=None)
+    db.session.add(sin_fecha)
+    db.session.commit()
+    db.session.execute(db.update(APublicar).where(APublicar.id == sin_fecha.id).values(selected_at=None))
+    db.session.commit()
+
+    query = APublicar.query.filter(APublicar.selected_at.isnot(None))
+    page = keyset_page(query, APublicar.selected_at, APublicar.id, 2)
+    resto = keyset_page(query, APublicar.selected_at, APublicar.id, 2, page.next_cursor)
+
+    assert [n.titulo for n in page.items + resto.items] == ['N2', 'N1', 'N0']
+    assert resto.next_cursor is None
+
+
+def test_cursor_ida_y_vuelta_e_invalido():
+    """El cursor es opaco y reversible; uno corrupto da ValueError"""
+    valor = datetime(2026, 10, 18, 12, 30, 15, 123456)
+
+    assert decode_cursor(encode_cursor(valor, 42)) == (valor, 42)
+    with pytest.raises(ValueError):
+        decode_cursor('no-es-un-cursor')
+
+
+def test_parse_page_size():
+    assert parse_page_size(None, default=50, maximum=200) == 50
+    assert parse_page_size('10', default=50, maximum=200) == 10
+    assert parse_page_size('5000', default=50, maximum=200) == 200
+    assert parse_page_size('0', default=50, maximum=200) == 1
+    assert parse_page_size('abc', default=50, maximum=200) == 50
+
+
+@pytest.fixture
+def app():
+    """Crear aplicación de prueba"""
+    from flask import Flask
+    from config.settings import TestingConfig
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    from src.models import init_db
+    init_db(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,87 @@
+"""
+Tests del flujo de publicación a través de la API (publicar-seleccionadas → claim)
+"""
+import os
+import pytest
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '/app')
+
+os.environ.setdefault('FLASK_ENV', 'testing')
+
+from src.models import db, APublicar
+
+
+def _procesada(titulo='Noticia', **kwargs):
+    noticia = APublicar(titulo=titulo, texto='x', url=f'https://e.com/{titulo}',
+                        fecha_hora=datetime.utcnow(), procesado=True, fase='scrapeado', **kwargs)
+    db.session.add(noticia)
+    db.session.commit()
+    return noticia
+
+
+def test_seleccionadas_se_reclaman_con_sus_plataformas(client):
+    """Lo elegido en /apublicar lo reclama un publisher y llega a fase final"""
+    noticia = _procesada()
+
+    response = client.post('/publicar-seleccionadas', json={
+        'noticias': [{'id': noticia.id, 'platforms': ['telegram']}]
+    })
+    assert response.get_json()['resultados'][str(noticia.id)]['queued'] is True
+
+    claimed = client.post('/api/news/claim', json={'publisher_id': 'p1', 'platforms': ['telegram', 'bluesky']})
+    noticias = claimed.get_json()['noticias']
+    assert [n['id'] for n in noticias] == [noticia.id]
+    assert noticias[0]['plataformas_seleccionadas'] == ['telegram']
+
+    client.post('/api/news/mark-published-batch', json={
+        'results': [{'noticia_id': noticia.id, 'platform': 'telegram', 'post_id': '1'}]
+    })
+    assert db.session.get(APublicar, noticia.id).fase == 'publicado_completo'
+
+
+def test_no_se_reselecciona_mientras_se_publica(client):
+    """Con el lease vigente no se cambian las plataformas (se publicaría dos veces)"""
+    noticia = _procesada(plataformas_seleccionadas=['telegram'])
+    noticia.fase, noticia.claimed_by = 'publicando', 'p1'
+    noticia.lease_expires_at = datetime.utcnow() + timedelta(minutes=10)
+    db.session.commit()
+
+    response = client.post('/publicar-seleccionadas', json={
+        'noticias': [{'id': noticia.id, 'platforms': ['bluesky']}]
+    })
+
+    assert 'error' in response.get_json()['resultados'][str(noticia.id)]
+    assert db.session.get(APublicar, noticia.id).plataformas_seleccionadas == ['telegram']
+
+
+def test_reseleccion_no_repite_plataformas_publicadas(client):
+    """Volver a elegir una plataforma donde ya se publicó no la marca pendiente"""
+    noticia = _procesada(plataformas_seleccionadas=['telegram'])
+    client.post('/api/news/mark-published-batch', json={
+        'results': [{'noticia_id': noticia.id, 'platform': 'telegram', 'post_id': '1'}]
+    })
+
+    solo_telegram = client.post('/publicar-seleccionadas', json={
+        'noticias': [{'id': noticia.id, 'platforms': ['telegram']}]
+    })
+    assert 'error' in solo_telegram.get_json()['resultados'][str(noticia.id)]
+
+    client.post('/publicar-seleccionadas', json={
+        'noticias': [{'id': noticia.id, 'platforms': ['telegram', 'bluesky']}]
+    })
+    plataformas = db.session.get(APublicar, noticia.id).plataformas_publicadas
+    assert plataformas['telegram']['status'] == 'success'
+    assert plataformas['bluesky']['status'] == 'pending'
+
+
+@pytest.fixture
+def client():
+    """Cliente de la app real con SQLite en memoria"""
+    from src.app import app
+
+    with app.app_context():
+        db.create_all()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
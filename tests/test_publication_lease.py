@@ -0,0 +1,131 @@
+"""
+Tests para el reclamo de noticias con lease (varios publishers sin duplicados)
+"""
+import pytest
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '/app')
+
+from src import publication_lease
+from src.models import db, APublicar
+
+
+def _noticia(titulo, fase='procesado', procesado=True, minutos=0, **kwargs):
+    noticia = APublicar(
+        titulo=titulo, texto='x', url=f'https://e.com/{titulo}',
+        fecha_hora=datetime.utcnow(), fase=fase, procesado=procesado,
+        selected_at=datetime.utcnow() + timedelta(minutes=minutos), **kwargs
+    )
+    db.session.add(noticia)
+    db.session.commit()
+    return noticia
+
+
+def test_claim_reparte_sin_duplicados(app):
+    """Dos publishers nunca reciben la misma noticia"""
+    for i in range(3):
+        _noticia(f'N{i}', minutos=i)
+    _noticia('Sin procesar', fase='pendiente', procesado=False)
+
+    primero = publication_lease.claim('p1', limit=2, lease_seconds=60)
+    segundo = publication_lease.claim('p2', limit=5, lease_seconds=60)
+
+    assert [n.titulo for n in primero] == ['N0', 'N1']
+    assert [n.titulo for n in segundo] == ['N2']
+    assert all(n.fase == 'publicando' and n.claimed_by == 'p1' for n in primero)
+    assert publication_lease.claim('p3') == []
+
+
+def test_lease_vencido_se_reclama(app):
+    """Una noticia con el lease vencido la toma otro publisher"""
+    noticia = _noticia('N')
+    publication_lease.claim('p1', lease_seconds=60)
+
+    noticia.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+
+    reclamadas = publication_lease.claim('p2')
+    assert [n.id for n in reclamadas] == [noticia.id]
+    assert reclamadas[0].claimed_by == 'p2'
+    assert reclamadas[0].lease_expires_at > datetime.utcnow()
+
+
+def test_publicando_manual_no_se_reclama(app):
+    """'publicando' sin lease (selección manual) no es reclamable"""
+    _noticia('Manual', fase='publicando')
+
+    assert publication_lease.claim('p1') == []
+
+
+def test_claim_fija_plataformas_si_no_hay_seleccion(app):
+    """Sin selección del usuario se usan las plataformas del publisher"""
+    _noticia('Sin seleccion', minutos=0)
+    _noticia('Con seleccion', minutos=1, plataformas_seleccionadas=['telegram'])
+
+    sin, con = publication_lease.claim('p1', platforms=['telegram', 'bluesky'])
+
+    assert sin.plataformas_seleccionadas == ['telegram', 'bluesky']
+    assert con.plataformas_seleccionadas == ['telegram']
+
+
+def test_renew_extiende_o_libera(app):
+    """Mientras se publica el lease se extiende; en fase final se libera"""
+    noticia = _noticia('N')
+    publication_lease.claim('p1', lease_seconds=60)
+
+    now = datetime.utcnow()
+    publication_lease.renew(noticia, lease_seconds=600, now=now)
+    assert noticia.lease_expires_at == now + timedelta(seconds=600)
+
+    noticia.fase = 'publicado_completo'
+    publication_lease.renew(noticia)
+    db.session.commit()
+
+    assert noticia.claimed_by is None
+    assert noticia.lease_expires_at is None
+    assert publication_lease.claim('p2') == []
+
+
+def test_heartbeat_renueva_toma_vencidas_e_informa_perdidas(app):
+    """El heartbeat extiende lo propio, retoma leases vencidos y reporta lo que tiene otro"""
+    propia = _noticia('Propia', minutos=0)
+    vencida = _noticia('Vencida', minutos=1)
+    ajena = _noticia('Ajena', minutos=2)
+    terminada = _noticia('Terminada', minutos=3, fase='publicado_completo')
+    publication_lease.claim('p1', limit=1, lease_seconds=60)
+    publication_lease.claim('p0', limit=1, lease_seconds=60)
+    publication_lease.claim('p2', limit=1, lease_seconds=60)
+
+    vencida.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+
+    renovadas, perdidas = publication_lease.heartbeat(
+        'p1', [propia.id, vencida.id, ajena.id, terminada.id], lease_seconds=3600
+    )
+
+    assert renovadas == [propia.id, vencida.id]
+    assert perdidas == [ajena.id]
+    db.session.expire_all()
+    assert db.session.get(APublicar, vencida.id).claimed_by == 'p1'
+    assert db.session.get(APublicar, propia.id).lease_expires_at > datetime.utcnow() + timedelta(minutes=59)
+    assert db.session.get(APublicar, ajena.id).claimed_by == 'p2'
+    assert publication_lease.heartbeat('p1', []) == ([], [])
+
+
+@pytest.fixture
+def app():
+    """Crear aplicación de prueba"""
+    from flask import Flask
+    from config.settings import TestingConfig
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    from src.models import init_db
+    init_db(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
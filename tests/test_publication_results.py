@@ -0,0 +1,143 @@
+"""
+Tests para el registro de resultados de publicación (individual y en lote)
+"""
+import pytest
+from datetime import datetime
+import sys
+sys.path.insert(0, '/app')
+
+from src import publication_lease, publication_results
+from src.models import db, APublicar, PublicationAttempt
+
+
+def _noticia(titulo, plataformas):
+    noticia = APublicar(
+        titulo=titulo, texto='x', url=f'https://e.com/{titulo}', fecha_hora=datetime.utcnow(),
+        fase='procesado', procesado=True, plataformas_seleccionadas=plataformas
+    )
+    db.session.add(noticia)
+    db.session.commit()
+    return noticia
+
+
+def test_apply_result_actualiza_fase_y_libera_lease(app):
+    """Con todas las plataformas confirmadas la noticia termina y suelta el lease"""
+    noticia = _noticia('N', ['telegram', 'bluesky'])
+    publication_lease.claim('p1')
+
+    parcial = publication_results.apply_result(noticia, {'platform': 'telegram', 'post_id': '1'})
+    assert parcial == {'noticia_id': noticia.id, 'platform': 'telegram', 'status': 'success', 'fase': 'publicando'}
+    assert noticia.claimed_by == 'p1'
+
+    final = publication_results.apply_result(noticia, {'platform': 'bluesky', 'error': 'HTTP 500'})
+    db.session.commit()
+
+    assert final['fase'] == 'publicado_parcial'
+    assert noticia.publicado is True
+    assert noticia.ultimo_error == 'bluesky: HTTP 500'
+    assert noticia.claimed_by is None
+
+
+def test_apply_results_en_lote_con_entradas_invalidas(app):
+    """Un lote aplica todo en un commit e informa las entradas que no pudo aplicar"""
+    uno = _noticia('Uno', ['telegram', 'bluesky'])
+    dos = _noticia('Dos', ['telegram'])
+
+    applied = publication_results.apply_results([
+        {'noticia_id': uno.id, 'platform': 'telegram', 'post_id': '1'},
+        {'noticia_id': 999, 'platform': 'telegram'},
+        {'noticia_id': uno.id, 'platform': 'bluesky', 'post_id': '2'},
+        {'noticia_id': dos.id},
+        {'noticia_id': dos.id, 'platform': 'telegram', 'error': 'HTTP 429'},
+    ])
+
+    assert [r['status'] for r in applied] == ['success', 'error', 'success', 'error', 'failed']
+    assert applied[1]['error'] == 'Noticia no encontrada'
+
+    db.session.expire_all()
+    assert db.session.get(APublicar, uno.id).fase == 'publicado_completo'
+    assert db.session.get(APublicar, dos.id).fase == 'fallido'
+
+
+def test_cada_resultado_es_un_insert_y_pending_no_cierra_la_fase(app):
+    """Los pendientes no cuentan como terminados; un reintento exitoso gana"""
+    noticia = _noticia('N', ['telegram', 'bluesky'])
+    publication_results.record_pending(noticia, ['telegram', 'bluesky'])
+    db.session.commit()
+
+    publication_results.apply_result(noticia, {'platform': 'telegram', 'error': 'timeout'})
+    assert noticia.fase == 'publicando'
+
+    publication_results.apply_result(noticia, {'platform': 'telegram', 'post_id': '1', 'post_url': 'https://t.me/1'})
+    publication_results.apply_result(noticia, {'platform': 'bluesky', 'post_id': '2'})
+    db.session.commit()
+
+    assert noticia.fase == 'publicado_completo'
+    assert PublicationAttempt.query.filter_by(noticia_id=noticia.id).count() == 5
+    assert PublicationAttempt.query.filter_by(platform='telegram', status='failed').count() == 1
+
+
+def test_plataformas_publicadas_mantiene_el_formato_anterior(app):
+    """La propiedad de compatibilidad arma el dict con el último intento por plataforma"""
+    noticia = _noticia('N', ['telegram', 'bluesky'])
+    publication_results.record_pending(noticia, ['telegram', 'bluesky'])
+    publication_results.apply_result(noticia, {'platform': 'telegram', 'error': 'timeout'})
+    publication_results.apply_result(noticia, {'platform': 'telegram', 'post_id': '1', 'post_url': 'https://t.me/1'})
+    db.session.commit()
+
+    plataformas = db.session.get(APublicar, noticia.id).plataformas_publicadas
+
+    assert plataformas['bluesky'] == {'status': 'pending', 'intentos': 0}
+    assert plataformas['telegram']['status'] == 'success'
+    assert plataformas['telegram']['post_url'] == 'https://t.me/1'
+    assert plataformas['telegram']['intentos'] == 2
+    assert noticia.to_dict()['plataformas_publicadas'] == plataformas
+
+
+def test_un_exito_gana_en_la_fase_y_en_plataformas_publicadas(app):
+    """Un fallo posterior a un éxito no cambia el estado de la plataforma en ningún lado"""
+    noticia = _noticia('N', ['telegram'])
+    publication_results.apply_result(noticia, {'platform': 'telegram', 'post_id': '1'})
+    publication_results.apply_result(noticia, {'platform': 'telegram', 'error': 'duplicado'})
+    db.session.commit()
+
+    assert noticia.fase == 'publicado_completo'
+    plataformas = db.session.get(APublicar, noticia.id).plataformas_publicadas
+    assert plataformas['telegram']['status'] == 'success'
+    assert plataformas['telegram']['post_id'] == '1'
+    assert plataformas['telegram']['intentos'] == 2
+
+
+def test_reintento_pendiente_reabre_una_plataforma_fallida(app):
+    """Tras un fallo, volver a elegir la plataforma deja la noticia publicándose"""
+    noticia = _noticia('N', ['telegram', 'bluesky'])
+    publication_results.apply_result(noticia, {'platform': 'telegram', 'post_id': '1'})
+    publication_results.apply_result(noticia, {'platform': 'bluesky', 'error': 'HTTP 500'})
+    assert noticia.fase == 'publicado_parcial'
+
+    publication_results.record_pending(noticia, ['bluesky'])
+    db.session.flush()
+
+    assert publication_results.derive_fase(noticia) == 'publicando'
+    assert publication_results.platform_statuses(noticia.id, ['telegram', 'bluesky']) == {
+        'telegram': 'success', 'bluesky': 'pending'
+    }
+
+
+@pytest.fixture
+def app():
+    """Crear aplicación de prueba"""
+    from flask import Flask
+    from config.settings import TestingConfig
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    from src.models import init_db
+    init_db(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,615 @@
+"""
+Tests para el servicio de publicación (adaptadores falsos, sin red)
+"""
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '/app')
+
+from social_publisher.adapters import PostResult
+from social_publisher.config.settings import SocialPublisherConfig
+from social_publisher.publisher_service import PublisherService
+from social_publisher.utils.pacing import PlatformPacer
+from social_publisher.utils.rate_limiter import RateLimitScheduler
+from social_publisher.utils.persistent_queue import PersistentQueue
+
+
+class _Config(SocialPublisherConfig):
+    ENABLED_PLATFORMS = []
+    PUBLISH_FANOUT = True
+    PUBLISH_MIN_INTERVAL_SECONDS = 0
+    PUBLISH_MIN_INTERVAL_OVERRIDES = ''
+    RATE_LIMIT_STATE_FILE = None
+    RATE_LIMIT_BURST = 5
+    QUEUE_DB_PATH = os.path.join(tempfile.mkdtemp(), 'queue.db')
+    QUEUE_POLL_SECONDS = 0.01
+    MAX_RETRIES = 2
+    RETRY_DELAY_SECONDS = 60
+
+
+class _FakeAdapter:
+    """Adaptador que tarda `delay` segundos y registra concurrencia"""
+
+    def __init__(self, platform, delay=0.1, tracker=None):
+        self.platform = platform
+        self.delay = delay
+        self.tracker = tracker
+        self.published = []
+        self.auth_calls = 0
+        self._authenticated = False
+
+    def authenticate(self):
+        self.auth_calls += 1
+        self._authenticated = not getattr(self, 'bad_credentials', False)
+        return self._authenticated
+
+    def is_authenticated(self):
+        return self._authenticated
+
+    def publish(self, content):
+        if getattr(self, 'fail', False):
+            return PostResult(success=False, platform=self.platform, error='HTTP 500')
+        if self.tracker:
+            self.tracker.enter()
+        time.sleep(self.delay)
+        if self.tracker:
+            self.tracker.exit()
+        self.published.append(content.titulo)
+        return PostResult(success=True, platform=self.platform, post_id='1')
+
+
+class _Tracker:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def enter(self):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def exit(self):
+        with self.lock:
+            self.active -= 1
+
+
+def _service(adapters, config=_Config):
+    service = PublisherService(config=config())
+    service.adapters = adapters
+    service.mark_as_published = lambda *args, **kwargs: True
+    return service
+
+
+def _noticia(noticia_id=1):
+    return {'id': noticia_id, 'titulo_es': f'Noticia {noticia_id}', 'resumen_corto': 'x', 'url': 'https://e.com'}
+
+
+def test_publish_news_fanout_en_paralelo():
+    """Las plataformas de una noticia se publican a la vez"""
+    tracker = _Tracker()
+    platforms = ['telegram', 'bluesky', 'twitter', 'linkedin']
+    service = _service({p: _FakeAdapter(p, delay=0.2, tracker=tracker) for p in platforms})
+
+    start = time.monotonic()
+    results = service.publish_news(_noticia())
+    elapsed = time.monotonic() - start
+
+    assert list(results) == platforms
+    assert all(result.success for result in results.values())
+    assert tracker.max_active == 4
+    assert elapsed < 0.6
+
+
+def test_publish_news_salta_plataformas_no_disponibles():
+    """Las plataformas sin adaptador no se publican ni bloquean el resto"""
+    service = _service({'telegram': _FakeAdapter('telegram', delay=0)})
+
+    results = service.publish_news(_noticia(), platforms=['twitter', 'telegram'])
+
+    assert list(results) == ['telegram']
+
+
+def test_autenticacion_fallida_reintenta_tras_el_backoff():
+    """Un login diferido fallido no se repite hasta que pasa el backoff; luego se reintenta"""
+    ok = _FakeAdapter('telegram', delay=0)
+    ko = _FakeAdapter('bluesky', delay=0)
+    ko.bad_credentials = True
+    marcados = []
+    service = _service({'telegram': ok, 'bluesky': ko})
+    service.mark_as_published = lambda **kwargs: marcados.append(kwargs)
+    service.publication_queue = PersistentQueue(os.path.join(tempfile.mkdtemp(), 'q.db'))
+
+    service.enqueue_news(_noticia(1))
+    messages = service.publication_queue.dequeue()
+    results = service.publish_news(_noticia(1), [m.platform for m in messages])
+    service._settle_messages(messages, results)
+
+    assert results['telegram'].success
+    assert not results['bluesky'].success
+    assert results['bluesky'].retry_after > 0
+    assert sorted(service.adapters) == ['bluesky', 'telegram']
+    assert [m['platform'] for m in marcados if m.get('error')] == ['bluesky']
+    assert service.publication_queue.qsize() == 1  # bluesky queda para reintentar
+
+    # Durante el backoff no se repite el login, pero la noticia recibe su resultado
+    results = service.publish_news(_noticia(2))
+    assert not results['bluesky'].success
+    assert ko.auth_calls == 1
+    assert [m['noticia_id'] for m in marcados if m['platform'] == 'bluesky'] == [1, 2]
+
+    # Vencido el backoff se reintenta el login y se publica
+    service._auth_backoff['bluesky'] = (1, 0)
+    ko.bad_credentials = False
+    assert service.publish_news(_noticia(3))['bluesky'].success
+    assert ko.auth_calls == 2
+    assert ok.auth_calls == 1
+    assert 'bluesky' not in service._auth_backoff
+
+
+def test_pacer_espacia_solo_la_misma_plataforma():
+    """Dos posts seguidos a la misma plataforma esperan el intervalo; a otra no"""
+    now = [100.0]
+    sleeps = []
+    pacer = PlatformPacer(default_interval=2, intervals={'twitter': 5},
+                          clock=lambda: now[0], sleep=sleeps.append)
+
+    assert pacer.wait('twitter') == 0
+    assert pacer.wait('telegram') == 0
+    assert pacer.wait('twitter') == 5
+    assert pacer.wait('telegram') == 2
+    assert sleeps == [5, 2]
+
+
+def test_parse_intervals():
+    """Formato de overrides plataforma:segundos"""
+    assert PlatformPacer.parse_intervals('twitter:5, linkedin:10') == {'twitter': 5.0, 'linkedin': 10.0}
+    assert PlatformPacer.parse_intervals('') == {}
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _limit(limit, days=1):
+    return {'limit': limit, 'remaining': limit, 'reset_at': datetime.utcnow() + timedelta(days=days)}
+
+
+def test_token_bucket_rafaga_y_recarga():
+    """Se permiten 'burst' posts seguidos y luego uno por intervalo de recarga"""
+    clock = _Clock()
+    limiter = RateLimitScheduler(burst=2, clock=clock)
+    limiter.configure('linkedin', _limit(24))  # 1 post/hora
+
+    assert limiter.acquire('linkedin') == 0
+    assert limiter.acquire('linkedin') == 0
+    wait = limiter.acquire('linkedin')
+    assert 3500 < wait <= 3600
+
+    clock.now += wait
+    assert limiter.acquire('linkedin') == 0
+
+
+def test_headers_de_rate_limit_ajustan_el_bucket():
+    """remaining=0 con reset o retry-after bloquean la plataforma"""
+    clock = _Clock()
+    limiter = RateLimitScheduler(burst=5, clock=clock)
+    limiter.configure('twitter', _limit(1500, days=30))
+
+    limiter.update_from_result('twitter', PostResult(success=False, platform='twitter', retry_after=120))
+    assert 119 < limiter.acquire('twitter') <= 120
+
+    clock.now += 121
+    limiter.update_from_result('twitter', PostResult(
+        success=True, platform='twitter', rate_limit_remaining=0,
+        rate_limit_reset=datetime.utcnow() + timedelta(seconds=600)
+    ))
+    assert 590 < limiter.acquire('twitter') <= 600
+
+
+def test_estado_persiste_entre_reinicios(tmp_path):
+    """Un reinicio no devuelve los tokens ya consumidos"""
+    state_file = str(tmp_path / 'rate_limits.json')
+    clock = _Clock()
+
+    limiter = RateLimitScheduler(state_file=state_file, burst=2, clock=clock)
+    limiter.configure('linkedin', _limit(24))
+    limiter.acquire('linkedin')
+    limiter.acquire('linkedin')
+
+    reiniciado = RateLimitScheduler(state_file=state_file, burst=2, clock=clock)
+    reiniciado.configure('linkedin', _limit(24))
+    assert reiniciado.acquire('linkedin') > 0
+
+
+def test_publish_news_difiere_plataformas_sin_cupo():
+    """Sin tokens la plataforma no se intenta y vuelve como diferida"""
+    twitter = _FakeAdapter('twitter', delay=0)
+    telegram = _FakeAdapter('telegram', delay=0)
+    service = _service({'twitter': twitter, 'telegram': telegram})
+    service.rate_limiter.configure('twitter', {'limit': 0, 'remaining': 0,
+                                               'reset_at': datetime.utcnow() + timedelta(days=1)})
+
+    results = service.publish_news(_noticia())
+
+    assert results['telegram'].success
+    assert results['twitter'].deferred
+    assert results['twitter'].retry_after > 0
+    assert twitter.published == []
+
+
+def test_parseo_de_headers_de_rate_limit():
+    """x-rate-limit-* y retry-after se traducen a campos de PostResult"""
+    from social_publisher.adapters import TwitterAdapter
+
+    class _Response:
+        headers = {'x-rate-limit-remaining': '3', 'x-rate-limit-reset': '2000000000', 'retry-after': '30'}
+
+    fields = TwitterAdapter(credentials={})._rate_limit_fields(_Response())
+
+    assert fields['rate_limit_remaining'] == 3
+    assert fields['rate_limit_reset'] == datetime.utcfromtimestamp(2000000000)
+    assert fields['retry_after'] == 30.0
+
+
+def test_queue_dedup_por_noticia_y_plataforma(tmp_path):
+    """Encolar dos veces la misma noticia no duplica publicaciones, ni después del ack"""
+    queue = PersistentQueue(str(tmp_path / 'q.db'))
+
+    assert queue.enqueue(_noticia(1), ['telegram', 'twitter']) == 2
+    assert queue.enqueue(_noticia(1), ['telegram', 'bluesky']) == 1
+
+    messages = queue.dequeue(max_items=10)
+    assert sorted(m.platform for m in messages) == ['bluesky', 'telegram', 'twitter']
+    queue.ack([m.id for m in messages])
+
+    assert queue.enqueue(_noticia(1), ['telegram']) == 0
+    assert queue.qsize() == 0
+
+
+def test_queue_visibility_timeout_y_reinicio(tmp_path):
+    """Sin ack el mensaje reaparece al vencer el timeout, aun tras reabrir la queue"""
+    now = [1000.0]
+    path = str(tmp_path / 'q.db')
+    queue = PersistentQueue(path, visibility_timeout=30, clock=lambda: now[0])
+    queue.enqueue(_noticia(1), ['telegram'])
+
+    assert len(queue.dequeue()) == 1
+    assert queue.dequeue() == []
+
+    now[0] += 31
+    reabierta = PersistentQueue(path, visibility_timeout=30, clock=lambda: now[0])
+    messages = reabierta.dequeue()
+    assert len(messages) == 1
+    assert messages[0].attempts == 2
+    assert messages[0].noticia['titulo_es'] == 'Noticia 1'
+
+
+def test_queue_varios_workers_no_duplican(tmp_path):
+    """Dequeue en bloque desde varios threads entrega cada mensaje una sola vez"""
+    queue = PersistentQueue(str(tmp_path / 'q.db'))
+    for i in range(50):
+        queue.enqueue(_noticia(i), ['telegram', 'twitter'])
+
+    entregados = []
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            messages = queue.dequeue(max_items=7)
+            if not messages:
+                return
+            with lock:
+                entregados.extend(m.id for m in messages)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(entregados) == 100
+    assert len(set(entregados)) == 100
+
+
+def test_worker_confirma_reintenta_y_descarta():
+    """Exitosos → ack; fallidos → reintento con backoff y descarte al agotar intentos"""
+    ok = _FakeAdapter('telegram', delay=0)
+    ko = _FakeAdapter('twitter', delay=0)
+    ko.fail = True
+    service = _service({'telegram': ok, 'twitter': ko})
+    service.publication_queue = PersistentQueue(os.path.join(tempfile.mkdtemp(), 'q.db'))
+
+    service.enqueue_news(_noticia(1))
+    messages = service.publication_queue.dequeue()
+    service._settle_messages(messages, service.publish_news(_noticia(1), [m.platform for m in messages]))
+
+    stats = service.publication_queue.get_stats()
+    assert stats['done'] == 1
+    assert stats['in_flight'] == 1  # twitter esperando el reintento
+
+    row = service.publication_queue._conn().execute(
+        "SELECT visible_at, attempts FROM publication_queue WHERE platform = 'twitter'").fetchone()
+    assert row[1] == 1
+    service.publication_queue._conn().execute("UPDATE publication_queue SET visible_at = 0")
+
+    messages = service.publication_queue.dequeue()
+    service._settle_messages(messages, service.publish_news(_noticia(1), [m.platform for m in messages]))
+
+    assert service.publication_queue.qsize() == 0
+    assert service.enqueue_news(_noticia(1)) == 1  # twitter se puede volver a ofrecer
+
+
+def test_sesion_http_compartida_reutiliza_conexiones():
+    """Todos los requests van por la misma sesión y la misma conexión keep-alive"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from social_publisher.adapters import TelegramAdapter, configure_http_session, get_http_session
+
+    puertos_cliente = set()
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            puertos_cliente.add(self.client_address[1])
+            body = b'{"ok": true, "result": {"username": "bot"}}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        configure_http_session(pool_maxsize=2, connect_timeout=2, read_timeout=2)
+        adapter = TelegramAdapter(credentials={'bot_token': 'x'})
+        adapter.API_BASE_URL = f'http://127.0.0.1:{server.server_port}'
+
+        for _ in range(5):
+            assert adapter.authenticate()
+
+        assert adapter.http is get_http_session()
+        assert get_http_session().timeout == (2, 2)
+        assert len(puertos_cliente) == 1
+    finally:
+        server.shutdown()
+        configure_http_session()
+
+
+def test_twitter_reutiliza_la_sesion_oauth():
+    """La sesión OAuth1 se crea una vez y usa el adaptador con pool"""
+    from social_publisher.adapters import TwitterAdapter
+
+    adapter = TwitterAdapter(credentials={
+        'api_key': 'k', 'api_secret': 's', 'access_token': 't', 'access_token_secret': 'ts'
+    })
+
+    session = adapter._oauth_session()
+
+    assert adapter._oauth_session() is session
+    assert session.get_adapter('https://api.twitter.com').max_retries.connect == 3
+
+
+def test_wait_for_work_usa_cursor_y_propaga_errores():
+    """El long-poll guarda el cursor entre llamadas y los errores llegan al llamador"""
+    import pytest
+    import requests
+
+    llamadas = []
+    respuestas = [
+        {'ready': False, 'count': 0, 'cursor': '2026-10-18T12:00:00'},
+        {'ready': True, 'count': 1, 'cursor': '2026-10-18T12:05:00'},
+    ]
+
+    class _Response:
+        def __init__(self, data, status=200):
+            self.data = data
+            self.status_code = status
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.HTTPError(f'HTTP {self.status_code}')
+
+        def json(self):
+            return self.data
+
+    class _Http:
+        def get(self, url, params=None, timeout=None):
+            llamadas.append(dict(params))
+            if not respuestas:
+                return _Response({}, status=502)
+            return _Response(respuestas.pop(0))
+
+    service = _service({})
+    service.http = _Http()
+
+    assert service.wait_for_work(20) is False
+    assert service.wait_for_work(20) is True
+    assert 'since' not in llamadas[0]
+    assert llamadas[1]['since'] == '2026-10-18T12:00:00'
+    assert service.work_cursor == '2026-10-18T12:05:00'
+
+    with pytest.raises(requests.HTTPError):
+        service.wait_for_work(20)
+
+
+def test_fetch_reclama_con_identidad_del_publisher():
+    """El ciclo reclama noticias con POST /api/news/claim a nombre de la réplica"""
+    enviados = []
+
+    class _Response:
+        status_code = 200
+
+        def json(self):
+            return {'count': 1, 'noticias': [_noticia(7)]}
+
+    class _Http:
+        def post(self, url, json=None, timeout=None):
+            enviados.append((url, json))
+            return _Response()
+
+    service = _service({'telegram': _FakeAdapter('telegram')})
+    service.http = _Http()
+    service.publisher_id = 'replica-1'
+
+    assert [n['id'] for n in service.fetch_news_to_publish(limit=3)] == [7]
+    url, payload = enviados[0]
+    assert url.endswith('/api/news/claim')
+    assert payload == {'publisher_id': 'replica-1', 'limit': 3, 'platforms': ['telegram']}
+
+
+def test_run_cycle_omite_plataformas_ya_publicadas():
+    """Al retomar un lease vencido no se vuelve a publicar donde ya hubo éxito"""
+    noticia = dict(
+        _noticia(3),
+        plataformas_seleccionadas=['telegram', 'bluesky'],
+        plataformas_publicadas={'telegram': {'status': 'success', 'post_id': '9'},
+                                'bluesky': {'status': 'failed', 'error': 'HTTP 500'}}
+    )
+    service = _service({p: _FakeAdapter(p, delay=0) for p in ('telegram', 'bluesky')})
+    service.publication_queue = PersistentQueue(os.path.join(tempfile.mkdtemp(), 'q.db'))
+    service.heartbeat_leases = lambda: 0
+    service.fetch_news_to_publish = lambda limit: [noticia]
+
+    service.run_cycle()
+
+    assert [m.platform for m in service.publication_queue.dequeue()] == ['bluesky']
+
+
+def test_run_cycle_informa_plataformas_sin_adaptador():
+    """Una plataforma elegida sin adaptador se informa como fallida (no queda en 'publicando')"""
+    marcados = []
+    service = _service({'telegram': _FakeAdapter('telegram', delay=0)})
+    service.mark_as_published = lambda **kwargs: marcados.append(kwargs)
+    service.publication_queue = PersistentQueue(os.path.join(tempfile.mkdtemp(), 'q.db'))
+    service.heartbeat_leases = lambda: 0
+    service.fetch_news_to_publish = lambda limit: [
+        dict(_noticia(4), plataformas_seleccionadas=['telegram', 'twitter']),
+        dict(_noticia(5), plataformas_seleccionadas=['twitter']),
+    ]
+
+    service.run_cycle()
+
+    assert [(m['noticia_id'], m['platform']) for m in marcados] == [(4, 'twitter'), (5, 'twitter')]
+    assert all(m['error'] for m in marcados)
+    assert [(m.noticia_id, m.platform) for m in service.publication_queue.dequeue()] == [(4, 'telegram')]
+
+
+def test_heartbeat_renueva_leases_y_descarta_perdidas():
+    """Lo que sigue en la queue renueva su lease; lo que tomó otra réplica se descarta"""
+    enviados = []
+
+    class _Response:
+        status_code = 200
+
+        def json(self):
+            return {'renewed': [1], 'lost': [2]}
+
+    class _Http:
+        def post(self, url, json=None, timeout=None):
+            enviados.append((url, json))
+            return _Response()
+
+    service = _service({'telegram': _FakeAdapter('telegram', delay=0)})
+    service.publication_queue = PersistentQueue(os.path.join(tempfile.mkdtemp(), 'q.db'))
+    service.http = _Http()
+    service.publisher_id = 'replica-1'
+    service.enqueue_news(_noticia(1))
+    service.enqueue_news(_noticia(2))
+
+    assert service.heartbeat_leases() == 1
+
+    url, payload = enviados[0]
+    assert url.endswith('/api/news/lease-heartbeat')
+    assert payload == {'publisher_id': 'replica-1', 'noticia_ids': [1, 2]}
+    assert service.publication_queue.pending_noticias() == [1]
+
+
+def test_result_buffer_envia_en_lotes_y_reintenta():
+    """Los resultados salen en lotes de max_batch y un lote fallido vuelve al buffer"""
+    from social_publisher.utils.result_buffer import ResultBuffer
+
+    enviados = []
+    respuestas = [True, False, True, True]
+
+    def sender(batch):
+        enviados.append([r['id'] for r in batch])
+        return respuestas.pop(0)
+
+    buffer = ResultBuffer(sender, flush_interval=60, max_batch=2)
+    for i in range(5):
+        buffer.add({'id': i})
+
+    assert buffer.flush() == 2  # El segundo lote falla y corta el flush
+    assert buffer.qsize() == 3
+    assert buffer.flush() == 3
+    assert enviados == [[0, 1], [2, 3], [2, 3], [4]]
+
+
+def test_result_buffer_persiste_hasta_enviar(tmp_path):
+    """Los resultados sobreviven a un reinicio y no se descartan mientras el envío falle"""
+    from social_publisher.utils.result_buffer import ResultBuffer
+
+    path = str(tmp_path / 'queue.db')
+    caido = ResultBuffer(lambda batch: False, flush_interval=60, max_batch=10, path=path)
+    for i in range(25):
+        caido.add({'id': i})
+    assert caido.flush() == 0
+    assert caido.qsize() == 25
+
+    # El proceso muere antes de enviar: el próximo arranque los encuentra
+    enviados = []
+    reiniciado = ResultBuffer(lambda batch: enviados.extend(r['id'] for r in batch) or True,
+                              flush_interval=60, max_batch=10, path=path)
+
+    assert reiniciado.qsize() == 25
+    assert reiniciado.flush() == 25
+    assert enviados == list(range(25))
+    assert ResultBuffer(lambda batch: True, path=path).qsize() == 0
+
+
+def test_mark_as_published_se_agrupa_en_un_request():
+    """Los resultados de varias plataformas llegan a WebIAScraper en un solo POST"""
+    requests_enviados = []
+
+    class _Response:
+        status_code = 200
+
+        def __init__(self, results):
+            self.results = results
+
+        def json(self):
+            return {'results': [dict(r, status='success', fase='publicando') for r in self.results]}
+
+    class _Http:
+        def post(self, url, json=None, timeout=None):
+            requests_enviados.append((url, json))
+            return _Response(json['results'])
+
+    class _IsolatedConfig(_Config):
+        QUEUE_DB_PATH = os.path.join(tempfile.mkdtemp(), 'queue.db')
+
+    service = PublisherService(config=_IsolatedConfig())
+    service.adapters = {p: _FakeAdapter(p, delay=0) for p in ('telegram', 'bluesky', 'twitter')}
+    service.http = _Http()
+
+    service.publish_news(_noticia(1))
+    assert requests_enviados == []
+
+    assert service.result_buffer.flush() == 3
+    assert len(requests_enviados) == 1
+    url, payload = requests_enviados[0]
+    assert url.endswith('/api/news/mark-published-batch')
+    assert sorted(r['platform'] for r in payload['results']) == ['bluesky', 'telegram', 'twitter']
@@ -0,0 +1,207 @@
+"""
+Tests para el scraper de fuentes técnicas (RSS)
+"""
+import time
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '/app')
+
+from src.technical_sources_scraper import TechnicalSourcesScraper
+
+
+def _item(titulo, url, fecha=None):
+    """Construye un <item> RSS"""
+    fecha = fecha or datetime.utcnow()
+    pub_date = fecha.strftime('%a, %d %b %Y %H:%M:%S +0000')
+    return f"""<item><title>{titulo}</title><link>{url}</link><guid>{url}</guid>
+<description>&lt;p&gt;Contenido de {titulo}&lt;/p&gt;</description>
+<pubDate>{pub_date}</pubDate></item>"""
+
+
+def _rss(titulo, url, fecha=None, items=None):
+    """Construye un feed RSS mínimo (una entrada o la lista de items dada)"""
+    body = ''.join(items) if items is not None else _item(titulo, url, fecha)
+    return f"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>{body}</channel></rss>""".encode('utf-8')
+
+
+def test_fetch_concurrente_mantiene_orden_de_fuentes(monkeypatch):
+    """Las fuentes se combinan en el orden configurado aunque terminen en otro orden"""
+    sources = ['huggingface', 'arxiv_ai', 'openai']
+    delays = {'huggingface': 0.3, 'arxiv_ai': 0.1, 'openai': 0.2}
+    scraper = TechnicalSourcesScraper(sources=sources, max_workers=3)
+
+    def fake_download(feed_url, state=None):
+        source_id = next(s for s in sources if scraper.TECHNICAL_SOURCES[s]['rss_url'] == feed_url)
+        time.sleep(delays[source_id])
+        return 200, _rss(source_id, f'https://example.com/{source_id}'), {}
+
+    monkeypatch.setattr(scraper, '_download_feed', fake_download)
+
+    start = time.monotonic()
+    results = scraper._fetch_sources_concurrently(sources, max_per_source=5)
+    elapsed = time.monotonic() - start
+
+    assert list(results) == ['arxiv_ai', 'openai', 'huggingface']
+    assert elapsed < sum(delays.values())
+
+    scraper.feed_state = {}  # Olvidar hashes para volver a parsear
+    articles = scraper.fetch_all_sources(max_per_source=5)
+    assert {a['url'] for a in articles} == {f'https://example.com/{s}' for s in sources}
+
+
+def test_fetch_concurrente_respeta_deadline(monkeypatch):
+    """Las fuentes que no terminan antes del deadline se omiten"""
+    scraper = TechnicalSourcesScraper(sources=['huggingface', 'openai'], max_workers=2, total_deadline=0.2)
+
+    def fake_download(feed_url, state=None):
+        if 'openai' in feed_url:
+            time.sleep(1)
+        return 200, _rss(feed_url, feed_url), {}
+
+    monkeypatch.setattr(scraper, '_download_feed', fake_download)
+
+    start = time.monotonic()
+    articles = scraper.fetch_all_sources(max_per_source=5)
+
+    assert time.monotonic() - start < 0.8
+    assert [a['fuente'] for a in articles] == ['Hugging Face Blog']
+
+
+def test_limite_de_conexiones_por_host(monkeypatch):
+    """Nunca hay más de per_host_limit descargas simultáneas al mismo host"""
+    scraper = TechnicalSourcesScraper(sources=['arxiv_ai', 'arxiv_ml'], max_workers=4, per_host_limit=1)
+    activos = {'actual': 0, 'maximo': 0}
+
+    def fake_get(url, **kwargs):
+        activos['actual'] += 1
+        activos['maximo'] = max(activos['maximo'], activos['actual'])
+        time.sleep(0.1)
+        activos['actual'] -= 1
+        raise ConnectionError('sin red en tests')
+
+    monkeypatch.setattr('src.technical_sources_scraper.requests.get', fake_get)
+
+    assert scraper.fetch_all_sources(max_per_source=5) == []
+    assert activos['maximo'] == 1
+
+
+class _FakeResponse:
+    """Respuesta HTTP mínima para simular requests.get"""
+
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        yield self.content
+
+    def close(self):
+        pass
+
+
+def test_get_condicional_envia_validadores_y_omite_304(monkeypatch):
+    """Con ETag/Last-Modified guardados, un 304 no devuelve artículos"""
+    feed_state = {}
+    scraper = TechnicalSourcesScraper(sources=['huggingface'], max_workers=1, feed_state=feed_state)
+    enviados = []
+    respuestas = [
+        _FakeResponse(200, _rss('Primero', 'https://example.com/1'),
+                      {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+        _FakeResponse(304),
+    ]
+
+    def fake_get(url, headers=None, **kwargs):
+        enviados.append(headers)
+        return respuestas.pop(0)
+
+    monkeypatch.setattr('src.technical_sources_scraper.requests.get', fake_get)
+
+    assert len(scraper.fetch_all_sources(max_per_source=5)) == 1
+    assert feed_state['huggingface']['etag'] == '"abc"'
+    assert feed_state['huggingface']['content_hash']
+
+    assert scraper.fetch_all_sources(max_per_source=5) == []
+    assert enviados[1]['If-None-Match'] == '"abc"'
+    assert enviados[1]['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+
+def test_contenido_con_mismo_hash_no_se_parsea(monkeypatch):
+    """Si el servidor no soporta 304 pero el cuerpo es idéntico, se omite el parseo"""
+    body = _rss('Igual', 'https://example.com/igual')
+    scraper = TechnicalSourcesScraper(sources=['huggingface'], max_workers=1)
+    monkeypatch.setattr('src.technical_sources_scraper.requests.get',
+                        lambda url, **kwargs: _FakeResponse(200, body))
+
+    assert len(scraper.fetch_all_sources(max_per_source=5)) == 1
+
+    parseos = []
+    monkeypatch.setattr('src.technical_sources_scraper.feedparser.parse',
+                        lambda *args, **kwargs: parseos.append(args))
+
+    assert scraper.fetch_all_sources(max_per_source=5) == []
+    assert parseos == []
+
+
+def test_high_water_mark_solo_emite_entradas_nuevas(monkeypatch):
+    """Después de la primera corrida solo se devuelven entradas posteriores a la última vista"""
+    ahora = datetime.utcnow().replace(microsecond=0)
+    viejas = [
+        _item('B', 'https://example.com/b', ahora - timedelta(hours=1)),
+        _item('A', 'https://example.com/a', ahora - timedelta(hours=2)),
+    ]
+    feeds = [
+        _rss(None, None, items=viejas),
+        _rss(None, None, items=[_item('C', 'https://example.com/c', ahora)] + viejas),
+    ]
+    scraper = TechnicalSourcesScraper(sources=['huggingface'], max_workers=1)
+    monkeypatch.setattr(scraper, '_download_feed', lambda url, state=None: (200, feeds.pop(0), {}))
+
+    primera = scraper.fetch_all_sources(max_per_source=5)
+    assert [a['titulo'] for a in primera] == ['B', 'A']
+    assert scraper.feed_state['huggingface']['last_entry_at'] == ahora - timedelta(hours=1)
+    assert scraper.feed_state['huggingface']['last_entry_guids'] == ['https://example.com/b']
+
+    segunda = scraper.fetch_all_sources(max_per_source=5)
+    assert [a['titulo'] for a in segunda] == ['C']
+    assert scraper.feed_state['huggingface']['last_entry_at'] == ahora
+
+
+def test_high_water_mark_recuerda_todas_las_entradas_con_la_misma_fecha(monkeypatch):
+    """Las entradas que comparten la fecha más nueva no se vuelven a emitir; una nueva con esa fecha sí"""
+    ahora = datetime.utcnow().replace(microsecond=0)
+    mismas = [
+        _item('B', 'https://example.com/b', ahora),
+        _item('A', 'https://example.com/a', ahora),
+    ]
+    feeds = [
+        _rss(None, None, items=mismas),
+        _rss(None, None, items=[_item('C', 'https://example.com/c', ahora)] + mismas),
+    ]
+    scraper = TechnicalSourcesScraper(sources=['huggingface'], max_workers=1)
+    monkeypatch.setattr(scraper, '_download_feed', lambda url, state=None: (200, feeds.pop(0), {}))
+
+    assert [a['titulo'] for a in scraper.fetch_all_sources(max_per_source=5)] == ['B', 'A']
+    assert scraper.feed_state['huggingface']['last_entry_guids'] == ['https://example.com/a', 'https://example.com/b']
+
+    assert [a['titulo'] for a in scraper.fetch_all_sources(max_per_source=5)] == ['C']
+    assert len(scraper.feed_state['huggingface']['last_entry_guids']) == 3
+
+
+def test_temas_del_feed_usan_la_taxonomia_compartida():
+    """Tipo de fuente, tags del feed y temas de título + descripción, sin repetir"""
+    import feedparser
+
+    scraper = TechnicalSourcesScraper(sources=['huggingface'])
+    entry = feedparser.FeedParserDict(
+        title='Fine-tuning LLMs with PyTorch',
+        tags=[{'term': 'pytorch'}]
+    )
+
+    temas = scraper._extract_feed_topics(entry, 'Research', 'A guide to reinforcement learning for LLMs')
+
+    assert temas == ['Research', 'PyTorch', 'LLM', 'Reinforcement Learning']
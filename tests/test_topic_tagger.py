@@ -0,0 +1,87 @@
+"""
+Tests para el etiquetador de temas (Aho-Corasick)
+"""
+import json
+import sys
+sys.path.insert(0, '/app')
+
+from src.topic_tagger import TopicTagger, get_tagger, DEFAULT_TOPICS_FILE
+
+TOPICS = {
+    'GPT': ['gpt'],
+    'ChatGPT': ['chatgpt'],
+    'Diffusion Models': ['diffusion'],
+    'Stable Diffusion': ['stable diffusion'],
+    'LLM': ['llm', 'llms', 'large language model'],
+    'Robotics': ['robotics'],
+}
+
+
+def test_coincidencia_por_palabra_completa():
+    """'gpt' coincide en 'GPT-4' pero no dentro de 'ChatGPT'"""
+    tagger = TopicTagger(TOPICS)
+
+    assert [label for _, label in tagger.find('ChatGPT vs GPT-4')] == ['ChatGPT', 'GPT']
+    assert tagger.find('LLMs and llmops') == [(0, 'LLM')]
+
+
+def test_gana_la_coincidencia_mas_larga():
+    """'stable diffusion' no cuenta además como 'diffusion'"""
+    tagger = TopicTagger(TOPICS)
+
+    assert tagger.tag('Stable   Diffusion 3 released') == ['Stable Diffusion']
+    assert tagger.tag('Stable Diffusion and other diffusion models') == ['Stable Diffusion', 'Diffusion Models']
+
+
+def test_el_titulo_pesa_mas_que_el_cuerpo():
+    """Una mención en el título supera a dos en el cuerpo"""
+    tagger = TopicTagger(TOPICS, title_weight=3, body_weight=1)
+
+    temas = tagger.tag('New robotics lab', 'A large language model and more LLMs for robotics')
+
+    assert temas == ['Robotics', 'LLM']
+    assert tagger.tag('Nothing here', 'Nor here') == []
+
+
+def test_canonical():
+    """Un término que es sinónimo completo devuelve el nombre del tema"""
+    tagger = TopicTagger(TOPICS)
+
+    assert tagger.canonical(' Large  Language Model ') == 'LLM'
+    assert tagger.canonical('stable diffusion') == 'Stable Diffusion'
+    assert tagger.canonical('gpt-4') is None
+
+
+def test_max_topics():
+    tagger = TopicTagger(TOPICS)
+
+    assert len(tagger.tag('GPT, ChatGPT, LLM, robotics, diffusion', max_topics=2)) == 2
+
+
+def test_taxonomia_desde_archivo(tmp_path):
+    """La taxonomía se carga de un JSON y se comparte por archivo"""
+    path = tmp_path / 'topics.json'
+    path.write_text(json.dumps({'title_weight': 2, 'topics': {'Agents': ['agent', 'agents']}}))
+
+    tagger = get_tagger(str(path))
+
+    assert tagger is get_tagger(str(path))
+    assert tagger.title_weight == 2
+    assert tagger.tag('Autonomous agents') == ['Agents']
+
+
+def test_archivo_invalido_devuelve_tagger_vacio(tmp_path):
+    """Un archivo roto no corta el scraping: no etiqueta nada"""
+    path = tmp_path / 'topics.json'
+    path.write_text('{"temas": []}')
+
+    assert get_tagger(str(path)).tag('GPT') == []
+
+
+def test_taxonomia_por_defecto():
+    """config/topics.json cubre los temas que usaban ambos scrapers"""
+    tagger = TopicTagger.from_file(DEFAULT_TOPICS_FILE)
+
+    assert tagger.tag('Hugging Face releases a PyTorch transformer for NLP') == [
+        'Hugging Face', 'PyTorch', 'Transformers', 'NLP'
+    ]
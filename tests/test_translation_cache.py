@@ -0,0 +1,146 @@
+"""
+Tests para el cache de traducciones por contenido
+"""
+import pytest
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '/app')
+
+from src.models import db, TranslationCacheEntry
+from src.translation_cache import TranslationCache
+from src.translation_service import TranslationService
+
+RESPUESTA = """[TITULO_ES]
+Título traducido
+[/TITULO_ES]
+[TEXTO_ES]
+Texto traducido
+[/TEXTO_ES]
+[CATEGORIA]
+News
+[/CATEGORIA]"""
+
+
+class _Block:
+    def __init__(self, text):
+        self.text = text
+
+
+class _Response:
+    def __init__(self, text):
+        self.content = [_Block(text)]
+
+
+class _FakeMessages:
+    def __init__(self, text=RESPUESTA):
+        self.text = text
+        self.calls = 0
+
+    def create(self, **params):
+        self.calls += 1
+        return _Response(self.text)
+
+
+class _FakeClient:
+    def __init__(self, messages):
+        self.messages = messages
+
+
+def _service(cache, messages):
+    service = TranslationService(api_key='test-key', cache=cache)
+    service.client = _FakeClient(messages)
+    return service
+
+
+def test_mismo_contenido_con_otra_url_sale_del_cache(app):
+    """El contenido repetido (con otra URL y otros espacios) no vuelve a llamar a la API"""
+    cache = TranslationCache(app)
+    messages = _FakeMessages()
+    service = _service(cache, messages)
+
+    primero = service.translate_and_optimize('AI News', 'Some  text', 'https://a.com/1')
+    segundo = service.translate_and_optimize(' AI News', 'Some text\n', 'https://b.com/1?utm_source=x')
+
+    assert messages.calls == 1
+    assert segundo == primero
+    assert cache.get_stats()['hits'] == 1
+    assert cache.get_stats()['misses'] == 1
+    assert TranslationCacheEntry.query.one().hits == 1
+
+
+def test_no_cachea_traducciones_fallidas(app):
+    """Si titulo_es == titulo la traducción falló y no se guarda"""
+    cache = TranslationCache(app)
+    messages = _FakeMessages(RESPUESTA.replace('Título traducido', 'AI News'))
+    service = _service(cache, messages)
+
+    service.translate_and_optimize('AI News', 'x', 'u')
+    service.translate_and_optimize('AI News', 'x', 'u')
+
+    assert messages.calls == 2
+    assert TranslationCacheEntry.query.count() == 0
+
+
+def test_reproceso_forzado_no_usa_el_cache(app):
+    """reprocess_item(force=True) vuelve a llamar a la API; el reproceso normal usa el cache"""
+    from src.models import APublicar
+    from src.social_media_processor import SocialMediaProcessor
+
+    item = APublicar(titulo='AI News', texto='x', url='https://e.com/1', fecha_hora=datetime.utcnow())
+    db.session.add(item)
+    db.session.commit()
+    messages = _FakeMessages()
+    processor = SocialMediaProcessor(anthropic_api_key='test-key')
+    processor.translation_service.client = _FakeClient(messages)
+
+    assert processor.process_item(item.id)
+    assert processor.reprocess_item(item.id)
+    assert messages.calls == 1
+
+    assert processor.reprocess_item(item.id, force=True)
+    assert messages.calls == 2
+
+
+def test_clave_cambia_con_modelo_y_version():
+    """Modelo o versión del prompt distintos no comparten entradas"""
+    base = TranslationCache.make_key('m1', 'v1', 'T', 'x')
+
+    assert base == TranslationCache.make_key('m1', 'v1', 'T ', ' x')
+    assert base != TranslationCache.make_key('m2', 'v1', 'T', 'x')
+    assert base != TranslationCache.make_key('m1', 'v2', 'T', 'x')
+
+
+def test_desalojo_por_ttl_y_tamano(app):
+    """Se eliminan las vencidas y, sobre el máximo, las menos usadas"""
+    cache = TranslationCache(app, ttl_days=30, max_entries=2)
+    now = datetime.utcnow()
+
+    db.session.add(TranslationCacheEntry(key='vieja', model='m', result={},
+                                         created_at=now - timedelta(days=40), last_hit_at=now))
+    for i in range(3):
+        db.session.add(TranslationCacheEntry(key=f'k{i}', model='m', result={},
+                                             created_at=now, last_hit_at=now - timedelta(hours=i)))
+    db.session.commit()
+
+    assert cache.evict() == 2
+    assert cache.get('vieja') is None
+    assert sorted(key for (key,) in db.session.query(TranslationCacheEntry.key)) == ['k0', 'k1']
+
+
+@pytest.fixture
+def app():
+    """Crear aplicación de prueba"""
+    from flask import Flask
+    from config.settings import TestingConfig
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    from src.models import init_db
+    init_db(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,195 @@
+"""
+Tests para el servicio de traducción (sin llamadas reales a la API)
+"""
+import threading
+import time
+import sys
+sys.path.insert(0, '/app')
+
+from src.translation_service import TranslationService, AdaptiveConcurrencyLimiter
+
+RESPUESTA = """[TITULO_ES]
+Título traducido
+[/TITULO_ES]
+[TEXTO_ES]
+Texto traducido
+[/TEXTO_ES]
+[CATEGORIA]
+News
+[/CATEGORIA]"""
+
+
+class _Block:
+    def __init__(self, text):
+        self.text = text
+
+
+class _Response:
+    def __init__(self, text):
+        self.content = [_Block(text)]
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+    response = None
+
+
+class _FakeMessages:
+    """Simula client.messages contando llamadas concurrentes"""
+
+    def __init__(self, delay=0.05, rate_limit_first=0):
+        self.delay = delay
+        self.rate_limit_first = rate_limit_first
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def create(self, **params):
+        with self.lock:
+            self.calls += 1
+            if self.calls <= self.rate_limit_first:
+                raise _RateLimitError('429 rate limited')
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return _Response(RESPUESTA)
+
+
+class _FakeClient:
+    def __init__(self, messages):
+        self.messages = messages
+
+
+def _service(messages, max_concurrency):
+    service = TranslationService(api_key='test-key', max_concurrency=max_concurrency)
+    service.client = _FakeClient(messages)
+    return service
+
+
+def test_batch_translate_en_paralelo_respeta_orden_y_concurrencia():
+    """Las traducciones corren en paralelo, sin superar max_concurrency"""
+    messages = _FakeMessages(delay=0.1)
+    service = _service(messages, max_concurrency=4)
+    noticias = [{'id': i, 'titulo': f'T{i}', 'texto': 'x', 'url': 'u'} for i in range(8)]
+
+    start = time.monotonic()
+    results = service.batch_translate(noticias)
+    elapsed = time.monotonic() - start
+
+    assert [r['id'] for r in results] == list(range(8))
+    assert results[0]['titulo_es'] == 'Título traducido'
+    assert 1 < messages.max_active <= 4
+    assert elapsed < 8 * 0.1
+
+
+def test_rate_limit_reintenta_y_reduce_concurrencia():
+    """Un 429 reduce el límite a la mitad, pausa y reintenta la llamada"""
+    messages = _FakeMessages(delay=0, rate_limit_first=1)
+    service = _service(messages, max_concurrency=4)
+    service.limiter.base_backoff = service.limiter._backoff = 0.05
+
+    result = service.translate_and_optimize('Title', 'Text', 'https://example.com')
+
+    assert result['titulo_es'] == 'Título traducido'
+    assert messages.calls == 2
+    assert service.limiter.limit == 2
+
+
+def test_limitador_aumenta_limite_tras_exitos():
+    """Tras una ronda de éxitos el límite sube de a uno hasta el máximo"""
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=3, base_backoff=0)
+    limiter.limit = 1
+
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release()
+
+    assert limiter.limit == 3
+    assert limiter.active == 0
+
+
+def test_instrucciones_en_system_cacheable():
+    """Las instrucciones fijas van en system con cache_control; el artículo en el mensaje"""
+    service = _service(_FakeMessages(), max_concurrency=1)
+
+    params = service.build_message_params('Titulo X', 'Texto Y', 'https://e.com')
+
+    assert params['system'][0]['cache_control'] == {'type': 'ephemeral'}
+    assert '[TITULO_ES]' in params['system'][0]['text']
+    assert 'Titulo X' not in params['system'][0]['text']
+    assert 'Titulo X' in params['messages'][0]['content']
+    assert '[TITULO_ES]' not in params['messages'][0]['content']
+
+
+def test_system_prompt_alcanza_el_minimo_cacheable(monkeypatch, caplog):
+    """El bloque de system supera PROMPT_CACHE_MIN_TOKENS: si no, cache_control se ignora"""
+    import logging
+    from src import translation_service
+
+    assert translation_service._estimate_tokens(translation_service.TRANSLATION_SYSTEM_PROMPT) \
+        >= translation_service.PROMPT_CACHE_MIN_TOKENS
+
+    monkeypatch.setattr(translation_service, '_prompt_cache_checked', False)
+    with caplog.at_level(logging.INFO, logger='src.translation_service'):
+        TranslationService(api_key='test-key')
+    assert not [r for r in caplog.records if 'Prompt caching inactivo' in r.getMessage()]
+
+
+def test_avisa_una_vez_si_el_prompt_queda_debajo_del_minimo(monkeypatch, caplog):
+    """Si una edición acorta el prompt debajo del mínimo, se avisa una sola vez"""
+    import logging
+    from src import translation_service
+
+    monkeypatch.setattr(translation_service, '_prompt_cache_checked', False)
+    monkeypatch.setattr(translation_service, 'TRANSLATION_SYSTEM_PROMPT', 'Traduce al español.')
+
+    with caplog.at_level(logging.INFO, logger='src.translation_service'):
+        TranslationService(api_key='test-key')
+        TranslationService(api_key='test-key')
+
+    avisos = [r for r in caplog.records if 'Prompt caching inactivo' in r.getMessage()]
+    assert len(avisos) == 1
+
+
+def test_registra_uso_del_prompt_cache():
+    """Los tokens de lectura/escritura del cache se acumulan por request"""
+    class _Usage:
+        def __init__(self, cache_read, cache_write):
+            self.input_tokens = 50
+            self.output_tokens = 400
+            self.cache_read_input_tokens = cache_read
+            self.cache_creation_input_tokens = cache_write
+
+    class _Messages:
+        def __init__(self):
+            self.usages = [_Usage(0, 1200), _Usage(1200, 0), _Usage(1200, 0)]
+
+        def create(self, **params):
+            response = _Response(RESPUESTA)
+            response.usage = self.usages.pop(0)
+            return response
+
+    service = _service(_Messages(), max_concurrency=1)
+    for _ in range(3):
+        service.translate_and_optimize('T', 'x', 'u')
+
+    stats = service.get_usage_stats()
+    assert stats['requests'] == 3
+    assert stats['cache_hits'] == 2
+    assert stats['cache_misses'] == 1
+    assert stats['cache_read_input_tokens'] == 2400
+    assert stats['cache_creation_input_tokens'] == 1200
+    assert stats['input_tokens'] == 150
+
+
+def test_cliente_de_anthropic_se_crea_en_el_primer_uso():
+    """Crear el servicio no importa anthropic ni construye el cliente"""
+    service = TranslationService(api_key='test-key')
+    assert service._client is None
+
+    client = service.client
+    assert client is service.client
+    assert type(client).__module__.startswith('anthropic')
@@ -0,0 +1,174 @@
+"""
+Tests para el long-poll de noticias procesadas (aviso a SocialPublisher)
+"""
+import pytest
+import threading
+import time
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '/app')
+
+from src.models import db, APublicar
+from src.social_media_processor import SocialMediaProcessor
+from src.work_notifier import WorkNotifier, notifier, wait_for_ready
+
+
+def _traduccion(titulo, texto, url, use_cache=True):
+    return {
+        'titulo_es': f'ES {titulo}', 'texto_es': 'texto', 'resumen_corto': 'c',
+        'resumen_medio': 'm', 'resumen_largo': 'l', 'hashtags': '#ia', 'categoria': 'IA'
+    }
+
+
+def _item(titulo='Noticia', fase='scrapeado', plataformas=None):
+    item = APublicar(titulo=titulo, texto='x', url=f'https://e.com/{titulo}',
+                     fecha_hora=datetime.utcnow(), fase=fase, plataformas_seleccionadas=plataformas)
+    db.session.add(item)
+    db.session.commit()
+    return item
+
+
+def test_notifier_despierta_solo_con_aviso_nuevo():
+    """wait() vuelve al instante si hubo notify() después de leer la generación"""
+    local = WorkNotifier()
+    generation = local.generation
+
+    assert local.wait(generation, 0.01) is False
+
+    local.notify()
+    assert local.wait(generation, 5) is True
+
+
+def test_process_item_pasa_a_procesado_y_avisa(app):
+    """Con plataformas elegidas, al terminar la traducción queda en fase 'procesado' y se notifica"""
+    item = _item(plataformas=['telegram'])
+    processor = SocialMediaProcessor(anthropic_api_key='test-key')
+    processor.translation_service.translate_and_optimize = _traduccion
+    generation = notifier.generation
+
+    assert processor.process_item(item.id) is True
+
+    assert db.session.get(APublicar, item.id).fase == 'procesado'
+    assert notifier.generation > generation
+
+
+def test_sin_seleccion_espera_a_publicar_seleccionadas(app):
+    """Sin plataformas elegidas no se publica sola, salvo con AUTO_PUBLISH_PROCESSED"""
+    item = _item('Sin seleccion')
+    processor = SocialMediaProcessor(anthropic_api_key='test-key')
+    processor.translation_service.translate_and_optimize = _traduccion
+
+    assert processor.process_item(item.id) is True
+    assert db.session.get(APublicar, item.id).fase == 'scrapeado'
+
+    app.config['AUTO_PUBLISH_PROCESSED'] = True
+    auto = _item('Auto')
+    processor = SocialMediaProcessor(anthropic_api_key='test-key')
+    processor.translation_service.translate_and_optimize = _traduccion
+
+    assert processor.process_item(auto.id) is True
+    assert db.session.get(APublicar, auto.id).fase == 'procesado'
+
+
+def test_reproceso_no_reabre_noticias_publicadas(app):
+    """Reprocesar algo ya publicado no lo vuelve a ofrecer al publisher"""
+    item = _item(fase='publicado_completo')
+    processor = SocialMediaProcessor(anthropic_api_key='test-key')
+    processor.translation_service.translate_and_optimize = _traduccion
+
+    assert processor.process_item(item.id) is True
+    assert db.session.get(APublicar, item.id).fase == 'publicado_completo'
+
+
+def test_wait_for_ready_sin_cursor_responde_al_instante(app):
+    """La primera llamada devuelve el estado actual y el cursor"""
+    processed_at = datetime(2026, 10, 18, 12, 0, 0)
+    item = _item()
+    item.fase, item.procesado, item.processed_at = 'procesado', True, processed_at
+    db.session.commit()
+
+    assert wait_for_ready(timeout=5) == {'ready': True, 'count': 1, 'cursor': processed_at.isoformat()}
+
+
+def test_wait_for_ready_sin_cursor_ni_noticias_espera(app):
+    """Sin nada procesado se espera el timeout y se devuelve un cursor usable"""
+    antes = datetime.utcnow()
+    inicio = time.monotonic()
+
+    result = wait_for_ready(timeout=0.2, check_interval=0.05)
+
+    assert time.monotonic() - inicio >= 0.2
+    assert result['ready'] is False
+    assert result['count'] == 0
+    assert datetime.fromisoformat(result['cursor']) >= antes
+
+    # Con ese cursor, una noticia procesada después despierta al publisher
+    item = _item()
+    item.fase, item.procesado, item.processed_at = 'procesado', True, datetime.utcnow()
+    db.session.commit()
+
+    assert wait_for_ready(since=datetime.fromisoformat(result['cursor']), timeout=5)['ready'] is True
+
+
+def test_wait_for_ready_espera_hasta_noticia_nueva(app):
+    """Con cursor, solo responde ready cuando aparece una noticia procesada posterior"""
+    cursor = datetime.utcnow() - timedelta(minutes=1)
+    viejo = _item('Vieja')
+    viejo.fase, viejo.procesado, viejo.processed_at = 'procesado', True, cursor
+    db.session.commit()
+
+    inicio = time.monotonic()
+    result = wait_for_ready(since=cursor, timeout=0.2, check_interval=0.05)
+    assert result == {'ready': False, 'count': 1, 'cursor': cursor.isoformat()}
+    assert time.monotonic() - inicio >= 0.2
+
+    nuevo = _item('Nueva', plataformas=['telegram'])
+    processor = SocialMediaProcessor(anthropic_api_key='test-key')
+    processor.translation_service.translate_and_optimize = _traduccion
+    processor.process_item(nuevo.id)
+
+    result = wait_for_ready(since=cursor, timeout=5)
+
+    assert result['ready'] is True
+    assert result['count'] == 2
+    assert datetime.fromisoformat(result['cursor']) > cursor
+
+
+def test_wait_for_ready_despierta_con_notify(app, monkeypatch):
+    """Un notify() desde otro thread corta la espera sin aguardar check_interval"""
+    cursor = datetime(2026, 10, 18, 12, 0, 0)
+    estado = {'snapshot': (0, None)}
+    monkeypatch.setattr('src.work_notifier.ready_snapshot', lambda: estado['snapshot'])
+
+    def procesar():
+        estado['snapshot'] = (1, cursor + timedelta(seconds=1))
+        notifier.notify()
+
+    timer = threading.Timer(0.1, procesar)
+    timer.start()
+    inicio = time.monotonic()
+
+    result = wait_for_ready(since=cursor, timeout=10, check_interval=10)
+    timer.join()
+
+    assert result['ready'] is True
+    assert time.monotonic() - inicio < 5
+
+
+@pytest.fixture
+def app():
+    """Crear aplicación de prueba"""
+    from flask import Flask
+    from config.settings import TestingConfig
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+
+    from src.models import init_db
+    init_db(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()